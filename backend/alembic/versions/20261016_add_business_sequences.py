@@ -0,0 +1,35 @@
+"""Add business_sequences counter table
+
+Revision ID: 20261016_business_sequences
+Revises: 20261016_requirement_search
+Create Date: 2026-10-16 14:00:00.000000
+
+Counter rows are created lazily on first allocation and seeded from the
+highest existing number, so no backfill is needed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016_business_sequences'
+down_revision: Union[str, None] = '20261016_requirement_search'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'business_sequences',
+        sa.Column('tenant_id', sa.Integer(), nullable=False),
+        sa.Column('prefix', sa.String(length=50), nullable=False),
+        sa.Column('period', sa.String(length=20), nullable=False, server_default=''),
+        sa.Column('last_value', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('tenant_id', 'prefix', 'period'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('business_sequences')
@@ -0,0 +1,29 @@
+"""Add parquet and arrow export types
+
+Revision ID: 20261016_columnar_export_types
+Revises: 20261016_export_job_progress
+Create Date: 2026-10-16 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016_columnar_export_types'
+down_revision: Union[str, None] = '20261016_export_job_progress'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        # ALTER TYPE ... ADD VALUE cannot run inside a transaction block before PostgreSQL 12
+        with op.get_context().autocommit_block():
+            op.execute("ALTER TYPE export_type ADD VALUE IF NOT EXISTS 'parquet'")
+            op.execute("ALTER TYPE export_type ADD VALUE IF NOT EXISTS 'arrow'")
+
+
+def downgrade() -> None:
+    # PostgreSQL cannot drop enum values; remove the exports using them instead
+    op.execute("DELETE FROM export_jobs WHERE export_type IN ('parquet', 'arrow')")
@@ -0,0 +1,33 @@
+"""Add progress and cache columns to export_jobs
+
+Revision ID: 20261016_export_job_progress
+Revises: 20261016_composite_indexes
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016_export_job_progress'
+down_revision: Union[str, None] = '20261016_composite_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('export_jobs', sa.Column('total_records', sa.Integer(), nullable=True))
+    op.add_column('export_jobs', sa.Column('processed_records', sa.Integer(), nullable=True))
+    op.add_column('export_jobs', sa.Column('error_message', sa.Text(), nullable=True))
+    op.add_column('export_jobs', sa.Column('cache_key', sa.String(length=64), nullable=True))
+    op.create_index('ix_export_jobs_cache_key', 'export_jobs', ['cache_key'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_export_jobs_cache_key', table_name='export_jobs')
+    op.drop_column('export_jobs', 'cache_key')
+    op.drop_column('export_jobs', 'error_message')
+    op.drop_column('export_jobs', 'processed_records')
+    op.drop_column('export_jobs', 'total_records')
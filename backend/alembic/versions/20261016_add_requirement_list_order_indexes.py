@@ -0,0 +1,48 @@
+"""Add indexes matching the requirement list order
+
+Revision ID: 20261016_requirement_list_order
+Revises: 20261016_columnar_export_types
+Create Date: 2026-10-16 23:00:00.000000
+
+The requirement list is not tenant-filtered and orders by
+"created_at DESC NULLS LAST, id DESC", which
+ix_requirements_tenant_status_created cannot serve. On PostgreSQL the
+indexes are built CONCURRENTLY (outside the migration transaction).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016_requirement_list_order'
+down_revision: Union[str, None] = '20261016_columnar_export_types'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, columns); created_at / id are descending on PostgreSQL
+INDEXES = [
+    ('ix_requirements_created_id', ['created_at', 'id']),
+    ('ix_requirements_status_created_id', ['status', 'created_at', 'id']),
+]
+POSTGRESQL_OPS = {'created_at': 'DESC NULLS LAST', 'id': 'DESC'}
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            for name, columns in INDEXES:
+                op.create_index(
+                    name, 'requirements', columns,
+                    postgresql_ops=POSTGRESQL_OPS,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+    else:
+        for name, columns in INDEXES:
+            op.create_index(name, 'requirements', columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name='requirements', if_exists=True)
@@ -0,0 +1,70 @@
+"""Add requirement search index (CJK bigram tokens, GIN / FTS5)
+
+Revision ID: 20261016_requirement_search
+Revises: 20260204_create_vote_results
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.requirement_search import (
+    POSTGRES_SEARCH_DDL,
+    SQLITE_SEARCH_DDL,
+    SQLITE_FTS_TABLE,
+    rebuild_search_index,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016_requirement_search'
+down_revision: Union[str, None] = '20260204_create_vote_results'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'requirement_search_index',
+        sa.Column('requirement_id', sa.Integer(), nullable=False),
+        sa.Column('tokens', sa.Text(), nullable=False, server_default=''),
+        sa.Column('tenant_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['requirement_id'], ['requirements.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('requirement_id'),
+    )
+    op.create_index(op.f('ix_requirement_search_index_tenant_id'), 'requirement_search_index', ['tenant_id'], unique=False)
+
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        for statement in POSTGRES_SEARCH_DDL:
+            op.execute(statement)
+        # Trigram indexes keep substring matches on number/title index-backed
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_requirements_requirement_no_trgm "
+            "ON requirements USING gin (requirement_no gin_trgm_ops)"
+        )
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_requirements_title_trgm "
+            "ON requirements USING gin (title gin_trgm_ops)"
+        )
+    elif bind.dialect.name == 'sqlite':
+        for statement in SQLITE_SEARCH_DDL:
+            op.execute(statement)
+
+    # Backfill existing requirements
+    rebuild_search_index(bind)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_requirements_title_trgm")
+        op.execute("DROP INDEX IF EXISTS ix_requirements_requirement_no_trgm")
+        op.execute("DROP INDEX IF EXISTS ix_requirement_search_index_tokens")
+    elif bind.dialect.name == 'sqlite':
+        op.execute(f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}")
+
+    op.drop_index(op.f('ix_requirement_search_index_tenant_id'), table_name='requirement_search_index')
+    op.drop_table('requirement_search_index')
@@ -0,0 +1,40 @@
+"""Add requirement_stats counters table
+
+Revision ID: 20261016_requirement_stats
+Revises: 20261016_business_sequences
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.requirement_stats import CHANNEL_COLUMNS, STATUS_COLUMNS, reconcile_requirement_stats
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016_requirement_stats'
+down_revision: Union[str, None] = '20261016_business_sequences'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    counter_columns = ['total', *STATUS_COLUMNS.values(), *CHANNEL_COLUMNS.values(), 'distributed_charter']
+    op.create_table(
+        'requirement_stats',
+        sa.Column('tenant_id', sa.Integer(), nullable=False),
+        *(
+            sa.Column(name, sa.Integer(), nullable=False, server_default='0')
+            for name in counter_columns
+        ),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('tenant_id'),
+    )
+
+    # Backfill counters from existing requirements
+    reconcile_requirement_stats(op.get_bind())
+
+
+def downgrade() -> None:
+    op.drop_table('requirement_stats')
@@ -0,0 +1,55 @@
+"""Add composite / partial indexes for tenant-scoped hot queries
+
+Revision ID: 20261016_composite_indexes
+Revises: 20261016_requirement_stats
+Create Date: 2026-10-16 18:00:00.000000
+
+On PostgreSQL the indexes are built CONCURRENTLY (outside the migration
+transaction) so large tables stay writable while they are created.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016_composite_indexes'
+down_revision: Union[str, None] = '20261016_requirement_stats'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns, partial index condition)
+INDEXES = [
+    ('ix_requirements_tenant_status_created', 'requirements', ['tenant_id', 'status', 'created_at'], None),
+    ('ix_notifications_user_read_created', 'notifications', ['user_id', 'is_read', 'created_at'], None),
+    ('ix_notifications_user_unread', 'notifications', ['user_id', 'created_at'], 'is_read = false'),
+    ('ix_workflow_history_entity_performed', 'workflow_history', ['entity_type', 'entity_id', 'performed_at'], None),
+    ('ix_attachments_entity_active', 'attachments', ['entity_type', 'entity_id', 'uploaded_at'], 'is_deleted = false'),
+    ('ix_traceability_links_tenant_requirement', 'traceability_links', ['tenant_id', 'requirement_id'], None),
+    ('ix_insight_analyses_tenant_created', 'insight_analyses', ['tenant_id', 'created_at'], None),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            for name, table, columns, where in INDEXES:
+                op.create_index(
+                    name, table, columns,
+                    postgresql_where=sa.text(where) if where else None,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+    else:
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name, table, columns,
+                sqlite_where=sa.text(where) if where else None,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    for name, table, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -1,9 +1,13 @@
 """APPEALS analysis API endpoints."""
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from sqlalchemy.orm import Session
 
+from app.api.deps import get_current_user_sync
 from app.db.session import get_db
+from app.models.user import User
 from app.services.appeals import AppealsService
 from app.schemas.appeals import (
     APPEALSAnalysisCreate,
@@ -14,6 +18,14 @@ from app.schemas.appeals import (
 router = APIRouter(prefix="/requirements/{requirement_id}/appeals", tags=["APPEALS"])
 
 
+def get_tenant_id(current_user: Optional[User]) -> int:
+    """获取租户 ID，如果用户未认证则使用默认值."""
+    if current_user is None:
+        # 未认证用户使用默认租户
+        return 1
+    return current_user.tenant_id
+
+
 @router.get("")
 async def get_appeals_analysis(
     requirement_id: int,
@@ -91,16 +103,17 @@ async def save_appeals_analysis(
 @router.get("/summary")
 async def get_appeals_summary(
     db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user_sync),
 ):
-    """Get APPEALS summary across all requirements.
+    """Get APPEALS summary across the tenant's requirements.
 
     Args:
         db: Database session
+        current_user: Authenticated user (selects the tenant)
 
     Returns:
         APPEALS summary statistics
     """
     service = AppealsService(db)
-    # Use tenant_id = 1 for now (should get from auth context)
-    summary = service.get_appeals_summary(tenant_id=1)
+    summary = service.get_appeals_summary(tenant_id=get_tenant_id(current_user))
     return summary
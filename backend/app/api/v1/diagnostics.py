@@ -0,0 +1,87 @@
+"""System diagnostics API endpoints (admin only)."""
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.api.deps import get_current_user
+from app.config import get_settings
+from app.core.permissions import has_permission
+from app.core.sql_profiler import clear_recent_profiles, get_recent_profiles
+from app.db.base import async_engine, async_pool_metrics, sync_engine, sync_pool_metrics
+from app.models.user import User
+
+router = APIRouter(prefix="/admin", tags=["diagnostics"])
+
+settings = get_settings()
+
+
+def require_diagnostics_permission(current_user: User = Depends(get_current_user)) -> User:
+    """Only users with the system:diagnostics permission (admins)."""
+    if current_user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+        )
+    if not has_permission(current_user.role, "system:diagnostics"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin permission required",
+        )
+    return current_user
+
+
+@router.get("/sql-profiles")
+async def get_sql_profiles(
+    limit: int = Query(50, ge=1, le=1000, description="返回的请求数"),
+    n_plus_one_only: bool = Query(False, description="只返回疑似 N+1 的请求"),
+    current_user: User = Depends(require_diagnostics_permission),
+):
+    """
+    Get SQL statistics of recent requests (newest first).
+
+    Each entry has the statement count, total DB time, the slowest statement
+    and statement shapes executed more than SQL_N_PLUS_ONE_THRESHOLD times.
+    """
+    return {
+        "success": True,
+        "data": {
+            "enabled": settings.SQL_PROFILING_ENABLED,
+            "n_plus_one_threshold": settings.SQL_N_PLUS_ONE_THRESHOLD,
+            "items": get_recent_profiles(limit=limit, n_plus_one_only=n_plus_one_only),
+        },
+    }
+
+
+@router.delete("/sql-profiles")
+async def clear_sql_profiles(
+    current_user: User = Depends(require_diagnostics_permission),
+):
+    """Clear the recent request profiles."""
+    clear_recent_profiles()
+    return {"success": True, "message": "SQL profiles cleared"}
+
+
+@router.get("/db-pool")
+async def get_db_pool_metrics(
+    current_user: User = Depends(require_diagnostics_permission),
+):
+    """
+    Get connection pool metrics of this worker process.
+
+    For the sync and async engine: live pool status (checked-out connections,
+    overflow), checkout count, timeouts, total/max wait and checkout latency
+    percentiles.
+    """
+    return {
+        "success": True,
+        "data": {
+            "settings": {
+                "pool_size": settings.DB_POOL_SIZE,
+                "max_overflow": settings.DB_MAX_OVERFLOW,
+                "pool_timeout": settings.DB_POOL_TIMEOUT,
+                "pool_recycle": settings.DB_POOL_RECYCLE,
+            },
+            "engines": [
+                sync_pool_metrics.snapshot(sync_engine.pool),
+                async_pool_metrics.snapshot(async_engine.pool),
+            ],
+        },
+    }
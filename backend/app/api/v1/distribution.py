@@ -1,71 +1,110 @@
 """Distribution API endpoints for generating target IDs."""
-from fastapi import APIRouter, Depends
+from typing import Optional
 
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
+
+from app.api.deps import get_current_user_sync
 from app.db.session import get_db
-from app.repositories.requirement import RequirementRepository
+from app.models.user import User
+from app.services.sequence import SequenceService, target_id_spec
 
 router = APIRouter(prefix="/distribution", tags=["Distribution"])
 
 
+class TargetIdReserveRequest(BaseModel):
+    """Reserve a block of target IDs for bulk distribution."""
+
+    target_type: str = Field(..., description="目标类型 (sp/bp/charter/pcr)")
+    count: int = Field(..., ge=1, le=1000, description="预留数量")
+
+
+def get_tenant_id(current_user: Optional[User]) -> int:
+    """获取租户 ID，如果用户未认证则使用默认值."""
+    if current_user is None:
+        # 未认证用户使用默认租户
+        return 1
+    return current_user.tenant_id
+
+
+def _reserve_target_ids(db: Session, target_type: str, count: int, tenant_id: int) -> list:
+    """Reserve target IDs from the tenant's counter and commit the reservation."""
+    try:
+        spec = target_id_spec(target_type)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    values = SequenceService(db).reserve_values(spec, count, tenant_id=tenant_id)
+    db.commit()
+    return [
+        {"numeric_id": value, "formatted_id": spec.format("", value)}
+        for value in values
+    ]
+
+
 @router.get("/next-target-id")
-async def get_next_target_id(
+def get_next_target_id(
     target_type: str,
     db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user_sync),
 ):
     """
-    Generate the next available target ID for a given target type.
+    Preview the next target ID for a given target type.
+
+    Nothing is reserved: the value is the tenant's counter + 1 and may be
+    taken by another distributor first. Reserve the ID actually used with
+    POST /distribution/target-ids.
 
     Args:
         target_type: Type of target (sp, bp, charter, pcr)
         db: Database session
 
     Returns:
-        Next available target ID in format PREFIX-NNN
+        Next target ID in format PREFIX-NNN
     """
-    repo = RequirementRepository(db)
-
-    # Get all requirements with the specified target_type
-    requirements, _ = repo.list(page=1, page_size=1000)
-
-    # Filter requirements by target_type and extract target_id
-    target_ids = []
-    for req in requirements:
-        if req.target_type == target_type and req.target_id:
-            target_ids.append(req.target_id)
-
-    # Find the maximum numeric ID
-    max_id = 0
-    for tid in target_ids:
-        if isinstance(tid, int):
-            max_id = max(max_id, tid)
-        elif isinstance(tid, str):
-            # Try to extract numeric part from string ID (e.g., "SP-001" -> 1)
-            import re
-            match = re.search(r'\d+', tid)
-            if match:
-                max_id = max(max_id, int(match.group()))
-
-    # Generate next ID
-    next_id = max_id + 1
-
-    # Format based on target type
-    prefix_map = {
-        "sp": "SP",
-        "bp": "BP",
-        "charter": "CHARTER",
-        "pcr": "PCR",
-    }
+    tenant_id = get_tenant_id(current_user)
+    try:
+        spec = target_id_spec(target_type)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    prefix = prefix_map.get(target_type, target_type.upper())
-    formatted_id = f"{prefix}-{next_id:03d}"
+    next_value = SequenceService(db).peek_value(spec, tenant_id=tenant_id)
 
     return {
         "success": True,
         "data": {
             "target_type": target_type,
-            "next_numeric_id": next_id,
-            "formatted_id": formatted_id,
-            "prefix": prefix,
+            "next_numeric_id": next_value,
+            "formatted_id": spec.format("", next_value),
+            "prefix": spec.prefix,
+        },
+    }
+
+
+@router.post("/target-ids")
+def reserve_target_ids(
+    payload: TargetIdReserveRequest,
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user_sync),
+):
+    """
+    Reserve a contiguous block of target IDs with one counter update.
+
+    Args:
+        payload: Target type and number of IDs
+
+    Returns:
+        Reserved IDs in ascending order
+    """
+    tenant_id = get_tenant_id(current_user)
+    reserved = _reserve_target_ids(db, payload.target_type, payload.count, tenant_id)
+
+    return {
+        "success": True,
+        "data": {
+            "target_type": payload.target_type,
+            "prefix": target_id_spec(payload.target_type).prefix,
+            "ids": reserved,
         },
     }
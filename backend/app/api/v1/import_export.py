@@ -1,7 +1,8 @@
 """Import/Export API endpoints."""
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, UploadFile, File
+from fastapi.responses import FileResponse
 from app.schemas.import_export import (
     ExcelImportRequest,
     ImportJobResponse,
@@ -9,12 +10,19 @@ from app.schemas.import_export import (
     ExportJobResponse,
     ImportResult,
 )
-from app.models.import_job import ImportJob, ImportStatus
+from app.models.import_job import ImportJob
 from app.models.export_job import ExportJob
 from app.repositories.base import BaseRepository
 from app.api.deps import get_db, get_current_user
 from app.core.tenant import get_current_tenant
-from sqlalchemy.orm import Session
+from app.services.requirement_export import (
+    EXPORT_EXTENSIONS,
+    EXPORT_MEDIA_TYPES,
+    normalize_filters,
+    submit_export_job,
+)
+from app.services.requirement_import import run_import_job, save_upload
+from sqlalchemy.ext.asyncio import AsyncSession
 import os
 
 router = APIRouter(prefix="/import-export", tags=["import-export"])
@@ -22,23 +30,33 @@ router = APIRouter(prefix="/import-export", tags=["import-export"])
 
 @router.post("/import/excel", response_model=ImportJobResponse)
 async def import_excel(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     skip_header: bool = Query(True, description="Skip header row"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    """Import requirements from Excel file."""
+    """Import requirements from Excel file.
+
+    The file is stored and an import job created; the rows are imported by
+    a background task. Poll GET /import/jobs/{job_id} for progress.
+    """
+    if current_user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+        )
+    if not (file.filename or "").lower().endswith(".xlsx"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only .xlsx files are supported",
+        )
+
     repo = BaseRepository(ImportJob, db)
     tenant_id = get_current_tenant() or current_user.tenant_id
 
-    # Save file to disk
-    upload_dir = "uploads"
-    os.makedirs(upload_dir, exist_ok=True)
-    file_path = f"{upload_dir}/{file.filename}"
-
-    with open(file_path, "wb") as f:
-        content = file.file.read()
-        f.write(content)
+    # Save file to disk (streamed in chunks)
+    file_path = await save_upload(file)
 
     # Create import job
     import_job = await repo.create(
@@ -47,16 +65,15 @@ async def import_excel(
         import_type="excel",
         file_name=file.filename,
         file_path=file_path,
-        status=ImportStatus.pending,
+        status="pending",
         total_records=0,
         success_count=0,
         failed_count=0,
         error_log={},
     )
+    await db.commit()
 
-    # TODO: Trigger async import task
-    # For now, mark as completed
-    await repo.update(import_job.id, status=ImportStatus.completed)
+    background_tasks.add_task(run_import_job, import_job.id, tenant_id, skip_header)
 
     return ImportJobResponse.model_validate(import_job)
 
@@ -65,7 +82,7 @@ async def import_excel(
 async def get_import_jobs(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """Get import jobs for current tenant."""
@@ -73,11 +90,10 @@ async def get_import_jobs(
     query = repo._get_query()
 
     # Filter by tenant
-    from app.models.import_job import ImportJob
     query = query.where(ImportJob.tenant_id == current_user.tenant_id)
 
-    query = query.offset(skip).limit(limit)
-    result = db.execute(query)
+    query = query.order_by(ImportJob.id.desc()).offset(skip).limit(limit)
+    result = await db.execute(query)
     jobs = list(result.scalars().all())
     return [ImportJobResponse.model_validate(j) for j in jobs]
 
@@ -85,10 +101,10 @@ async def get_import_jobs(
 @router.get("/import/jobs/{job_id}", response_model=ImportJobResponse)
 async def get_import_job(
     job_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    """Get a specific import job."""
+    """Get a specific import job (progress counters are updated per batch)."""
     repo = BaseRepository(ImportJob, db)
     job = await repo.get_by_id(job_id)
 
@@ -104,10 +120,25 @@ async def get_import_job(
 @router.post("/export")
 async def export_data(
     export_request: ExportRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    """Export requirements to Excel or PDF."""
+    """Export requirements to Excel, CSV or a plain-text summary ("pdf"), or an analytics dataset
+    (requirements, vote_results, workflow_history) to Parquet or Arrow.
+
+    The job is generated by a background worker; poll
+    GET /export/jobs/{job_id} for progress and download the file when its
+    status is completed. Identical exports of unchanged data reuse the
+    previous file.
+    """
+    try:
+        filters = dict(export_request.filters or {})
+        if export_request.dataset:
+            filters["dataset"] = export_request.dataset
+        filters = normalize_filters(filters)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     repo = BaseRepository(ExportJob, db)
     tenant_id = get_current_tenant() or (current_user.tenant_id if current_user else 1)
 
@@ -119,20 +150,17 @@ async def export_data(
         tenant_id=tenant_id,
         exported_by=exported_by_id,
         export_type=export_request.export_type,
-        filters=export_request.filters or {},
+        filters=filters,
         status="processing",
-        file_path="",
-        file_size=0,
-        download_url="",
+        processed_records=0,
     )
+    await db.commit()
 
-    # TODO: Trigger async export task
-    # For now, mark as completed with placeholder message
-    await repo.update(export_job.id, status="completed")
+    submit_export_job(export_job.id)
 
     return {
         "success": True,
-        "message": "导出功能开发中",
+        "message": "导出任务已创建",
         "data": ExportJobResponse.model_validate(export_job)
     }
 
@@ -141,7 +169,7 @@ async def export_data(
 async def get_export_jobs(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """Get export jobs for current tenant."""
@@ -149,22 +177,15 @@ async def get_export_jobs(
     query = repo._get_query()
 
     # Filter by tenant
-    from app.models.export_job import ExportJob as ExportJobModel
-    query = query.where(ExportJobModel.tenant_id == current_user.tenant_id)
+    query = query.where(ExportJob.tenant_id == current_user.tenant_id)
 
-    query = query.offset(skip).limit(limit)
-    result = db.execute(query)
+    query = query.order_by(ExportJob.id.desc()).offset(skip).limit(limit)
+    result = await db.execute(query)
     jobs = list(result.scalars().all())
     return [ExportJobResponse.model_validate(j) for j in jobs]
 
 
-@router.get("/export/jobs/{job_id}", response_model=ExportJobResponse)
-async def get_export_job(
-    job_id: int,
-    db: Session = Depends(get_db),
-    current_user=Depends(get_current_user),
-):
-    """Get a specific export job."""
+async def _get_tenant_export_job(db: AsyncSession, job_id: int, current_user) -> ExportJob:
     repo = BaseRepository(ExportJob, db)
     job = await repo.get_by_id(job_id)
 
@@ -173,35 +194,44 @@ async def get_export_job(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Export job not found",
         )
+    return job
+
 
+@router.get("/export/jobs/{job_id}", response_model=ExportJobResponse)
+async def get_export_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Get a specific export job (status and progress)."""
+    job = await _get_tenant_export_job(db, job_id, current_user)
     return ExportJobResponse.model_validate(job)
 
 
 @router.get("/export/jobs/{job_id}/download")
 async def download_export(
     job_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """Download an exported file."""
-    repo = BaseRepository(ExportJob, db)
-    job = await repo.get_by_id(job_id)
+    job = await _get_tenant_export_job(db, job_id, current_user)
 
-    if not job or job.tenant_id != current_user.tenant_id:
+    if job.status != "completed":
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Export job not found",
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Export job is {job.status}",
         )
 
-    if not job.file_path:
+    if not job.file_path or not os.path.exists(job.file_path):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Export file not available",
         )
 
-    # TODO: Return file content
-    return {
-        "success": True,
-        "download_url": job.download_url,
-        "message": "导出功能开发中"
-    }
+    extension = EXPORT_EXTENSIONS[job.export_type]
+    return FileResponse(
+        job.file_path,
+        media_type=EXPORT_MEDIA_TYPES[job.export_type],
+        filename=f"requirements_export_{job.id}.{extension}",
+    )
@@ -9,6 +9,7 @@ from app.db.session import get_async_db as get_db
 from app.models.user import User
 from app.api.deps import get_current_user
 from app.models.insight import InsightAnalysis, UserStoryboard
+from app.repositories.insight import insight_list_statement
 from app.schemas.insight import (
     InsightCreate,
     InsightResponse,
@@ -17,6 +18,7 @@ from app.schemas.insight import (
     InsightAnalysisResult,
 )
 from app.services.llm_service import llm_service
+from app.services.sequence import INSIGHT_NUMBER, AsyncSequenceService
 from app.prompts import get_prompt_template
 
 router = APIRouter(prefix="/insights", tags=["Insights"])
@@ -155,33 +157,9 @@ async def generate_insight_number(db: AsyncSession, tenant_id: int) -> str:
     生成洞察分析编号
 
     格式: Ai-insight-00001, Ai-insight-00002, ...
-    在同一租户下递增
+    insight_number 全局唯一，由业务编号计数器分配
     """
-    from sqlalchemy import select, func
-
-    # 获取当前租户下的所有洞察
-    stmt = select(InsightAnalysis.insight_number).where(
-        InsightAnalysis.tenant_id == tenant_id
-    )
-    result = await db.execute(stmt)
-    insights = result.all()
-
-    if insights:
-        # 提取所有编号中的数字部分，找出最大值
-        max_number = 0
-        for (insight_number,) in insights:
-            if insight_number and insight_number.startswith("Ai-insight-"):
-                try:
-                    number = int(insight_number.split("-")[-1])
-                    max_number = max(max_number, number)
-                except (ValueError, IndexError):
-                    continue
-        next_number = max_number + 1
-    else:
-        # 第一条记录
-        next_number = 1
-
-    return f"Ai-insight-{next_number:05d}"
+    return await AsyncSequenceService(db).next_number(INSIGHT_NUMBER, tenant_id=tenant_id)
 
 
 # ========================================================================
@@ -311,17 +289,7 @@ async def list_insights(
             detail="未认证，请先登录",
         )
 
-    from sqlalchemy import select
-
-    query = select(InsightAnalysis).where(
-        InsightAnalysis.tenant_id == current_user.tenant_id
-    )
-
-    if status_filter:
-        query = query.where(InsightAnalysis.status == status_filter)
-
-    query = query.order_by(InsightAnalysis.created_at.desc()).offset(skip).limit(limit)
-
+    query = insight_list_statement(current_user.tenant_id, skip, limit, status_filter)
     result = await db.execute(query)
     insights = result.scalars().all()
 
@@ -29,6 +29,7 @@ from app.schemas.requirement_review_meeting import (
     VoteData,
     VoteResponse,
     VoteStatisticsResponse,
+    MeetingVoteStatisticsResponse,
     MessageResponse,
     AssignedVotersUpdate,
     VoterStatusResponse,
@@ -592,17 +593,21 @@ async def cast_vote(
 
     tenant_id = get_tenant_id(current_user)
 
+    # 一次查询取得会议状态、参会人员、指定投票人和已投票情况
+    eligibility = service.get_vote_eligibility(
+        meeting_id, current_user.id, requirement_id, tenant_id=tenant_id
+    )
+
     # 按优先级检查权限，返回明确的错误消息
     # 1. 首先检查是否已投过票（最优先）
-    existing_vote = repo.get_user_vote(meeting_id, requirement_id, current_user.id)
-    if existing_vote:
+    if eligibility["has_voted"]:
         raise HTTPException(
             status_code=400,
             detail="您已经投过票了，不能修改投票选项"
         )
 
     # 2. 然后检查其他权限（会议状态、参会人员、指定投票人）
-    if not service.can_vote(meeting_id, current_user.id, requirement_id):
+    if not eligibility["can_vote"]:
         raise HTTPException(
             status_code=403,
             detail="您没有投票权限（非指定投票人员或会议未进行中）"
@@ -640,6 +645,27 @@ async def get_vote_statistics(
     )
 
 
+@router.get("/{meeting_id}/vote-statistics", response_model=MeetingVoteStatisticsResponse)
+async def get_meeting_vote_statistics(
+    meeting_id: int,
+    current_user: Optional[User] = Depends(get_current_user_sync),
+    service: RequirementReviewMeetingService = Depends(get_service),
+):
+    """
+    Get vote statistics for all requirements of a meeting.
+
+    Replaces one /requirements/{requirement_id}/votes call per requirement:
+    tallies and vote lists for the whole agenda come from two queries.
+    """
+    tenant_id = get_tenant_id(current_user)
+    stats = service.get_meeting_vote_statistics(meeting_id, tenant_id)
+
+    return MeetingVoteStatisticsResponse(
+        success=True,
+        data=stats
+    )
+
+
 @router.get("/{meeting_id}/requirements/{requirement_id}/my-vote", response_model=VoteResponse)
 async def get_my_vote(
     meeting_id: int,
@@ -1,16 +1,21 @@
 """Requirements API endpoints."""
+import tempfile
 from typing import Optional
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query
-from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
+from app.db.session import get_db as get_db_sync
 from app.models.user import User
-from app.api.deps import get_current_user_sync
+from app.api.deps import get_db, get_current_user, get_current_user_sync
 from app.services.requirement import RequirementService
+from app.utils.excel import iter_file_chunks
 from app.schemas.requirement import (
     RequirementCreate,
+    RequirementBulkCreate,
+    RequirementBulkCreateResponse,
     RequirementUpdate,
     RequirementResponse,
     RequirementListResponse,
@@ -32,7 +37,7 @@ from app.schemas.workflow_history import (
 router = APIRouter(prefix="/requirements", tags=["Requirements"])
 
 
-def get_requirement_service(db: Session = Depends(get_db)) -> RequirementService:
+def get_requirement_service(db: AsyncSession = Depends(get_db)) -> RequirementService:
     """Get requirement service instance."""
     return RequirementService(db)
 
@@ -56,10 +61,12 @@ async def list_requirements(
     status: Optional[str] = Query(None, description="Filter by status"),
     source_channel: Optional[str] = Query(None, description="Filter by source channel"),
     target_type: Optional[str] = Query(None, description="Filter by target type (sp/bp/charter/pcr)"),
-    search: Optional[str] = Query(None, description="Search in title and number"),
+    search: Optional[str] = Query(None, description="Full-text search in title, number and description"),
     sort_by: str = Query("created_at", description="Sort field"),
     sort_order: str = Query("desc", pattern="^(asc|desc)$", description="Sort order"),
     exclude_reviewed: bool = Query(False, description="Exclude requirements already in review meetings or with vote results"),
+    after: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor (keyset mode)"),
+    count_mode: str = Query("window", pattern="^(exact|window|estimate)$", description="How the total is computed"),
     service: RequirementService = Depends(get_requirement_service),
 ):
     """
@@ -70,22 +77,30 @@ async def list_requirements(
     - **status**: Filter by requirement status
     - **source_channel**: Filter by source channel
     - **target_type**: Filter by target type (sp/bp/charter/pcr)
-    - **search**: Search in title and requirement number
+    - **search**: Full-text search in title, requirement number and description
     - **sort_by**: Field to sort by
     - **sort_order**: Sort order (asc or desc)
     - **exclude_reviewed**: 排除已在评审会议或有投票结果的需求(用于"添加需求到会议"场景)
+    - **after**: 游标分页，传入上一页返回的 next_cursor 代替 page（深分页性能稳定）
+    - **count_mode**: 总数计算方式：exact（单独 COUNT）、window（与分页同一次查询，默认）、
+      estimate（无筛选条件时使用 PostgreSQL 规划器估算值，总数为近似值）
     """
-    requirements, total = service.list_requirements(
-        page=page,
-        page_size=page_size,
-        status=status,
-        source_channel=source_channel,
-        target_type=target_type,
-        search=search,
-        sort_by=sort_by,
-        sort_order=sort_order,
-        exclude_reviewed=exclude_reviewed,
-    )
+    try:
+        requirements, total = await service.list_requirements(
+            page=page,
+            page_size=page_size,
+            status=status,
+            source_channel=source_channel,
+            target_type=target_type,
+            search=search,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            exclude_reviewed=exclude_reviewed,
+            after=after,
+            count_mode=count_mode,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     total_pages = (total + page_size - 1) // page_size
 
@@ -99,6 +114,46 @@ async def list_requirements(
             page=page,
             page_size=page_size,
             total_pages=total_pages,
+            next_cursor=RequirementService.next_cursor(
+                requirements, page_size, sort_by, sort_order
+            ),
+        )
+    )
+
+
+@router.get("/search", response_model=RequirementListResponse)
+async def search_requirements(
+    q: str = Query(..., min_length=1, max_length=200, description="Search text"),
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    status: Optional[str] = Query(None, description="Filter by status"),
+    source_channel: Optional[str] = Query(None, description="Filter by source channel"),
+    target_type: Optional[str] = Query(None, description="Filter by target type (sp/bp/charter/pcr)"),
+    service: RequirementService = Depends(get_requirement_service),
+):
+    """
+    全文检索需求（标题、编号、描述），按相关度排序并返回高亮片段.
+
+    - **q**: 检索词（支持中文，按二元分词匹配）
+    - **page** / **page_size**: 分页
+    - **status** / **source_channel** / **target_type**: 额外筛选条件
+    """
+    hits, total = await service.search_requirements(
+        q,
+        page=page,
+        page_size=page_size,
+        status=status,
+        source_channel=source_channel,
+        target_type=target_type,
+    )
+
+    return RequirementListResponse(
+        data=PaginatedResponse(
+            items=hits,
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=(total + page_size - 1) // page_size,
         )
     )
 
@@ -119,7 +174,7 @@ async def create_requirement(
     - **estimated_duration_months**: Estimated duration in months (optional)
     - **complexity_level**: Complexity level (optional)
     """
-    requirement = service.create_requirement(data)
+    requirement = await service.create_requirement(data)
     requirement_data = RequirementResponse.model_validate(requirement)
 
     return RequirementDetailResponse(
@@ -129,12 +184,37 @@ async def create_requirement(
     )
 
 
+@router.post("/bulk", response_model=RequirementBulkCreateResponse)
+async def bulk_create_requirements(
+    data: RequirementBulkCreate,
+    service: RequirementService = Depends(get_requirement_service),
+    current_user: Optional[User] = Depends(get_current_user),
+):
+    """
+    Create many requirements in one transaction.
+
+    - **items**: Requirements (same fields as single create)
+
+    Invalid items are skipped and reported in the per-row results;
+    valid items are inserted with batched statements.
+    """
+    try:
+        result = await service.bulk_create_requirements(
+            data.items,
+            created_by=current_user.id if current_user else None,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return RequirementBulkCreateResponse(success=True, data=result)
+
+
 @router.get("/export")
 def export_requirements(
     status: Optional[str] = Query("distributed", description="需求状态筛选"),
     target_type: Optional[str] = Query("charter", description="目标类型筛选 (sp/bp/charter/pcr)"),
     search: Optional[str] = Query(None, description="搜索关键词"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db_sync),
     current_user: Optional[User] = Depends(get_current_user_sync),
 ):
     """
@@ -144,26 +224,35 @@ def export_requirements(
     - **target_type**: 目标类型（默认 charter）
     - **search**: 搜索关键词（可选）
 
-    返回Excel文件的二进制数据，可直接下载。
+    以流的形式返回Excel文件，可直接下载。
     """
     # 获取租户ID
     tenant_id = get_tenant_id(current_user)
 
-    # 生成Excel数据
-    excel_data = RequirementService.export_to_excel(
-        db=db,
-        tenant_id=tenant_id,
-        status=status,
-        target_type=target_type,
-        search=search
-    )
-
-    # 返回文件响应
-    return Response(
-        content=excel_data,
+    # 生成Excel到临时文件（关闭后自动删除）
+    output = tempfile.TemporaryFile()
+    try:
+        RequirementService.export_to_excel(
+            db=db,
+            tenant_id=tenant_id,
+            output=output,
+            status=status,
+            target_type=target_type,
+            search=search
+        )
+        size = output.tell()
+        output.seek(0)
+    except Exception:
+        output.close()
+        raise
+
+    # 分块返回文件
+    return StreamingResponse(
+        iter_file_chunks(output),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={
-            "Content-Disposition": 'attachment; filename="requirements_development.xlsx"'
+            "Content-Disposition": 'attachment; filename="requirements_development.xlsx"',
+            "Content-Length": str(size),
         }
     )
 
@@ -178,7 +267,7 @@ async def get_requirement(
 
     - **requirement_id**: Requirement ID
     """
-    requirement = service.get_requirement(requirement_id)
+    requirement = await service.get_requirement(requirement_id)
 
     if not requirement:
         raise HTTPException(status_code=404, detail="需求不存在")
@@ -202,7 +291,7 @@ async def update_requirement(
     - **requirement_id**: Requirement ID
     - All fields are optional
     """
-    requirement = service.update_requirement(requirement_id, data)
+    requirement = await service.update_requirement(requirement_id, data)
 
     if not requirement:
         raise HTTPException(status_code=404, detail="需求不存在")
@@ -225,7 +314,7 @@ async def delete_requirement(
 
     - **requirement_id**: Requirement ID
     """
-    success = service.delete_requirement(requirement_id)
+    success = await service.delete_requirement(requirement_id)
 
     if not success:
         raise HTTPException(status_code=404, detail="需求不存在")
@@ -244,7 +333,7 @@ async def delete_requirement(
 async def update_requirement_status(
     requirement_id: int,
     status: str = Body(..., embed=True),
-    current_user: Optional[User] = Depends(get_current_user_sync),
+    current_user: Optional[User] = Depends(get_current_user),
     service: RequirementService = Depends(get_requirement_service),
 ):
     """
@@ -254,7 +343,7 @@ async def update_requirement_status(
     - **status**: New status (collected, analyzing, analyzed, distributed, etc.)
     """
     user_id = current_user.id if current_user else None
-    requirement = service.update_status(requirement_id, status, user_id)
+    requirement = await service.update_status(requirement_id, status, user_id)
 
     if not requirement:
         raise HTTPException(status_code=404, detail="需求不存在")
@@ -273,14 +362,16 @@ async def update_requirement_status(
 
 @router.get("/stats/summary", response_model=RequirementStatsResponse)
 async def get_requirement_stats(
+    current_user: Optional[User] = Depends(get_current_user),
     service: RequirementService = Depends(get_requirement_service),
 ):
     """
     Get requirement statistics summary.
 
-    Returns total count, count by status, and count by source channel.
+    Returns total count, count by status, and count by source channel
+    for the current user's tenant.
     """
-    stats = service.get_statistics()
+    stats = await service.get_statistics(tenant_id=get_tenant_id(current_user))
     return RequirementStatsResponse(data=stats)
 
 
@@ -298,7 +389,7 @@ async def get_requirement_10q(
 
     - **requirement_id**: Requirement ID
     """
-    answer = service.get_10_questions(requirement_id)
+    answer = await service.get_10_questions(requirement_id)
 
     if not answer:
         raise HTTPException(status_code=404, detail="十问答案不存在")
@@ -317,7 +408,7 @@ async def get_requirement_10q(
 async def get_requirement_history(
     requirement_id: int,
     limit: int = Query(50, ge=1, le=100, description="返回条数"),
-    current_user: Optional[User] = Depends(get_current_user_sync),
+    current_user: Optional[User] = Depends(get_current_user),
     service: RequirementService = Depends(get_requirement_service),
 ):
     """
@@ -327,11 +418,11 @@ async def get_requirement_history(
     - **limit**: 返回记录数（默认50，最大100）
     """
     # 验证需求存在
-    requirement = service.get_requirement(requirement_id)
+    requirement = await service.get_requirement(requirement_id)
     if not requirement:
         raise HTTPException(status_code=404, detail="需求不存在")
 
-    history = service.get_history(requirement_id, limit)
+    history = await service.get_history(requirement_id, limit)
     history_data = [WorkflowHistoryResponse.model_validate(h) for h in history]
 
     return WorkflowHistoryListResponse(data=history_data)
@@ -341,7 +432,7 @@ async def get_requirement_history(
 async def add_requirement_history_note(
     requirement_id: int,
     data: WorkflowHistoryCreate,
-    current_user: Optional[User] = Depends(get_current_user_sync),
+    current_user: Optional[User] = Depends(get_current_user),
     service: RequirementService = Depends(get_requirement_service),
 ):
     """
@@ -353,12 +444,12 @@ async def add_requirement_history_note(
     - **metadata**: 额外元数据（可选）
     """
     # 验证需求存在
-    requirement = service.get_requirement(requirement_id)
+    requirement = await service.get_requirement(requirement_id)
     if not requirement:
         raise HTTPException(status_code=404, detail="需求不存在")
 
     user_id = current_user.id if current_user else None
-    service.add_history_note(
+    await service.add_history_note(
         requirement_id=requirement_id,
         comments=data.comments,
         action_reason=data.action_reason,
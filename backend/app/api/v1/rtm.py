@@ -1,23 +1,34 @@
 """RTM API routes."""
+import tempfile
 from typing import Optional
 from fastapi import APIRouter, Depends, Query, status, HTTPException
-from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
 from app.models.user import User
 from app.api.deps import get_current_user_sync
 from app.schemas.rtm import (
+    TraceabilityLinkBulkCreate,
     TraceabilityLinkCreate,
     TraceabilityLinkUpdate,
     TraceabilityLinkResponse,
     TraceabilityMatrixResponse,
 )
 from app.services.rtm import rtm_service
+from app.services.rtm_graph import make_node, traceability_graph_index
+from app.utils.excel import iter_file_chunks
 
 
 router = APIRouter(prefix="/rtm", tags=["需求追溯矩阵"])
 
+# format -> (media type, file name); PDFGenerator only writes a plain-text
+# placeholder, so the "pdf" export is served as text
+EXPORT_FORMATS = {
+    "excel": ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "traceability_matrix.xlsx"),
+    "pdf": ("text/plain; charset=utf-8", "traceability_matrix.txt"),
+}
+
 
 def get_tenant_id(current_user: Optional[User]) -> int:
     """获取租户 ID，如果用户未认证则使用默认值."""
@@ -29,6 +40,13 @@ def get_tenant_id(current_user: Optional[User]) -> int:
 
 @router.get("/matrix")
 def get_traceability_matrix(
+    requirement_status: Optional[str] = Query(None, alias="status", description="需求状态"),
+    coverage: Optional[str] = Query(
+        None, pattern="^(complete|partial|missing)$", description="覆盖度（完整/部分/缺失）"
+    ),
+    include_description: bool = Query(False, description="是否返回需求描述"),
+    page: int = Query(1, ge=1, description="页码"),
+    page_size: Optional[int] = Query(None, ge=1, le=500, description="每页数量，不传返回全部"),
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_sync),
 ):
@@ -37,9 +55,20 @@ def get_traceability_matrix(
     matrix = rtm_service.get_traceability_matrix(
         db=db,
         tenant_id=tenant_id,
+        status=requirement_status,
+        coverage=coverage,
+        include_description=include_description,
+        page=page,
+        page_size=page_size,
     )
+    if page_size is None:
+        total = len(matrix)
+    else:
+        total = rtm_service.count_traceability_matrix(
+            db, tenant_id, status=requirement_status, coverage=coverage
+        )
 
-    return {"data": matrix}
+    return {"data": matrix, "total": total, "page": page, "page_size": page_size}
 
 
 @router.get("/requirements/{requirement_id}")
@@ -81,6 +110,31 @@ def create_link(
     return TraceabilityLinkResponse.model_validate(link)
 
 
+@router.post("/links/bulk", status_code=status.HTTP_201_CREATED)
+def bulk_create_links(
+    payload: TraceabilityLinkBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user_sync),
+):
+    """批量创建追溯关联（全部校验通过才创建）."""
+    if current_user is None:
+        raise HTTPException(status_code=401, detail="需要登录")
+
+    try:
+        links = rtm_service.bulk_create_links(
+            db=db,
+            links=payload.items,
+            tenant_id=current_user.tenant_id,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "data": [TraceabilityLinkResponse.model_validate(link) for link in links],
+        "total": len(links),
+    }
+
+
 @router.put("/links/{link_id}")
 def update_link(
     link_id: int,
@@ -129,30 +183,35 @@ def delete_link(
 
 @router.get("/export")
 def export_matrix(
-    format: str = Query("excel", regex="^(excel|pdf)$", description="导出格式"),
+    format: str = Query("excel", pattern="^(excel|pdf)$", description="导出格式"),
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_sync),
 ):
     """导出需求追溯矩阵."""
     tenant_id = get_tenant_id(current_user)
 
-    if format == "excel":
-        # 导出为 Excel
-        excel_data = rtm_service.export_to_excel(db, tenant_id)
+    # 生成到临时文件（关闭后自动删除），再分块返回
+    output = tempfile.TemporaryFile()
+    try:
+        if format == "excel":
+            rtm_service.export_to_excel(db, tenant_id, output)
+        else:
+            rtm_service.export_to_pdf(db, tenant_id, output)
+        size = output.tell()
+        output.seek(0)
+    except Exception:
+        output.close()
+        raise
 
-        return Response(
-            content=excel_data,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={
-                "Content-Disposition": 'attachment; filename="traceability_matrix.xlsx"'
-            }
-        )
-    else:
-        # PDF 导出暂未实现
-        raise HTTPException(
-            status_code=status.HTTP_501_NOT_IMPLEMENTED,
-            detail="PDF 导出功能尚未实现"
-        )
+    media_type, file_name = EXPORT_FORMATS[format]
+    return StreamingResponse(
+        iter_file_chunks(output),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{file_name}"',
+            "Content-Length": str(size),
+        }
+    )
 
 
 @router.get("/statistics")
@@ -164,3 +223,44 @@ def get_rtm_statistics(
     tenant_id = get_tenant_id(current_user)
     stats = rtm_service.get_statistics(db, tenant_id)
     return {"data": stats}
+
+
+@router.get("/graph/neighbours")
+def get_graph_neighbours(
+    kind: str = Query(..., description="节点类型: requirement / design / code / test / attachment"),
+    node_id: str = Query(..., alias="id", description="需求ID、文档ID或附件ID"),
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user_sync),
+):
+    """直接关联的节点：需求的设计/代码/测试项，或引用某个追溯项的需求（反向查询）."""
+    tenant_id = get_tenant_id(current_user)
+    try:
+        node = make_node(kind, node_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {"data": traceability_graph_index.lookup(db, tenant_id, node)}
+
+
+@router.get("/graph/impact")
+def get_graph_impact(
+    kind: str = Query(..., description="节点类型: requirement / design / code / test / attachment"),
+    node_id: str = Query(..., alias="id", description="需求ID、文档ID或附件ID"),
+    max_depth: Optional[int] = Query(None, ge=1, le=50, description="最大跳数，不传不限制"),
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user_sync),
+):
+    """影响分析：某个需求或追溯项变更后，沿追溯关联可传递到达的需求和追溯项."""
+    tenant_id = get_tenant_id(current_user)
+    try:
+        node = make_node(kind, node_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    impacted = traceability_graph_index.impact(db, tenant_id, node, max_depth)
+    return {
+        "data": {
+            "items": impacted,
+            "requirement_ids": [item["id"] for item in impacted if item["kind"] == "requirement"],
+        }
+    }
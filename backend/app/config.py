@@ -23,6 +23,19 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./ipd_req.db"
+    DB_ECHO: bool = False  # log every SQL statement (independent of DEBUG)
+    DB_POOL_SIZE: int = 10  # persistent connections per engine and worker process
+    DB_MAX_OVERFLOW: int = 20  # extra connections allowed under burst load
+    DB_POOL_TIMEOUT: float = 30  # seconds to wait for a connection before QueuePool timeout
+    DB_POOL_RECYCLE: int = 1800  # seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 500  # asyncpg prepared statement cache per connection
+    DB_QUERY_CACHE_SIZE: int = 500  # SQLAlchemy compiled statement cache per engine
+
+    # SQL profiling (per-request statement stats, Server-Timing header)
+    SQL_PROFILING_ENABLED: bool = True
+    SQL_PROFILE_BUFFER_SIZE: int = 200  # recent requests kept for /admin/sql-profiles
+    SQL_N_PLUS_ONE_THRESHOLD: int = 10  # same statement shape more often than this = N+1
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
@@ -49,6 +62,19 @@ class Settings(BaseSettings):
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10MB
     UPLOAD_DIR: str = "uploads"
 
+    # Export jobs
+    EXPORT_WORKERS: int = 2  # background threads generating export files
+
+    # RTM traceability graph index (in-memory, per worker process)
+    RTM_GRAPH_MAX_TENANTS: int = 100  # tenant graphs kept (least recently used evicted)
+    RTM_GRAPH_REVALIDATE_SECONDS: float = 5  # how often a cached graph is checked against the database
+
+    # APPEALS summary cache (cleared on APPEALS save; TTL bounds staleness across worker processes)
+    APPEALS_SUMMARY_CACHE_TTL: int = 60
+
+    # Review meeting attendee cache for vote checks (cleared on attendee add/remove; TTL bounds staleness across worker processes)
+    MEETING_ATTENDEE_CACHE_TTL: int = 30
+
     # ========== DeepSeek API 配置 ==========
     DEEPSEEK_API_KEY: str
     DEEPSEEK_BASE_URL: str = "https://api.deepseek.com/v1"
@@ -36,6 +36,8 @@ PERMISSIONS = {
     "collection:update": "Update collection data",
     # Tenant (admin only)
     "tenant:manage": "Manage tenants",
+    # System diagnostics (admin only)
+    "system:diagnostics": "View system diagnostics",
 }
 
 
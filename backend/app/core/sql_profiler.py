@@ -0,0 +1,235 @@
+"""Per-request SQL instrumentation.
+
+SQLAlchemy cursor events on the application engines (registered in
+app.db.base) record every statement executed while a request is being
+handled: statement count, total DB time and the slowest statement. The
+middleware exposes them as a Server-Timing response header and keeps the
+most recent request profiles in an in-process ring buffer (served by the
+admin diagnostics endpoint).
+
+A request that runs the same statement shape (SQL with literals and bind
+parameters normalized) more than SQL_N_PLUS_ONE_THRESHOLD times is flagged as
+an N+1 query pattern and logged.
+"""
+import logging
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Longest statement text kept in a profile
+MAX_STATEMENT_LENGTH = 1000
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAM_RE = re.compile(r"%\(\w+\)s|\$\d+|(?<![:\w]):\w+|\?")
+_PARAM_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a SQL statement so repeated executions compare equal.
+
+    Literals and bind parameters of every DBAPI style become "?", and
+    expanded IN lists collapse to "(?)".
+
+    Args:
+        statement: SQL statement text
+
+    Returns:
+        Normalized statement
+    """
+    shape = _STRING_LITERAL_RE.sub("?", statement)
+    shape = _PARAM_RE.sub("?", shape)
+    shape = _NUMBER_RE.sub("?", shape)
+    shape = _PARAM_LIST_RE.sub("(?)", shape)
+    return _WHITESPACE_RE.sub(" ", shape).strip()
+
+
+@dataclass
+class RequestProfile:
+    """SQL statistics of one request."""
+
+    method: str
+    path: str
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    status_code: Optional[int] = None
+    duration_ms: float = 0.0
+    statement_count: int = 0
+    db_time_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest_statement: Optional[str] = None
+    shapes: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        """Record one executed statement."""
+        self.statement_count += 1
+        self.db_time_ms += elapsed_ms
+        self.shapes[statement_shape(statement)] += 1
+        if elapsed_ms >= self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_statement = statement[:MAX_STATEMENT_LENGTH]
+
+    def n_plus_one(self, threshold: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Statement shapes executed more than threshold times."""
+        if threshold is None:
+            threshold = settings.SQL_N_PLUS_ONE_THRESHOLD
+        return [
+            {"statement": shape[:MAX_STATEMENT_LENGTH], "count": count}
+            for shape, count in self.shapes.most_common()
+            if count > threshold
+        ]
+
+    def server_timing(self) -> str:
+        """Server-Timing header value."""
+        metrics = [
+            f'db;dur={self.db_time_ms:.2f};desc="{self.statement_count} queries"',
+            f"db-slowest;dur={self.slowest_ms:.2f}",
+        ]
+        suspects = self.n_plus_one()
+        if suspects:
+            metrics.append(f'db-n-plus-one;desc="{len(suspects)} repeated statements"')
+        return ", ".join(metrics)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "method": self.method,
+            "path": self.path,
+            "started_at": self.started_at.isoformat(),
+            "status_code": self.status_code,
+            "duration_ms": round(self.duration_ms, 2),
+            "statement_count": self.statement_count,
+            "db_time_ms": round(self.db_time_ms, 2),
+            "slowest_ms": round(self.slowest_ms, 2),
+            "slowest_statement": self.slowest_statement,
+            "n_plus_one": self.n_plus_one(),
+        }
+
+
+# Profile of the request being handled (None outside profiled requests)
+_current_profile: ContextVar[Optional[RequestProfile]] = ContextVar("sql_request_profile", default=None)
+
+# Most recent request profiles (dicts), newest last
+_recent_profiles: Deque[Dict[str, Any]] = deque(maxlen=settings.SQL_PROFILE_BUFFER_SIZE)
+_recent_lock = threading.Lock()
+
+
+def get_current_profile() -> Optional[RequestProfile]:
+    """Get the SQL profile of the current request."""
+    return _current_profile.get()
+
+
+@contextmanager
+def profile_request(method: str, path: str) -> Iterator[RequestProfile]:
+    """Record statements executed inside the block into a new RequestProfile."""
+    profile = RequestProfile(method=method, path=path)
+    token = _current_profile.set(profile)
+    start = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.duration_ms = (time.perf_counter() - start) * 1000
+        _current_profile.reset(token)
+
+
+def store_profile(profile: RequestProfile) -> None:
+    """Add a finished profile to the ring buffer and log N+1 suspects."""
+    data = profile.to_dict()
+    for suspect in data["n_plus_one"]:
+        logger.warning(
+            "Possible N+1 query in %s %s: statement executed %d times: %s",
+            profile.method, profile.path, suspect["count"], suspect["statement"][:200],
+        )
+    with _recent_lock:
+        _recent_profiles.append(data)
+
+
+def get_recent_profiles(limit: Optional[int] = None, n_plus_one_only: bool = False) -> List[Dict[str, Any]]:
+    """
+    Get recent request profiles, newest first.
+
+    Args:
+        limit: Maximum number of profiles
+        n_plus_one_only: Only return requests flagged as N+1
+
+    Returns:
+        List of profile dicts
+    """
+    with _recent_lock:
+        profiles = list(reversed(_recent_profiles))
+    if n_plus_one_only:
+        profiles = [p for p in profiles if p["n_plus_one"]]
+    return profiles[:limit] if limit else profiles
+
+
+def clear_recent_profiles() -> None:
+    """Empty the ring buffer."""
+    with _recent_lock:
+        _recent_profiles.clear()
+
+
+# ============================================================================
+# Engine hooks
+# ============================================================================
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _current_profile.get() is not None:
+        context._sql_profile_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile.get()
+    start = getattr(context, "_sql_profile_start", None)
+    if profile is None or start is None:
+        return
+    profile.record(statement, (time.perf_counter() - start) * 1000)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Attach the profiling hooks to an engine.
+
+    For an AsyncEngine pass async_engine.sync_engine.
+
+    Args:
+        engine: Sync SQLAlchemy engine
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# ============================================================================
+# Middleware
+# ============================================================================
+
+async def sql_profiling_middleware(request: Request, call_next):
+    """Middleware recording the SQL executed by each request.
+
+    Adds a Server-Timing header (db time / statement count, slowest
+    statement, N+1 flag) and stores the profile in the ring buffer.
+    """
+    if not settings.SQL_PROFILING_ENABLED:
+        return await call_next(request)
+
+    with profile_request(request.method, request.url.path) as profile:
+        response = await call_next(request)
+
+    profile.status_code = response.status_code
+    response.headers.append("Server-Timing", profile.server_timing())
+    store_profile(profile)
+    return response
@@ -4,12 +4,11 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from app.config import get_settings
+from app.core.sql_profiler import instrument_engine
+from app.db.pool_metrics import PoolMetrics, engine_options
 
 settings = get_settings()
 
-# Support both PostgreSQL and SQLite
-connect_args = {"check_same_thread": False} if settings.DATABASE_URL.startswith("sqlite") else {}
-
 # Synchronous engine (for Alembic migrations)
 # Remove async driver prefix for sync engine
 sync_url = settings.DATABASE_URL
@@ -18,11 +17,14 @@ if "+asyncpg" in sync_url:
 elif "+aiosqlite" in sync_url:
     sync_url = sync_url.replace("+aiosqlite", "").replace("sqlite://", "sqlite+pysqlite://")
 
+# Pool sizing / echo come from Settings (DB_*); checkouts are timed into the
+# metrics served by /api/v1/admin/db-pool
+sync_pool_metrics = PoolMetrics("sync")
+async_pool_metrics = PoolMetrics("async")
+
 sync_engine = create_engine(
     sync_url,
-    pool_pre_ping=True,
-    echo=settings.DEBUG,
-    connect_args=connect_args,
+    **engine_options(sync_url, settings, sync_pool_metrics),
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
@@ -30,9 +32,13 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
 # Asynchronous engine (for API)
 async_engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,
+    **engine_options(settings.DATABASE_URL, settings, async_pool_metrics),
 )
 
+# Per-request SQL statistics (see app.core.sql_profiler)
+instrument_engine(sync_engine)
+instrument_engine(async_engine.sync_engine)
+
 AsyncSessionLocal = async_sessionmaker(
     async_engine,
     class_=AsyncSession,
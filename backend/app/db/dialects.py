@@ -0,0 +1,58 @@
+"""Dialect specific statement helpers (PostgreSQL / SQLite)."""
+from sqlalchemy import case, exists, func, insert, literal_column, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+_INSERTS = {
+    "postgresql": pg_insert,
+    "sqlite": sqlite_insert,
+}
+
+
+def dialect_insert(dialect_name: str, table):
+    """INSERT construct supporting ON CONFLICT for the given dialect.
+
+    PostgreSQL and SQLite inserts provide on_conflict_do_nothing() and
+    on_conflict_do_update(); other dialects get a plain insert.
+
+    Args:
+        dialect_name: Bind dialect name (connection.dialect.name)
+        table: Table or mapped class
+
+    Returns:
+        Insert construct
+    """
+    return _INSERTS.get(dialect_name, insert)(table)
+
+
+def supports_on_conflict(dialect_name: str) -> bool:
+    """Whether dialect_insert() returns an ON CONFLICT capable insert."""
+    return dialect_name in _INSERTS
+
+
+def insert_ignore(dialect_name: str, table, values: dict):
+    """INSERT ... ON CONFLICT DO NOTHING (plain insert on other dialects)."""
+    stmt = dialect_insert(dialect_name, table).values(**values)
+    if supports_on_conflict(dialect_name):
+        stmt = stmt.on_conflict_do_nothing()
+    return stmt
+
+
+def json_array_length(dialect_name: str, column):
+    """Length of a JSON array column; 0 for NULL, JSON null and non-arrays."""
+    if dialect_name == "postgresql":
+        # jsonb_array_length() raises on scalars, so check the type first
+        return case(
+            (func.jsonb_typeof(column) == "array", func.jsonb_array_length(column)),
+            else_=0,
+        )
+    return func.coalesce(func.json_array_length(column), 0)
+
+
+def json_array_contains(dialect_name: str, column, value):
+    """Whether a JSON array column contains a scalar value (e.g. a user ID)."""
+    if dialect_name == "postgresql":
+        # A jsonb array contains a primitive: '[1, 2]'::jsonb @> '1'::jsonb
+        return column.bool_op("@>")(func.to_jsonb(value))
+    elements = func.json_each(column).table_valued("value")
+    return exists(select(literal_column("1")).select_from(elements).where(elements.c.value == value))
@@ -0,0 +1,128 @@
+"""Check that hot repository queries are served by their composite indexes.
+
+Each check EXPLAINs the statement built by the repository / service code
+itself on PostgreSQL and reports the indexes used by the plan, so a change
+to a query's filters or ORDER BY shows up here. Sequential scans are
+disabled for the check so that small (development / CI) tables still show
+which index the planner would pick.
+
+Run with scripts/check_query_indexes.py against a migrated database.
+"""
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Sequence
+
+from sqlalchemy import text
+
+from app.repositories.attachment import entity_attachments_statement
+from app.repositories.insight import insight_list_statement
+from app.repositories.notification import unread_count_statement, user_notifications_statement
+from app.repositories.requirement import _list_conditions, _list_statements
+from app.repositories.workflow_history import entity_history_statement
+from app.services.rtm import requirement_links_statement
+
+
+@dataclass(frozen=True)
+class IndexCheck:
+    """A query and the indexes allowed to serve it."""
+
+    name: str
+    statement: Callable[[], Any]
+    indexes: Sequence[str]
+
+
+def _requirement_list(**filters) -> Any:
+    """First page of the requirement list with the default sort."""
+    conditions = _list_conditions(dialect_name="postgresql", **filters)
+    stmt, _ = _list_statements(1, 20, conditions, "created_at", "desc")
+    return stmt
+
+
+INDEX_CHECKS: List[IndexCheck] = [
+    IndexCheck(
+        "requirement list",
+        lambda: _requirement_list(),
+        ["ix_requirements_created_id"],
+    ),
+    IndexCheck(
+        "requirement list by status",
+        lambda: _requirement_list(status="collected"),
+        ["ix_requirements_status_created_id"],
+    ),
+    IndexCheck(
+        "unread notifications",
+        lambda: user_notifications_statement(1, unread_only=True),
+        ["ix_notifications_user_unread", "ix_notifications_user_read_created"],
+    ),
+    IndexCheck(
+        "unread notification count",
+        lambda: unread_count_statement(1),
+        ["ix_notifications_user_unread", "ix_notifications_user_read_created"],
+    ),
+    IndexCheck(
+        "workflow history of entity",
+        lambda: entity_history_statement("requirement", 1),
+        ["ix_workflow_history_entity_performed"],
+    ),
+    IndexCheck(
+        "attachments of entity",
+        lambda: entity_attachments_statement("requirement", 1),
+        ["ix_attachments_entity_active"],
+    ),
+    IndexCheck(
+        "traceability links of requirement",
+        lambda: requirement_links_statement(1, 1),
+        ["ix_traceability_links_tenant_requirement"],
+    ),
+    IndexCheck(
+        "insight list",
+        lambda: insight_list_statement(1),
+        ["ix_insight_analyses_tenant_created"],
+    ),
+]
+
+
+def _plan_indexes(plan: Any) -> Iterator[str]:
+    """All "Index Name" values of an EXPLAIN (FORMAT JSON) plan."""
+    if isinstance(plan, dict):
+        if "Index Name" in plan:
+            yield plan["Index Name"]
+        for value in plan.values():
+            yield from _plan_indexes(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            yield from _plan_indexes(item)
+
+
+def check_query_indexes(connection) -> List[Dict[str, Any]]:
+    """
+    EXPLAIN every check query and compare the used indexes.
+
+    Args:
+        connection: Sync connection (not in a transaction) to a migrated
+            PostgreSQL database
+
+    Returns:
+        One result dict per check (name, expected, used, ok)
+
+    Raises:
+        ValueError: If the connection is not PostgreSQL
+    """
+    if connection.dialect.name != "postgresql":
+        raise ValueError("Index usage checks require PostgreSQL")
+
+    results = []
+    with connection.begin():
+        connection.execute(text("SET LOCAL enable_seqscan = off"))
+        for check in INDEX_CHECKS:
+            compiled = check.statement().compile(
+                dialect=connection.dialect, compile_kwargs={"literal_binds": True}
+            )
+            plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}").scalar()
+            used = sorted(set(_plan_indexes(plan)))
+            results.append({
+                "name": check.name,
+                "expected": list(check.indexes),
+                "used": used,
+                "ok": any(index in used for index in check.indexes),
+            })
+    return results
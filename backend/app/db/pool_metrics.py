@@ -0,0 +1,174 @@
+"""Connection pool configuration and metrics.
+
+Engines created in app.db.base use a pool subclass that times every
+checkout (Pool.connect), so pools can be sized from observed data: checkout
+latency percentiles, total time spent waiting for connections and the number
+of "QueuePool limit ... timed out" errors, next to the live pool status
+(checked-out connections, overflow).
+"""
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Type
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import Pool, QueuePool
+
+from app.config import Settings
+
+# Checkout latencies kept for percentiles (per engine)
+LATENCY_SAMPLE_SIZE = 2000
+
+
+class PoolMetrics:
+    """Checkout statistics of one engine's pool."""
+
+    def __init__(self, name: str, sample_size: int = LATENCY_SAMPLE_SIZE):
+        self.name = name
+        self._lock = threading.Lock()
+        self._latencies: Deque[float] = deque(maxlen=sample_size)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    def observe(self, elapsed_ms: float) -> None:
+        """Record a successful checkout."""
+        with self._lock:
+            self._latencies.append(elapsed_ms)
+            self.checkouts += 1
+            self.total_wait_ms += elapsed_ms
+            self.max_wait_ms = max(self.max_wait_ms, elapsed_ms)
+
+    def observe_timeout(self, elapsed_ms: float) -> None:
+        """Record a checkout that hit pool_timeout."""
+        with self._lock:
+            self.timeouts += 1
+            self.total_wait_ms += elapsed_ms
+            self.max_wait_ms = max(self.max_wait_ms, elapsed_ms)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._latencies.clear()
+            self.checkouts = 0
+            self.timeouts = 0
+            self.total_wait_ms = 0.0
+            self.max_wait_ms = 0.0
+
+    def snapshot(self, pool: Optional[Pool] = None) -> Dict[str, Any]:
+        """
+        Current metrics, optionally with the live status of a pool.
+
+        Args:
+            pool: Pool of the engine (engine.pool)
+
+        Returns:
+            Metrics dict
+        """
+        with self._lock:
+            samples = sorted(self._latencies)
+            data: Dict[str, Any] = {
+                "name": self.name,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "total_wait_ms": round(self.total_wait_ms, 2),
+                "max_wait_ms": round(self.max_wait_ms, 2),
+            }
+
+        data["checkout_latency_ms"] = {
+            "samples": len(samples),
+            "p50": _percentile(samples, 0.50),
+            "p95": _percentile(samples, 0.95),
+            "p99": _percentile(samples, 0.99),
+        }
+        if pool is not None:
+            data["pool"] = pool_status(pool)
+        return data
+
+
+def _percentile(samples: list, quantile: float) -> Optional[float]:
+    if not samples:
+        return None
+    index = min(len(samples) - 1, int(round(quantile * (len(samples) - 1))))
+    return round(samples[index], 3)
+
+
+def pool_status(pool: Pool) -> Dict[str, Any]:
+    """Live status of a pool (sizes are only reported for queue pools)."""
+    status: Dict[str, Any] = {"class": type(pool).__name__, "status": pool.status()}
+    if isinstance(pool, QueuePool):
+        status.update({
+            "size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+        })
+    return status
+
+
+def timed_pool_class(pool_class: Type[Pool], metrics: PoolMetrics) -> Type[Pool]:
+    """
+    Subclass pool_class so that every checkout is timed into metrics.
+
+    Args:
+        pool_class: Pool class the dialect would use
+        metrics: Metrics receiving checkout latencies
+
+    Returns:
+        Pool subclass
+    """
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = pool_class.connect(self)
+        except PoolTimeoutError:
+            metrics.observe_timeout((time.perf_counter() - start) * 1000)
+            raise
+        metrics.observe((time.perf_counter() - start) * 1000)
+        return connection
+
+    return type(f"Timed{pool_class.__name__}", (pool_class,), {"connect": connect})
+
+
+def engine_options(url: str, settings: Settings, metrics: PoolMetrics) -> Dict[str, Any]:
+    """
+    create_engine / create_async_engine keyword arguments from Settings.
+
+    Pool sizing only applies to queue pools; in-memory SQLite keeps its
+    single-connection pool. DB_STATEMENT_CACHE_SIZE sets asyncpg's
+    prepared statement cache, DB_QUERY_CACHE_SIZE SQLAlchemy's compiled
+    statement cache.
+
+    Args:
+        url: Database URL of the engine
+        settings: Application settings
+        metrics: Metrics the engine's pool reports to
+
+    Returns:
+        Engine keyword arguments
+    """
+    parsed = make_url(url)
+    pool_class = parsed.get_dialect().get_pool_class(parsed)
+
+    options: Dict[str, Any] = {
+        "echo": settings.DB_ECHO,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "query_cache_size": settings.DB_QUERY_CACHE_SIZE,
+        "poolclass": timed_pool_class(pool_class, metrics),
+    }
+    if parsed.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+    elif parsed.get_driver_name() == "asyncpg":
+        options["connect_args"] = {"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    if issubclass(pool_class, QueuePool):
+        options.update({
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+        })
+    return options
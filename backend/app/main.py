@@ -10,6 +10,8 @@ from fastapi.exceptions import RequestValidationError
 from app.config import get_settings
 from app.core.exceptions import AppException
 from app.core.tenant import tenant_middleware
+from app.core.sql_profiler import sql_profiling_middleware
+from app.services.requirement_export import fail_interrupted_export_jobs, shutdown_export_executor
 
 settings = get_settings()
 
@@ -24,9 +26,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     # Startup
     print(f"🚀 {settings.APP_NAME} v{settings.APP_VERSION} starting...")
     print(f"📖 Debug mode: {settings.DEBUG}")
+    fail_interrupted_export_jobs()
     yield
     # Shutdown
     print("👋 Shutting down...")
+    shutdown_export_executor()
 
 
 # Create FastAPI application
@@ -55,6 +59,9 @@ app.add_middleware(
 # Add tenant middleware
 app.middleware("http")(tenant_middleware)
 
+# Add SQL profiling middleware (Server-Timing header, N+1 detection)
+app.middleware("http")(sql_profiling_middleware)
+
 
 # Exception handler for AppException
 @app.exception_handler(AppException)
@@ -154,7 +161,7 @@ from app.api.v1 import (
     auth, requirements, notifications, analysis, tenant, import_export,
     verification, appeals, distribution, rtm, attachments, insights,
     prompt_templates, rice, invest, ipd_story, hello,
-    requirement_review_meetings, migration,
+    requirement_review_meetings, migration, diagnostics,
 )
 
 app.include_router(auth.router, prefix=settings.API_V1_PREFIX)
@@ -176,3 +183,4 @@ app.include_router(invest.router, prefix=settings.API_V1_PREFIX)
 app.include_router(ipd_story.router, prefix=settings.API_V1_PREFIX)
 app.include_router(hello.router, prefix=settings.API_V1_PREFIX)
 app.include_router(migration.router, prefix=settings.API_V1_PREFIX)  # 临时迁移端点
+app.include_router(diagnostics.router, prefix=settings.API_V1_PREFIX)
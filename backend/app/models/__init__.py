@@ -2,6 +2,8 @@
 from app.models.user import User
 from app.models.tenant import Tenant
 from app.models.requirement import Requirement, Requirement10QAnswer
+from app.models.requirement_search import RequirementSearchIndex
+from app.models.requirement_stats import RequirementStats
 from app.models.requirement_version import RequirementVersion
 from app.models.appeals import AppealsAnalysis
 from app.models.kano import KanoClassification
@@ -21,6 +23,7 @@ from app.models.cim_reference import CIMReference, RequirementCIMLink
 from app.models.feedback import Feedback
 from app.models.verification_metric import VerificationMetric
 from app.models.review import Review
+from app.models.sequence import BusinessSequence
 
 __all__ = [
     # Core models
@@ -30,6 +33,8 @@ __all__ = [
     "Requirement",
     "Requirement10QAnswer",
     "RequirementVersion",
+    "RequirementSearchIndex",
+    "RequirementStats",
     # Analysis models
     "AppealsAnalysis",
     "KanoClassification",
@@ -59,4 +64,6 @@ __all__ = [
     "Feedback",
     "VerificationMetric",
     "Review",
+    # Business number sequences
+    "BusinessSequence",
 ]
@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Integer, BigInteger, Text, ForeignKey, Boolean
+from sqlalchemy import String, Integer, BigInteger, Text, ForeignKey, Boolean, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -32,5 +32,15 @@ class Attachment(Base):
     description: Mapped[str | None] = mapped_column(Text)
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False)
 
+    __table_args__ = (
+        # 实体的未删除附件
+        Index(
+            "ix_attachments_entity_active",
+            "entity_type", "entity_id", "uploaded_at",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = false"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Attachment(id={self.id}, file_name='{self.file_name}', entity_type='{self.entity_type}', entity_id={self.entity_id})>"
@@ -1,5 +1,5 @@
 """Export job model for tracking bulk exports."""
-from sqlalchemy import String, Integer, ForeignKey
+from sqlalchemy import String, Integer, Text, ForeignKey
 from sqlalchemy.dialects.postgresql import ENUM as PG_ENUM, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -12,6 +12,8 @@ ExportType = PG_ENUM(
     "excel",
     "pdf",
     "csv",
+    "parquet",
+    "arrow",
     name="export_type",
     create_type=True,
 )
@@ -49,6 +51,23 @@ class ExportJob(Base, TimestampMixin, TenantMixin):
     file_size: Mapped[int | None] = mapped_column(Integer)
     download_url: Mapped[str | None] = mapped_column(String(500))
 
+    # Progress
+    total_records: Mapped[int | None] = mapped_column(Integer)
+    processed_records: Mapped[int | None] = mapped_column(Integer, default=0)
+    error_message: Mapped[str | None] = mapped_column(Text)
+
+    # Hash of (tenant, type, filters, data version); equal keys share the artifact
+    cache_key: Mapped[str | None] = mapped_column(String(64), index=True)
+
+    @property
+    def progress(self) -> float | None:
+        """Percentage of records written (None until the total is known)."""
+        if self.status == "completed":
+            return 100.0
+        if not self.total_records:
+            return None
+        return round(100.0 * (self.processed_records or 0) / self.total_records, 1)
+
     def __repr__(self) -> str:
         return (
             f"<ExportJob(id={self.id}, type='{self.export_type}', status='{self.status}', "
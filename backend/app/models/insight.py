@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Dict, Any
 
-from sqlalchemy import String, Integer, Text, Boolean, ForeignKey
+from sqlalchemy import String, Integer, Text, Boolean, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -68,6 +68,10 @@ class InsightAnalysis(Base, TimestampMixin, TenantMixin):
         "UserStoryboard", back_populates="insight", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        Index("ix_insight_analyses_tenant_created", "tenant_id", "created_at"),
+    )
+
 
 class UserStoryboard(Base, TimestampMixin, TenantMixin):
     """用户故事板"""
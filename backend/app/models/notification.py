@@ -1,5 +1,5 @@
 """Notification model."""
-from sqlalchemy import String, Integer, ForeignKey, Boolean
+from sqlalchemy import String, Integer, ForeignKey, Boolean, Index, text
 from sqlalchemy.dialects.postgresql import ENUM as PG_ENUM
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -43,5 +43,16 @@ class Notification(Base, TimestampMixin, TenantMixin):
     is_read: Mapped[bool] = mapped_column(Boolean, default=False)
     read_at: Mapped[int | None] = mapped_column(Integer)  # Timestamp
 
+    __table_args__ = (
+        Index("ix_notifications_user_read_created", "user_id", "is_read", "created_at"),
+        # 未读通知（列表 / 未读数）
+        Index(
+            "ix_notifications_user_unread",
+            "user_id", "created_at",
+            postgresql_where=text("is_read = false"),
+            sqlite_where=text("is_read = false"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Notification(id={self.id}, user_id={self.user_id}, type='{self.notification_type}')>"
@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Integer, Text, ForeignKey, JSON, DateTime, Float
+from sqlalchemy import String, Integer, Text, ForeignKey, JSON, DateTime, Float, Index
 from sqlalchemy.dialects.postgresql import ENUM as PG_ENUM, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -133,6 +133,20 @@ class Requirement(Base, TimestampMixin, TenantMixin):
     creator: Mapped["User"] = relationship(foreign_keys=[created_by])
     updater: Mapped["User"] = relationship(foreign_keys=[updated_by])
 
+    __table_args__ = (
+        # 租户内按状态筛选、按创建时间排序
+        Index("ix_requirements_tenant_status_created", "tenant_id", "status", "created_at"),
+        # 需求列表的默认排序 (created_at DESC NULLS LAST, id DESC)，可带状态筛选
+        Index(
+            "ix_requirements_created_id", "created_at", "id",
+            postgresql_ops={"created_at": "DESC NULLS LAST", "id": "DESC"},
+        ),
+        Index(
+            "ix_requirements_status_created_id", "status", "created_at", "id",
+            postgresql_ops={"created_at": "DESC NULLS LAST", "id": "DESC"},
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Requirement(id={self.id}, no='{self.requirement_no}', title='{self.title}', status='{self.status}')>"
 
@@ -0,0 +1,165 @@
+"""Requirement search index model.
+
+requirement_search_index holds one pre-tokenized document per requirement
+(see app.utils.search). It is kept in sync with requirements by mapper events
+in the same transaction as the requirement write, and is queried through:
+
+- PostgreSQL: GIN index on to_tsvector('simple', tokens)
+- SQLite: FTS5 external-content table requirement_search_fts, maintained by
+  triggers on requirement_search_index
+"""
+from sqlalchemy import DDL, ForeignKey, Integer, Text, delete, event, insert, inspect, select, update
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.db.mixins import TenantMixin
+from app.models.requirement import Requirement
+from app.utils.search import build_search_document
+
+# Requirement fields that feed the search document
+SEARCH_FIELDS = ("title", "requirement_no", "description")
+
+SQLITE_FTS_TABLE = "requirement_search_fts"
+
+
+class RequirementSearchIndex(Base, TenantMixin):
+    """Tokenized search document for a requirement (CJK bigrams + words)."""
+
+    __tablename__ = "requirement_search_index"
+
+    requirement_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("requirements.id", ondelete="CASCADE"), primary_key=True
+    )
+    tokens: Mapped[str] = mapped_column(Text, nullable=False, default="")
+
+    def __repr__(self) -> str:
+        return f"<RequirementSearchIndex(requirement_id={self.requirement_id})>"
+
+
+def search_document(requirement: Requirement) -> str:
+    """Build the token document for a requirement."""
+    return build_search_document(*(getattr(requirement, f) for f in SEARCH_FIELDS))
+
+
+def rebuild_search_index(connection, batch_size: int = 500) -> int:
+    """
+    Rebuild the whole search index from the requirements table.
+
+    Used for backfill and to repair drift (e.g. rows written with raw SQL).
+
+    Args:
+        connection: Sync SQLAlchemy connection
+        batch_size: Rows tokenized per INSERT batch
+
+    Returns:
+        Number of indexed requirements
+    """
+    index_table = RequirementSearchIndex.__table__
+    connection.execute(delete(index_table))
+
+    rows = connection.execute(
+        select(
+            Requirement.id,
+            Requirement.tenant_id,
+            *(getattr(Requirement, f) for f in SEARCH_FIELDS),
+        ).execution_options(yield_per=batch_size)
+    )
+
+    total = 0
+    for partition in rows.partitions():
+        connection.execute(
+            insert(index_table),
+            [
+                {
+                    "requirement_id": row.id,
+                    "tenant_id": row.tenant_id,
+                    "tokens": build_search_document(*(getattr(row, f) for f in SEARCH_FIELDS)),
+                }
+                for row in partition
+            ],
+        )
+        total += len(partition)
+    return total
+
+
+# ============================================================================
+# Keep the index in sync with requirement writes
+# ============================================================================
+
+@event.listens_for(Requirement, "after_insert")
+def _index_after_insert(mapper, connection, target: Requirement) -> None:
+    connection.execute(
+        insert(RequirementSearchIndex.__table__).values(
+            requirement_id=target.id,
+            tenant_id=target.tenant_id,
+            tokens=search_document(target),
+        )
+    )
+
+
+@event.listens_for(Requirement, "after_update")
+def _index_after_update(mapper, connection, target: Requirement) -> None:
+    state = inspect(target)
+    if not any(state.attrs[f].history.has_changes() for f in SEARCH_FIELDS):
+        return
+
+    index_table = RequirementSearchIndex.__table__
+    result = connection.execute(
+        update(index_table)
+        .where(index_table.c.requirement_id == target.id)
+        .values(tokens=search_document(target))
+    )
+    if result.rowcount == 0:
+        _index_after_insert(mapper, connection, target)
+
+
+@event.listens_for(Requirement, "after_delete")
+def _index_after_delete(mapper, connection, target: Requirement) -> None:
+    index_table = RequirementSearchIndex.__table__
+    connection.execute(
+        delete(index_table).where(index_table.c.requirement_id == target.id)
+    )
+
+
+# ============================================================================
+# Dialect specific search structures (also created by Alembic migration)
+# ============================================================================
+
+POSTGRES_SEARCH_DDL = [
+    "CREATE INDEX IF NOT EXISTS ix_requirement_search_index_tokens "
+    "ON requirement_search_index USING gin (to_tsvector('simple', tokens))",
+]
+
+SQLITE_SEARCH_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5("
+    "tokens, content='requirement_search_index', content_rowid='requirement_id')",
+    "CREATE TRIGGER IF NOT EXISTS requirement_search_index_ai "
+    "AFTER INSERT ON requirement_search_index BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, tokens) VALUES (new.requirement_id, new.tokens); END",
+    "CREATE TRIGGER IF NOT EXISTS requirement_search_index_ad "
+    "AFTER DELETE ON requirement_search_index BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, tokens) "
+    "VALUES ('delete', old.requirement_id, old.tokens); END",
+    "CREATE TRIGGER IF NOT EXISTS requirement_search_index_au "
+    "AFTER UPDATE ON requirement_search_index BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, tokens) "
+    "VALUES ('delete', old.requirement_id, old.tokens); "
+    f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, tokens) VALUES (new.requirement_id, new.tokens); END",
+]
+
+for _statement in POSTGRES_SEARCH_DDL:
+    event.listen(
+        RequirementSearchIndex.__table__, "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
+
+for _statement in SQLITE_SEARCH_DDL:
+    event.listen(
+        RequirementSearchIndex.__table__, "after_create",
+        DDL(_statement).execute_if(dialect="sqlite"),
+    )
+
+event.listen(
+    RequirementSearchIndex.__table__, "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}").execute_if(dialect="sqlite"),
+)
@@ -0,0 +1,214 @@
+"""Requirement statistics counters.
+
+requirement_stats holds one row per tenant with requirement counts by status
+and source channel. It is maintained by mapper events in the same transaction
+as requirement inserts, updates (status / source_channel / target_type) and
+deletes, so the dashboard summary is a single primary-key read.
+
+Writes that bypass the ORM unit of work (bulk UPDATE statements, raw SQL) are
+not seen by the events; reconcile_requirement_stats() recounts from the
+requirements table and repairs any drift.
+"""
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import DateTime, Integer, case, delete, event, func, inspect, select, update
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.db.dialects import insert_ignore
+from app.models.requirement import Requirement, RequirementStatus, SourceChannel
+
+# requirement value -> counter column
+STATUS_COLUMNS = {status: f"status_{status}" for status in RequirementStatus.enums}
+CHANNEL_COLUMNS = {channel: f"channel_{channel}" for channel in SourceChannel.enums}
+
+# Requirement attributes the counters depend on
+COUNTED_FIELDS = ("status", "source_channel", "target_type")
+
+
+class RequirementStats(Base):
+    """Per-tenant requirement counters."""
+
+    __tablename__ = "requirement_stats"
+
+    tenant_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    status_collected: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    status_analyzing: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    status_analyzed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    status_distributing: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    status_distributed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    status_implementing: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    status_verifying: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    status_completed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    status_rejected: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    channel_customer: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    channel_market: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    channel_competition: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    channel_sales: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    channel_after_sales: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    channel_rd: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # 已分发且目标为charter的需求（需求开发页面）
+    distributed_charter: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    def status_counts(self) -> Dict[str, int]:
+        """Counts by status ('implementing' = distributed charter requirements)."""
+        stats = {status: getattr(self, column) for status, column in STATUS_COLUMNS.items()}
+        stats["implementing"] = self.distributed_charter
+        return stats
+
+    def channel_counts(self) -> Dict[str, int]:
+        """Counts by source channel."""
+        return {channel: getattr(self, column) for channel, column in CHANNEL_COLUMNS.items()}
+
+    def __repr__(self) -> str:
+        return f"<RequirementStats(tenant_id={self.tenant_id}, total={self.total})>"
+
+
+def counter_columns(
+    status: Optional[str], source_channel: Optional[str], target_type: Optional[str]
+) -> List[str]:
+    """Counter columns a requirement with these values contributes 1 to."""
+    columns = ["total"]
+    if status in STATUS_COLUMNS:
+        columns.append(STATUS_COLUMNS[status])
+    if source_channel in CHANNEL_COLUMNS:
+        columns.append(CHANNEL_COLUMNS[source_channel])
+    if status == "distributed" and target_type == "charter":
+        columns.append("distributed_charter")
+    return columns
+
+
+def recount_stmt(tenant_id: Optional[int] = None):
+    """Counter values computed from the requirements table, one row per tenant."""
+    counts = [func.count(Requirement.id).label("total")]
+    counts += [
+        func.count(case((Requirement.status == status, 1))).label(column)
+        for status, column in STATUS_COLUMNS.items()
+    ]
+    counts += [
+        func.count(case((Requirement.source_channel == channel, 1))).label(column)
+        for channel, column in CHANNEL_COLUMNS.items()
+    ]
+    counts.append(
+        func.count(
+            case(((Requirement.status == "distributed") & (Requirement.target_type == "charter"), 1))
+        ).label("distributed_charter")
+    )
+
+    stmt = select(Requirement.tenant_id, *counts).group_by(Requirement.tenant_id)
+    if tenant_id is not None:
+        stmt = stmt.where(Requirement.tenant_id == tenant_id)
+    return stmt
+
+
+def reconcile_requirement_stats(connection, tenant_id: Optional[int] = None) -> int:
+    """
+    Recount requirement statistics and replace the stored counters.
+
+    Args:
+        connection: Sync SQLAlchemy connection
+        tenant_id: Only reconcile this tenant (default: all tenants)
+
+    Returns:
+        Number of tenant rows written
+    """
+    table = RequirementStats.__table__
+    rows = [dict(row) for row in connection.execute(recount_stmt(tenant_id)).mappings()]
+
+    stmt = delete(table)
+    if tenant_id is not None:
+        stmt = stmt.where(table.c.tenant_id == tenant_id)
+    connection.execute(stmt)
+
+    if rows:
+        connection.execute(table.insert(), rows)
+    return len(rows)
+
+
+def apply_counter_deltas(connection, tenant_id: int, deltas: Dict[str, int]) -> None:
+    """
+    Add deltas to a tenant's counters.
+
+    The first write for a tenant creates its row from a recount, which
+    already includes the change being flushed.
+
+    Args:
+        connection: Connection of the current flush / transaction
+        tenant_id: Tenant ID
+        deltas: Counter column -> increment (may be negative)
+    """
+    deltas = {column: delta for column, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    table = RequirementStats.__table__
+    increment = (
+        update(table)
+        .where(table.c.tenant_id == tenant_id)
+        .values({table.c[column]: table.c[column] + delta for column, delta in deltas.items()})
+    )
+    if connection.execute(increment).rowcount:
+        return
+
+    row = connection.execute(recount_stmt(tenant_id)).mappings().first()
+    values = dict(row) if row else {"tenant_id": tenant_id}
+    created = connection.execute(insert_ignore(connection.dialect.name, table, values))
+    if created.rowcount == 0:
+        # Row created concurrently; its recount could not see this change
+        connection.execute(increment)
+
+
+# ============================================================================
+# Keep the counters in sync with requirement writes
+# ============================================================================
+
+def _deltas(old: List[str], new: List[str]) -> Dict[str, int]:
+    added, removed = Counter(new), Counter(old)
+    return {column: added[column] - removed[column] for column in set(added) | set(removed)}
+
+
+@event.listens_for(Requirement, "after_insert")
+def _stats_after_insert(mapper, connection, target: Requirement) -> None:
+    columns = counter_columns(target.status, target.source_channel, target.target_type)
+    apply_counter_deltas(connection, target.tenant_id, _deltas([], columns))
+
+
+def _committed_values(target: Requirement) -> Dict[str, Optional[str]]:
+    """Counted fields as they were before the pending changes."""
+    state = inspect(target)
+    values = {}
+    for field in COUNTED_FIELDS:
+        history = state.attrs[field].history
+        values[field] = history.deleted[0] if history.deleted else getattr(target, field)
+    return values
+
+
+def _columns_for(values: Dict[str, Optional[str]]) -> List[str]:
+    return counter_columns(values["status"], values["source_channel"], values["target_type"])
+
+
+@event.listens_for(Requirement, "after_update")
+def _stats_after_update(mapper, connection, target: Requirement) -> None:
+    state = inspect(target)
+    if not any(state.attrs[f].history.has_changes() for f in COUNTED_FIELDS):
+        return
+
+    old = _columns_for(_committed_values(target))
+    new = _columns_for({field: getattr(target, field) for field in COUNTED_FIELDS})
+    apply_counter_deltas(connection, target.tenant_id, _deltas(old, new))
+
+
+@event.listens_for(Requirement, "after_delete")
+def _stats_after_delete(mapper, connection, target: Requirement) -> None:
+    old = _columns_for(_committed_values(target))
+    apply_counter_deltas(connection, target.tenant_id, _deltas(old, []))
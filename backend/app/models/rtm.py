@@ -1,6 +1,6 @@
 """RTM (Requirements Traceability Matrix) models."""
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -37,3 +37,7 @@ class TraceabilityLink(Base):
 
     # Relationship to requirement
     # requirement = relationship("Requirement", back_populates="traceability_links")
+
+    __table_args__ = (
+        Index("ix_traceability_links_tenant_requirement", "tenant_id", "requirement_id"),
+    )
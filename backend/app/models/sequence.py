@@ -0,0 +1,32 @@
+"""Business number sequence model."""
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class BusinessSequence(Base):
+    """Counter row per (tenant, prefix, period) for business numbers.
+
+    tenant_id 0 is used for numbers that are unique across tenants
+    (requirement_no, meeting_no, ...). Values are allocated with
+    UPDATE ... RETURNING, see app.services.sequence.
+    """
+
+    __tablename__ = "business_sequences"
+
+    tenant_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    prefix: Mapped[str] = mapped_column(String(50), primary_key=True)
+    period: Mapped[str] = mapped_column(String(20), primary_key=True, default="")
+    last_value: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<BusinessSequence(tenant_id={self.tenant_id}, prefix='{self.prefix}', "
+            f"period='{self.period}', last_value={self.last_value})>"
+        )
@@ -2,7 +2,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Integer, Text, ForeignKey, DateTime, JSON
+from sqlalchemy import String, Integer, Text, ForeignKey, DateTime, JSON, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -33,5 +33,9 @@ class WorkflowHistory(Base):
     # Change snapshot
     changes_snapshot: Mapped[dict | None] = mapped_column(JSON)
 
+    __table_args__ = (
+        Index("ix_workflow_history_entity_performed", "entity_type", "entity_id", "performed_at"),
+    )
+
     def __repr__(self) -> str:
         return f"<WorkflowHistory(id={self.id}, entity_type='{self.entity_type}', entity_id={self.entity_id}, action='{self.action}')>"
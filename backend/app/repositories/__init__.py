@@ -1,5 +1,5 @@
 """Repositories package."""
-from app.repositories.requirement import RequirementRepository
+from app.repositories.requirement import RequirementRepository, AsyncRequirementRepository
 from app.repositories.requirement_review_meeting import RequirementReviewMeetingRepository
 
-__all__ = ["RequirementRepository", "RequirementReviewMeetingRepository"]
+__all__ = ["RequirementRepository", "AsyncRequirementRepository", "RequirementReviewMeetingRepository"]
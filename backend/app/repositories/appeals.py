@@ -3,9 +3,22 @@ from typing import Optional, Dict, Any
 from datetime import datetime
 
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import case, func, select
 
 from app.models.appeals import AppealsAnalysis
+from app.models.requirement import Requirement
+
+# The eight APPEALS dimensions (column prefix of score / weight / comment)
+APPEALS_DIMENSIONS = (
+    "price",
+    "availability",
+    "packaging",
+    "performance",
+    "ease_of_use",
+    "assurance",
+    "lifecycle_cost",
+    "social_acceptance",
+)
 
 
 class AppealsRepository:
@@ -32,6 +45,82 @@ class AppealsRepository:
         result = self.db.execute(stmt).scalar_one_or_none()
         return result
 
+    def get_summary_stats(self, tenant_id: int) -> Dict[str, Any]:
+        """
+        Aggregate a tenant's APPEALS analyses in one query.
+
+        An analysis counts as analyzed when it has a non-zero total weighted
+        score; dimension averages are taken over analyzed requirements, with
+        missing scores counted as 0.
+
+        Args:
+            tenant_id: Tenant ID
+
+        Returns:
+            Dict with total_requirements, analyzed_requirements and
+            average_scores (dimension -> average)
+        """
+        analyzed = AppealsAnalysis.total_weighted_score != 0
+        stmt = (
+            select(
+                func.count(Requirement.id),
+                func.count(case((analyzed, AppealsAnalysis.id))),
+                *[
+                    func.avg(case((analyzed, func.coalesce(getattr(AppealsAnalysis, f"{dimension}_score"), 0))))
+                    for dimension in APPEALS_DIMENSIONS
+                ],
+            )
+            .select_from(Requirement)
+            .outerjoin(AppealsAnalysis, AppealsAnalysis.requirement_id == Requirement.id)
+            .where(Requirement.tenant_id == tenant_id)
+        )
+        total, analyzed_count, *averages = self.db.execute(stmt).one()
+
+        return {
+            "total_requirements": total,
+            "analyzed_requirements": analyzed_count,
+            "average_scores": {
+                dimension: round(float(average or 0), 2)
+                for dimension, average in zip(APPEALS_DIMENSIONS, averages)
+            },
+        }
+
+    def get_top_requirements(self, tenant_id: int, limit: int = 10) -> list[Dict[str, Any]]:
+        """
+        Analyzed requirements with the highest total weighted score.
+
+        Args:
+            tenant_id: Tenant ID
+            limit: Number of requirements
+
+        Returns:
+            requirement_id / requirement_no / title / total_score dicts
+        """
+        stmt = (
+            select(
+                Requirement.id,
+                Requirement.requirement_no,
+                Requirement.title,
+                AppealsAnalysis.total_weighted_score,
+            )
+            .join(AppealsAnalysis, AppealsAnalysis.requirement_id == Requirement.id)
+            .where(
+                Requirement.tenant_id == tenant_id,
+                AppealsAnalysis.total_weighted_score != 0,
+            )
+            .order_by(AppealsAnalysis.total_weighted_score.desc(), Requirement.id)
+            .limit(limit)
+        )
+        return [
+            {
+                "requirement_id": row.id,
+                "requirement_no": row.requirement_no,
+                "title": row.title,
+                "total_score": float(row.total_weighted_score),
+            }
+            for row in self.db.execute(stmt)
+        ]
+
     def create(
         self,
         requirement_id: int,
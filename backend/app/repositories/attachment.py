@@ -10,6 +10,21 @@ from sqlalchemy import select, and_
 from app.models.attachment import Attachment
 
 
+def entity_attachments_statement(entity_type: str, entity_id: int, include_deleted: bool = False):
+    """Query of an entity's attachments, newest first (also EXPLAINed by app.db.index_check)."""
+    query = select(Attachment).where(
+        and_(
+            Attachment.entity_type == entity_type,
+            Attachment.entity_id == entity_id,
+        )
+    )
+
+    if not include_deleted:
+        query = query.where(Attachment.is_deleted == False)  # noqa: E712
+
+    return query.order_by(Attachment.uploaded_at.desc())
+
+
 class AttachmentRepository:
     """Repository for Attachment model."""
 
@@ -92,18 +107,7 @@ class AttachmentRepository:
         Returns:
             List of attachments
         """
-        query = select(Attachment).where(
-            and_(
-                Attachment.entity_type == entity_type,
-                Attachment.entity_id == entity_id,
-            )
-        )
-
-        if not include_deleted:
-            query = query.where(Attachment.is_deleted == False)  # noqa: E712
-
-        query = query.order_by(Attachment.uploaded_at.desc())
-
+        query = entity_attachments_statement(entity_type, entity_id, include_deleted)
         result = self.db.execute(query)
         return list(result.scalars().all())
 
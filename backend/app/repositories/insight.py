@@ -0,0 +1,18 @@
+"""Insight analysis queries."""
+from typing import Optional
+
+from sqlalchemy import select
+
+from app.models.insight import InsightAnalysis
+
+
+def insight_list_statement(
+    tenant_id: int, skip: int = 0, limit: int = 20, status: Optional[str] = None
+):
+    """Query of a tenant's insights, newest first (also EXPLAINed by app.db.index_check)."""
+    query = select(InsightAnalysis).where(InsightAnalysis.tenant_id == tenant_id)
+
+    if status:
+        query = query.where(InsightAnalysis.status == status)
+
+    return query.order_by(InsightAnalysis.created_at.desc()).offset(skip).limit(limit)
@@ -1,13 +1,33 @@
 """Notification repository."""
 from typing import Optional
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.notification import Notification
 from app.repositories.base import BaseRepository
 
 
+def user_notifications_statement(
+    user_id: int, skip: int = 0, limit: int = 100, unread_only: bool = False
+):
+    """Query of a user's notifications, newest first (also EXPLAINed by app.db.index_check)."""
+    query = select(Notification).where(Notification.user_id == user_id)
+
+    if unread_only:
+        query = query.where(Notification.is_read == False)  # noqa: E712
+
+    query = query.order_by(Notification.created_at.desc())
+    return query.offset(skip).limit(limit)
+
+
+def unread_count_statement(user_id: int):
+    """Count of a user's unread notifications (also EXPLAINed by app.db.index_check)."""
+    return select(func.count()).where(
+        and_(Notification.user_id == user_id, Notification.is_read == False)  # noqa: E712
+    )
+
+
 class NotificationRepository(BaseRepository[Notification]):
     """Repository for notification operations."""
 
@@ -25,14 +45,7 @@ class NotificationRepository(BaseRepository[Notification]):
         Returns:
             List of notifications
         """
-        query = select(Notification).where(Notification.user_id == user_id)
-
-        if unread_only:
-            query = query.where(Notification.is_read == False)
-
-        query = query.order_by(Notification.created_at.desc())
-        query = query.offset(skip).limit(limit)
-
+        query = user_notifications_statement(user_id, skip, limit, unread_only)
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
@@ -45,12 +58,7 @@ class NotificationRepository(BaseRepository[Notification]):
         Returns:
             Unread count
         """
-        from sqlalchemy import func
-
-        query = select(func.count()).where(
-            and_(Notification.user_id == user_id, Notification.is_read == False)
-        )
-        result = await self.session.execute(query)
+        result = await self.session.execute(unread_count_statement(user_id))
         return result.scalar()
 
     async def mark_as_read(self, id: int, user_id: int) -> Optional[Notification]:
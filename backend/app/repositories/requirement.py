@@ -1,11 +1,410 @@
 """Requirement repository for data access."""
+from collections import Counter
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, desc, or_, and_, exists, not_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, func, or_, and_, exists, not_, text, literal_column
 
 from app.models.requirement import Requirement, Requirement10QAnswer, RequirementStatus, SourceChannel
+from app.models.requirement_search import RequirementSearchIndex, SEARCH_FIELDS, SQLITE_FTS_TABLE
+from app.models.requirement_stats import RequirementStats, apply_counter_deltas, counter_columns
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.utils.search import build_search_document, tokenize_query, is_prefix_token
+
+
+# Fields the requirement list can be sorted (and cursor-paginated) by
+SORTABLE_FIELDS = (
+    "id",
+    "requirement_no",
+    "title",
+    "status",
+    "source_channel",
+    "priority_score",
+    "priority_rank",
+    "moscow_priority",
+    "target_type",
+    "target_id",
+    "estimated_duration_months",
+    "complexity_level",
+    "created_at",
+    "updated_at",
+)
+
+
+# ============================================================================
+# Shared query builders (used by both sync and async repositories)
+# ============================================================================
+
+def _search_matches(search: str, dialect_name: str):
+    """
+    Build a subquery of (requirement_id, score) matching the search text.
+
+    Uses the requirement_search_index side table: tsvector on PostgreSQL,
+    FTS5 on SQLite. Higher score means more relevant.
+
+    Args:
+        search: User search input
+        dialect_name: SQLAlchemy dialect name of the session
+
+    Returns:
+        Subquery, or None if the dialect or query cannot use the index
+    """
+    tokens = tokenize_query(search)
+    if not tokens:
+        return None
+
+    if dialect_name == "postgresql":
+        ts_query = func.to_tsquery(
+            "simple",
+            " & ".join(f"'{t}':*" if is_prefix_token(t) else f"'{t}'" for t in tokens),
+        )
+        document = func.to_tsvector("simple", RequirementSearchIndex.tokens)
+        return (
+            select(
+                RequirementSearchIndex.requirement_id.label("requirement_id"),
+                func.ts_rank(document, ts_query).label("score"),
+            )
+            .where(document.op("@@")(ts_query))
+            .subquery("search_matches")
+        )
+
+    if dialect_name == "sqlite":
+        fts = literal_column(SQLITE_FTS_TABLE)
+        match = " ".join(f'"{t}"*' if is_prefix_token(t) else f'"{t}"' for t in tokens)
+        return (
+            select(
+                literal_column("rowid").label("requirement_id"),
+                # bm25() is lower-is-better
+                (-func.bm25(fts)).label("score"),
+            )
+            .select_from(text(SQLITE_FTS_TABLE))
+            .where(fts.op("MATCH")(match))
+            .subquery("search_matches")
+        )
+
+    return None
+
+
+def _search_condition(search: str, dialect_name: str):
+    """WHERE condition for the list `search` filter."""
+    no_match = Requirement.requirement_no.ilike(f"%{search}%")
+    matches = _search_matches(search, dialect_name)
+    if matches is None:
+        return or_(Requirement.title.ilike(f"%{search}%"), no_match)
+    return or_(Requirement.id.in_(select(matches.c.requirement_id)), no_match)
+
+
+def _list_conditions(
+    status: Optional[str] = None,
+    source_channel: Optional[str] = None,
+    target_type: Optional[str] = None,
+    search: Optional[str] = None,
+    exclude_reviewed: bool = False,
+    dialect_name: str = "postgresql",
+) -> List[Any]:
+    """
+    Build WHERE conditions for requirement listing.
+
+    Args:
+        status: Filter by status
+        source_channel: Filter by source channel
+        target_type: Filter by target type (sp/bp/charter/pcr)
+        search: Full-text search in title, requirement_no and description
+        exclude_reviewed: 排除已在评审会议或有投票结果的需求
+        dialect_name: Dialect of the session (selects the search backend)
+
+    Returns:
+        List of SQLAlchemy conditions
+    """
+    conditions = []
+
+    if status:
+        conditions.append(Requirement.status == status)
+
+    if source_channel:
+        conditions.append(Requirement.source_channel == source_channel)
+
+    if target_type:
+        conditions.append(Requirement.target_type == target_type)
+
+    if search:
+        conditions.append(_search_condition(search, dialect_name))
+
+    # 排除已评审需求
+    if exclude_reviewed:
+        from app.models.requirement_review_meeting_requirement import RequirementReviewMeetingRequirement
+        from app.models.vote_result import VoteResult
+
+        # 子查询1：已在会议中的需求
+        in_meeting = exists().where(
+            and_(
+                RequirementReviewMeetingRequirement.requirement_id == Requirement.id,
+                RequirementReviewMeetingRequirement.tenant_id == Requirement.tenant_id
+            )
+        )
+
+        # 子查询2：有投票结果的需求
+        has_vote_result = exists().where(
+            and_(
+                VoteResult.requirement_id == Requirement.id,
+                VoteResult.tenant_id == Requirement.tenant_id
+            )
+        )
+
+        # 排除两种情况
+        conditions.append(not_(in_meeting))
+        conditions.append(not_(has_vote_result))
+
+    return conditions
+
+
+def _sort_column(sort_by: str):
+    """Resolve sort_by to a column, falling back to created_at."""
+    if sort_by not in SORTABLE_FIELDS:
+        sort_by = "created_at"
+    return getattr(Requirement, sort_by)
+
+
+def encode_requirement_cursor(
+    requirement: Requirement, sort_by: str, sort_order: str
+) -> str:
+    """
+    Build the opaque keyset cursor pointing right after the given requirement.
+
+    Args:
+        requirement: Last requirement of the current page
+        sort_by: Sort field used for the page
+        sort_order: Sort order used for the page
+
+    Returns:
+        Cursor token to pass back as `after`
+    """
+    sort_column = _sort_column(sort_by)
+    return encode_cursor({
+        "s": sort_column.key,
+        "o": sort_order,
+        "v": getattr(requirement, sort_column.key),
+        "id": requirement.id,
+    })
+
+
+def _keyset_condition(sort_column, sort_order: str, after: str):
+    """
+    Build the keyset predicate for rows that come after the cursor.
+
+    Ordering is (sort_column NULLS LAST, id), so NULL sort values form the
+    tail of the listing in both directions.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort
+    """
+    cursor = decode_cursor(after)
+    if cursor.get("s") != sort_column.key or cursor.get("o") != sort_order:
+        raise ValueError("Cursor does not match the requested sort")
+    if not isinstance(cursor.get("id"), int):
+        raise ValueError("Invalid cursor: missing id")
+
+    last_value, last_id = cursor.get("v"), cursor["id"]
+    ascending = sort_order == "asc"
+    beyond_id = Requirement.id > last_id if ascending else Requirement.id < last_id
+
+    if last_value is None:
+        return and_(sort_column.is_(None), beyond_id)
+
+    beyond_value = sort_column > last_value if ascending else sort_column < last_value
+    return or_(
+        beyond_value,
+        and_(sort_column == last_value, beyond_id),
+        sort_column.is_(None),
+    )
+
+
+def _list_statements(
+    page: int,
+    page_size: int,
+    conditions: List[Any],
+    sort_by: str,
+    sort_order: str,
+    after: Optional[str] = None,
+):
+    """
+    Build the page query and the count query for requirement listing.
+
+    When `after` is given the page is fetched by keyset instead of OFFSET,
+    so deep pages cost the same as the first one.
+
+    Returns:
+        Tuple of (page statement, count statement)
+
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    stmt = select(Requirement)
+    count_stmt = select(func.count()).select_from(Requirement)
+    if conditions:
+        stmt = stmt.where(and_(*conditions))
+        count_stmt = count_stmt.where(and_(*conditions))
+
+    # Apply sorting (id as tie-breaker keeps pages stable)
+    sort_column = _sort_column(sort_by)
+    if sort_order == "asc":
+        stmt = stmt.order_by(sort_column.asc().nulls_last(), Requirement.id.asc())
+    else:
+        stmt = stmt.order_by(sort_column.desc().nulls_last(), Requirement.id.desc())
+
+    # Apply pagination
+    if after:
+        stmt = stmt.where(_keyset_condition(sort_column, sort_order, after))
+    else:
+        stmt = stmt.offset((page - 1) * page_size)
+    stmt = stmt.limit(page_size)
+
+    return stmt, count_stmt
+
+
+# How list() computes the total:
+#   exact    - separate COUNT(*) query (two scans)
+#   window   - COUNT(*) OVER() on the page query (one round trip)
+#   estimate - planner row estimate for unfiltered PostgreSQL listings,
+#              falls back to window otherwise
+COUNT_MODES = ("exact", "window", "estimate")
+
+_ESTIMATED_ROWS_SQL = text(
+    "SELECT reltuples::bigint FROM pg_class WHERE oid = 'requirements'::regclass"
+)
+
+
+def _with_window_total(stmt, count_stmt, after: Optional[str]):
+    """
+    Attach the filtered total to every row of the page query.
+
+    With a keyset cursor the WHERE clause also holds the cursor predicate, so
+    the total is attached as a scalar subquery instead of COUNT(*) OVER().
+    """
+    if after:
+        total_column = count_stmt.scalar_subquery()
+    else:
+        total_column = func.count().over()
+    return stmt.add_columns(total_column.label("total_count"))
+
+
+def _can_estimate_total(db, conditions: List[Any]) -> bool:
+    """Planner estimates are only used for unfiltered PostgreSQL listings."""
+    return not conditions and db.get_bind().dialect.name == "postgresql"
+
+
+def _empty_status_stats() -> Dict[str, int]:
+    """Status counters initialized with every known status."""
+    return {
+        "collected": 0,
+        "analyzing": 0,
+        "analyzed": 0,
+        "distributing": 0,
+        "distributed": 0,
+        "implementing": 0,
+        "verifying": 0,
+        "completed": 0,
+        "rejected": 0,
+    }
+
+
+def _empty_channel_stats() -> Dict[str, int]:
+    """Channel counters initialized with every known source channel."""
+    return {
+        "customer": 0,
+        "market": 0,
+        "competition": 0,
+        "sales": 0,
+        "after_sales": 0,
+        "rd": 0,
+    }
+
+
+# 业务规则：已分发且目标为charter的需求计入"开发中"状态
+_distributed_charter_count_stmt = (
+    select(func.count(Requirement.id))
+    .where(
+        and_(
+            Requirement.status == "distributed",
+            Requirement.target_type == "charter"
+        )
+    )
+)
+
+
+# Answer fields of Requirement10QAnswer
+TEN_QUESTION_FIELDS = (
+    "q1_who_cares",
+    "q2_why_care",
+    "q3_how_often",
+    "q4_current_solution",
+    "q5_pain_points",
+    "q6_expected_outcome",
+    "q7_value_impact",
+    "q8_urgency_level",
+    "q9_budget_willingness",
+    "q10_alternative_solutions",
+    "additional_notes",
+)
+
+# Requirement fields accepted on create (single and bulk)
+CREATE_FIELDS = (
+    "title",
+    "description",
+    "source_channel",
+    "source_contact",
+    "moscow_priority",
+    "moscow_comment",
+    "customer_need_10q",
+    "estimated_duration_months",
+    "complexity_level",
+)
+
+# Rows per INSERT batch in bulk_create
+BULK_INSERT_BATCH_SIZE = 1000
+
+# Rows fetched per round trip when streaming exports
+EXPORT_CHUNK_SIZE = 1000
+
+# Columns of requirement exports
+EXPORT_COLUMNS = (
+    Requirement.requirement_no,
+    Requirement.title,
+    Requirement.status,
+    Requirement.source_channel,
+    Requirement.target_type,
+    Requirement.priority_score,
+    Requirement.moscow_priority,
+    Requirement.target_id,
+    Requirement.estimated_duration_months,
+    Requirement.created_at,
+    Requirement.updated_at,
+    Requirement.description,
+)
+
+
+def _10q_answer_values(
+    requirement_id: int,
+    answers: Dict[str, Any],
+    answered_by: Optional[int],
+    tenant_id: Optional[int],
+) -> Dict[str, Any]:
+    """Column values of a Requirement10QAnswer row from an answers dict."""
+    values = {field: answers.get(field) for field in TEN_QUESTION_FIELDS}
+    values.update(requirement_id=requirement_id, answered_by=answered_by, tenant_id=tenant_id)
+    return values
+
+
+def _build_10q_answer(
+    requirement_id: int,
+    answers: Dict[str, Any],
+    answered_by: Optional[int],
+    tenant_id: Optional[int],
+) -> Requirement10QAnswer:
+    """Build a Requirement10QAnswer instance from an answers dict."""
+    return Requirement10QAnswer(**_10q_answer_values(requirement_id, answers, answered_by, tenant_id))
 
 
 class RequirementRepository:
@@ -115,6 +514,8 @@ class RequirementRepository:
         sort_by: str = "created_at",
         sort_order: str = "desc",
         exclude_reviewed: bool = False,
+        after: Optional[str] = None,
+        count_mode: str = "exact",
     ) -> Tuple[List[Requirement], int]:
         """
         List requirements with filters and pagination.
@@ -125,106 +526,53 @@ class RequirementRepository:
             status: Filter by status
             source_channel: Filter by source channel
             target_type: Filter by target type (sp/bp/charter/pcr)
-            search: Search in title and requirement_no
+            search: Full-text search in title, requirement_no and description
             sort_by: Sort field
             sort_order: Sort order (asc or desc)
             exclude_reviewed: 排除已在评审会议或有投票结果的需求
+            after: Keyset cursor from the previous page (overrides page)
+            count_mode: How the total is computed (see COUNT_MODES)
 
         Returns:
             Tuple of (list of requirements, total count)
-        """
-        # Build query
-        stmt = select(Requirement)
-
-        # Apply filters
-        conditions = []
-
-        if status:
-            conditions.append(Requirement.status == status)
-
-        if source_channel:
-            conditions.append(Requirement.source_channel == source_channel)
-
-        if target_type:
-            conditions.append(Requirement.target_type == target_type)
-
-        if search:
-            search_pattern = f"%{search}%"
-            conditions.append(
-                or_(
-                    Requirement.title.ilike(search_pattern),
-                    Requirement.requirement_no.ilike(search_pattern),
-                )
-            )
 
-        if conditions:
-            stmt = stmt.where(and_(*conditions))
-
-        # 排除已评审需求（新增）
-        if exclude_reviewed:
-            from app.models.requirement_review_meeting_requirement import RequirementReviewMeetingRequirement
-            from app.models.vote_result import VoteResult
-
-            # 子查询1：已在会议中的需求
-            in_meeting = exists().where(
-                and_(
-                    RequirementReviewMeetingRequirement.requirement_id == Requirement.id,
-                    RequirementReviewMeetingRequirement.tenant_id == Requirement.tenant_id
-                )
-            )
-
-            # 子查询2：有投票结果的需求
-            has_vote_result = exists().where(
-                and_(
-                    VoteResult.requirement_id == Requirement.id,
-                    VoteResult.tenant_id == Requirement.tenant_id
-                )
-            )
-
-            # 排除两种情况
-            stmt = stmt.where(not_(in_meeting)).where(not_(has_vote_result))
-
-        # Get total count
-        count_stmt = select(func.count()).select_from(Requirement)
-        if conditions:
-            count_stmt = count_stmt.where(and_(*conditions))
-
-        if exclude_reviewed:
-            from app.models.requirement_review_meeting_requirement import RequirementReviewMeetingRequirement
-            from app.models.vote_result import VoteResult
-
-            # 复用相同的子查询逻辑
-            in_meeting_count = exists().where(
-                and_(
-                    RequirementReviewMeetingRequirement.requirement_id == Requirement.id,
-                    RequirementReviewMeetingRequirement.tenant_id == Requirement.tenant_id
-                )
-            )
-            has_vote_result_count = exists().where(
-                and_(
-                    VoteResult.requirement_id == Requirement.id,
-                    VoteResult.tenant_id == Requirement.tenant_id
-                )
-            )
-            count_stmt = count_stmt.where(not_(in_meeting_count)).where(not_(has_vote_result_count))
+        Raises:
+            ValueError: If the cursor or count_mode is invalid
+        """
+        if count_mode not in COUNT_MODES:
+            raise ValueError(f"Invalid count_mode: {count_mode}")
 
-        total = self.db.execute(count_stmt).scalar()
+        conditions = _list_conditions(
+            status=status,
+            source_channel=source_channel,
+            target_type=target_type,
+            search=search,
+            exclude_reviewed=exclude_reviewed,
+            dialect_name=self.db.get_bind().dialect.name,
+        )
+        stmt, count_stmt = _list_statements(
+            page, page_size, conditions, sort_by, sort_order, after
+        )
 
-        # Apply sorting
-        sort_column = getattr(Requirement, sort_by, Requirement.created_at)
-        if sort_order == "asc":
-            stmt = stmt.order_by(sort_column.asc())
-        else:
-            stmt = stmt.order_by(sort_column.desc())
+        if count_mode == "estimate" and _can_estimate_total(self.db, conditions):
+            total = self.db.execute(_ESTIMATED_ROWS_SQL).scalar()
+            if total is not None and total >= 0:
+                requirements = self.db.execute(stmt).scalars().all()
+                return list(requirements), total
+            count_mode = "window"
 
-        # Apply pagination
-        offset = (page - 1) * page_size
-        stmt = stmt.offset(offset).limit(page_size)
+        if count_mode == "exact":
+            total = self.db.execute(count_stmt).scalar()
+            requirements = self.db.execute(stmt).scalars().all()
+            return list(requirements), total
 
-        # Execute
-        requirements = self.db.execute(stmt).scalars().all()
+        rows = self.db.execute(_with_window_total(stmt, count_stmt, after)).all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total_count
 
-        return list(requirements), total
+        # Empty page past the end: the window carried no total
+        total = self.db.execute(count_stmt).scalar() if (after or page > 1) else 0
+        return [], total
 
     def update(
         self,
@@ -314,34 +662,14 @@ class RequirementRepository:
         result = self.db.execute(stmt).all()
 
         # Initialize with all statuses
-        stats = {
-            "collected": 0,
-            "analyzing": 0,
-            "analyzed": 0,
-            "distributing": 0,
-            "distributed": 0,
-            "implementing": 0,
-            "verifying": 0,
-            "completed": 0,
-            "rejected": 0,
-        }
+        stats = _empty_status_stats()
 
         for status, count in result:
             if status in stats:
                 stats[status] = count
 
-        # 业务规则：已分发且目标为charter的需求计入"开发中"状态
         # 这些需求已进入需求开发页面
-        distributed_charter_stmt = (
-            select(func.count(Requirement.id))
-            .where(
-                and_(
-                    Requirement.status == "distributed",
-                    Requirement.target_type == "charter"
-                )
-            )
-        )
-        distributed_charter_count = self.db.execute(distributed_charter_stmt).scalar() or 0
+        distributed_charter_count = self.db.execute(_distributed_charter_count_stmt).scalar() or 0
         stats["implementing"] = distributed_charter_count
 
         return stats
@@ -361,14 +689,7 @@ class RequirementRepository:
         result = self.db.execute(stmt).all()
 
         # Initialize with all channels
-        stats = {
-            "customer": 0,
-            "market": 0,
-            "competition": 0,
-            "sales": 0,
-            "after_sales": 0,
-            "rd": 0,
-        }
+        stats = _empty_channel_stats()
 
         for channel, count in result:
             if channel in stats:
@@ -386,6 +707,117 @@ class RequirementRepository:
         stmt = select(func.count(Requirement.id))
         return self.db.execute(stmt).scalar()
 
+    def _export_conditions(
+        self,
+        tenant_id: int,
+        status: Optional[str] = None,
+        source_channel: Optional[str] = None,
+        target_type: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> List[Any]:
+        conditions = _list_conditions(
+            status=status,
+            source_channel=source_channel,
+            target_type=target_type,
+            search=search,
+            dialect_name=self.db.get_bind().dialect.name,
+        )
+        conditions.append(Requirement.tenant_id == tenant_id)
+        return conditions
+
+    def count_for_export(self, tenant_id: int, **filters) -> int:
+        """
+        Count the requirements an export with these filters will write.
+
+        Args:
+            tenant_id: Tenant ID
+            **filters: status / source_channel / target_type / search
+
+        Returns:
+            Number of requirements
+        """
+        stmt = select(func.count(Requirement.id)).where(
+            and_(*self._export_conditions(tenant_id, **filters))
+        )
+        return self.db.execute(stmt).scalar()
+
+    def iter_for_export(
+        self,
+        tenant_id: int,
+        status: Optional[str] = None,
+        source_channel: Optional[str] = None,
+        target_type: Optional[str] = None,
+        search: Optional[str] = None,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+    ) -> Iterator[Any]:
+        """
+        Stream the export columns of a tenant's requirements.
+
+        Rows are read in keyset pages of chunk_size (id < last id), one
+        fully fetched query per page, so no cursor stays open between
+        pages: callers may commit (e.g. export progress) while iterating,
+        which a file-backed SQLite database refuses under an open reader.
+        Rows are plain rows, not ORM instances, so nothing accumulates in
+        the session.
+
+        Args:
+            tenant_id: Tenant ID
+            status: Filter by status
+            source_channel: Filter by source channel
+            target_type: Filter by target type
+            search: Full-text search keyword
+            chunk_size: Rows per fetch
+
+        Yields:
+            Rows with the EXPORT_COLUMNS attributes and id, newest (highest
+            id) first
+        """
+        conditions = self._export_conditions(tenant_id, status, source_channel, target_type, search)
+        stmt = (
+            select(*EXPORT_COLUMNS, Requirement.id)
+            .where(and_(*conditions))
+            .order_by(Requirement.id.desc())
+            .limit(chunk_size)
+        )
+        page = self.db.execute(stmt).all()
+        while page:
+            yield from page
+            if len(page) < chunk_size:
+                return
+            page = self.db.execute(stmt.where(Requirement.id < page[-1].id)).all()
+
+    def get_data_version(self, tenant_id: int) -> str:
+        """
+        Fingerprint of a tenant's requirement data.
+
+        Changes whenever a requirement is created, updated or deleted
+        (row count and newest updated_at), so cached exports can be reused
+        while it stays the same.
+
+        Args:
+            tenant_id: Tenant ID
+
+        Returns:
+            Version string
+        """
+        stmt = select(func.count(Requirement.id), func.max(Requirement.updated_at)).where(
+            Requirement.tenant_id == tenant_id
+        )
+        count, last_updated = self.db.execute(stmt).one()
+        return f"{count}:{last_updated.isoformat() if last_updated else ''}"
+
+    def get_stats_summary(self, tenant_id: int) -> Optional[RequirementStats]:
+        """
+        Get the maintained statistics counters of a tenant (primary-key read).
+
+        Args:
+            tenant_id: Tenant ID
+
+        Returns:
+            RequirementStats row or None if the tenant has no counters yet
+        """
+        return self.db.get(RequirementStats, tenant_id, populate_existing=True)
+
     # ========================================================================
     # Helper Methods
     # ========================================================================
@@ -394,32 +826,16 @@ class RequirementRepository:
         """
         Generate unique requirement number.
 
-        Format: REQ-YYYY-XXXX (4 digit sequential number)
+        Format: REQ-YYYY-XXXX (4 digit sequential number), allocated from
+        the business sequence counter.
 
         Returns:
             Requirement number
         """
-        year = datetime.utcnow().year
+        # Imported here: app.services imports this module
+        from app.services.sequence import REQUIREMENT_NO, SequenceService
 
-        # Get the last requirement number for this year
-        prefix = f"REQ-{year}-"
-        stmt = (
-            select(Requirement.requirement_no)
-            .where(Requirement.requirement_no.like(f"{prefix}%"))
-            .order_by(desc(Requirement.requirement_no))
-            .limit(1)
-        )
-
-        result = self.db.execute(stmt).scalar_one_or_none()
-
-        if result:
-            # Extract and increment the sequence number
-            last_seq = int(result.split("-")[-1])
-            new_seq = last_seq + 1
-        else:
-            new_seq = 1
-
-        return f"{prefix}{new_seq:04d}"
+        return SequenceService(self.db).next_number(REQUIREMENT_NO)
 
 
 # ============================================================================
@@ -451,22 +867,7 @@ class Requirement10QRepository:
         Returns:
             Created answer record
         """
-        answer = Requirement10QAnswer(
-            requirement_id=requirement_id,
-            q1_who_cares=answers.get("q1_who_cares"),
-            q2_why_care=answers.get("q2_why_care"),
-            q3_how_often=answers.get("q3_how_often"),
-            q4_current_solution=answers.get("q4_current_solution"),
-            q5_pain_points=answers.get("q5_pain_points"),
-            q6_expected_outcome=answers.get("q6_expected_outcome"),
-            q7_value_impact=answers.get("q7_value_impact"),
-            q8_urgency_level=answers.get("q8_urgency_level"),
-            q9_budget_willingness=answers.get("q9_budget_willingness"),
-            q10_alternative_solutions=answers.get("q10_alternative_solutions"),
-            additional_notes=answers.get("additional_notes"),
-            answered_by=answered_by,
-            tenant_id=tenant_id,
-        )
+        answer = _build_10q_answer(requirement_id, answers, answered_by, tenant_id)
 
         self.db.add(answer)
         self.db.commit()
@@ -515,3 +916,556 @@ class Requirement10QRepository:
         self.db.refresh(answer)
 
         return answer
+
+
+# ============================================================================
+# Async Repositories
+# ============================================================================
+
+class AsyncRequirementRepository:
+    """Async repository for Requirement model (AsyncSession based).
+
+    Mirrors RequirementRepository so async endpoints can query requirements
+    without blocking the event loop.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    # ========================================================================
+    # CRUD Operations
+    # ========================================================================
+
+    async def create(
+        self,
+        title: str,
+        description: str,
+        source_channel: str,
+        source_contact: Optional[str] = None,
+        moscow_priority: Optional[str] = None,
+        moscow_comment: Optional[str] = None,
+        customer_need_10q: Optional[Dict[str, Any]] = None,
+        estimated_duration_months: Optional[int] = None,
+        complexity_level: Optional[str] = None,
+        created_by: Optional[int] = None,
+        tenant_id: Optional[int] = None,
+    ) -> Requirement:
+        """
+        Create a new requirement.
+
+        Args:
+            title: Requirement title
+            description: Requirement description
+            source_channel: Source channel
+            source_contact: Source contact
+            moscow_priority: MoSCoW priority (must/should/could/wont)
+            moscow_comment: MoSCoW priority justification
+            customer_need_10q: Customer 10 questions data
+            estimated_duration_months: Estimated duration in months
+            complexity_level: Complexity level
+            created_by: User ID who created the requirement
+            tenant_id: Tenant ID (required)
+
+        Returns:
+            Created requirement
+        """
+        requirement_no = await self._generate_requirement_no()
+
+        requirement = Requirement(
+            requirement_no=requirement_no,
+            title=title,
+            description=description,
+            source_channel=source_channel,
+            source_contact=source_contact,
+            moscow_priority=moscow_priority,
+            moscow_comment=moscow_comment,
+            customer_need_10q=customer_need_10q,
+            estimated_duration_months=estimated_duration_months,
+            complexity_level=complexity_level,
+            created_by=created_by,
+            updated_by=created_by,
+            tenant_id=tenant_id,
+        )
+
+        self.db.add(requirement)
+        await self.db.commit()
+        await self.db.refresh(requirement)
+
+        return requirement
+
+    async def bulk_create(
+        self,
+        rows: List[Dict[str, Any]],
+        created_by: Optional[int] = None,
+        tenant_id: Optional[int] = None,
+    ) -> List[Tuple[int, str]]:
+        """
+        Insert many requirements (and their 10 questions answers) in batches.
+
+        Requirement numbers are reserved as one block, rows are inserted with
+        batched executemany INSERTs. Bulk INSERTs do not fire mapper events,
+        so search index rows and statistics counters are written here. Does
+        not commit.
+
+        Args:
+            rows: Requirement field dicts (see CREATE_FIELDS)
+            created_by: User ID who created the requirements
+            tenant_id: Tenant ID (required)
+
+        Returns:
+            (id, requirement_no) per row, in input order
+        """
+        if not rows:
+            return []
+
+        # Imported here: app.services imports this module
+        from app.services.sequence import REQUIREMENT_NO, AsyncSequenceService
+
+        numbers = await AsyncSequenceService(self.db).reserve_numbers(REQUIREMENT_NO, len(rows))
+        insert_stmt = insert(Requirement).returning(
+            Requirement.id, Requirement.requirement_no, sort_by_parameter_order=True
+        )
+
+        created: List[Tuple[int, str]] = []
+        counter_deltas: Counter = Counter()
+        for start in range(0, len(rows), BULK_INSERT_BATCH_SIZE):
+            batch = rows[start:start + BULK_INSERT_BATCH_SIZE]
+            values = [
+                {
+                    **{field: row.get(field) for field in CREATE_FIELDS},
+                    "requirement_no": requirement_no,
+                    "status": "collected",
+                    "created_by": created_by,
+                    "updated_by": created_by,
+                    "tenant_id": tenant_id,
+                }
+                for row, requirement_no in zip(batch, numbers[start:start + len(batch)])
+            ]
+            result = await self.db.execute(insert_stmt, values)
+            ids = [row_id for row_id, _ in result.all()]
+
+            await self.db.execute(
+                insert(RequirementSearchIndex),
+                [
+                    {
+                        "requirement_id": row_id,
+                        "tenant_id": tenant_id,
+                        "tokens": build_search_document(*(row[f] for f in SEARCH_FIELDS)),
+                    }
+                    for row_id, row in zip(ids, values)
+                ],
+            )
+
+            answers = [
+                _10q_answer_values(row_id, row["customer_need_10q"], created_by, tenant_id)
+                for row_id, row in zip(ids, values)
+                if row["customer_need_10q"]
+            ]
+            if answers:
+                await self.db.execute(insert(Requirement10QAnswer), answers)
+
+            for row in values:
+                counter_deltas.update(counter_columns(row["status"], row["source_channel"], None))
+            created.extend(zip(ids, (row["requirement_no"] for row in values)))
+
+        await self.db.run_sync(
+            lambda session: apply_counter_deltas(session.connection(), tenant_id, dict(counter_deltas))
+        )
+        return created
+
+    async def get_by_id(self, requirement_id: int) -> Optional[Requirement]:
+        """
+        Get requirement by ID.
+
+        Args:
+            requirement_id: Requirement ID
+
+        Returns:
+            Requirement or None
+        """
+        stmt = select(Requirement).where(Requirement.id == requirement_id)
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_by_no(self, requirement_no: str) -> Optional[Requirement]:
+        """
+        Get requirement by number.
+
+        Args:
+            requirement_no: Requirement number
+
+        Returns:
+            Requirement or None
+        """
+        stmt = select(Requirement).where(Requirement.requirement_no == requirement_no)
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def list(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        status: Optional[str] = None,
+        source_channel: Optional[str] = None,
+        target_type: Optional[str] = None,
+        search: Optional[str] = None,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+        exclude_reviewed: bool = False,
+        after: Optional[str] = None,
+        count_mode: str = "exact",
+    ) -> Tuple[List[Requirement], int]:
+        """
+        List requirements with filters and pagination.
+
+        Args:
+            page: Page number (1-indexed)
+            page_size: Number of items per page
+            status: Filter by status
+            source_channel: Filter by source channel
+            target_type: Filter by target type (sp/bp/charter/pcr)
+            search: Full-text search in title, requirement_no and description
+            sort_by: Sort field
+            sort_order: Sort order (asc or desc)
+            exclude_reviewed: 排除已在评审会议或有投票结果的需求
+            after: Keyset cursor from the previous page (overrides page)
+            count_mode: How the total is computed (see COUNT_MODES)
+
+        Returns:
+            Tuple of (list of requirements, total count)
+
+        Raises:
+            ValueError: If the cursor or count_mode is invalid
+        """
+        if count_mode not in COUNT_MODES:
+            raise ValueError(f"Invalid count_mode: {count_mode}")
+
+        conditions = _list_conditions(
+            status=status,
+            source_channel=source_channel,
+            target_type=target_type,
+            search=search,
+            exclude_reviewed=exclude_reviewed,
+            dialect_name=self.db.get_bind().dialect.name,
+        )
+        stmt, count_stmt = _list_statements(
+            page, page_size, conditions, sort_by, sort_order, after
+        )
+
+        if count_mode == "estimate" and _can_estimate_total(self.db, conditions):
+            total = (await self.db.execute(_ESTIMATED_ROWS_SQL)).scalar()
+            if total is not None and total >= 0:
+                requirements = (await self.db.execute(stmt)).scalars().all()
+                return list(requirements), total
+            count_mode = "window"
+
+        if count_mode == "exact":
+            total = (await self.db.execute(count_stmt)).scalar()
+            requirements = (await self.db.execute(stmt)).scalars().all()
+            return list(requirements), total
+
+        rows = (await self.db.execute(_with_window_total(stmt, count_stmt, after))).all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total_count
+
+        # Empty page past the end: the window carried no total
+        total = (await self.db.execute(count_stmt)).scalar() if (after or page > 1) else 0
+        return [], total
+
+    async def search(
+        self,
+        query: str,
+        page: int = 1,
+        page_size: int = 20,
+        status: Optional[str] = None,
+        source_channel: Optional[str] = None,
+        target_type: Optional[str] = None,
+    ) -> Tuple[List[Tuple[Requirement, float]], int]:
+        """
+        Full-text search ranked by relevance.
+
+        Args:
+            query: Search text (Chinese and/or latin)
+            page: Page number (1-indexed)
+            page_size: Number of items per page
+            status: Filter by status
+            source_channel: Filter by source channel
+            target_type: Filter by target type (sp/bp/charter/pcr)
+
+        Returns:
+            Tuple of (list of (requirement, score), total count)
+        """
+        dialect_name = self.db.get_bind().dialect.name
+        conditions = _list_conditions(
+            status=status,
+            source_channel=source_channel,
+            target_type=target_type,
+            dialect_name=dialect_name,
+        )
+
+        matches = _search_matches(query, dialect_name)
+        if matches is None:
+            # No index support: unranked substring match
+            conditions.append(_search_condition(query, dialect_name))
+            score = literal_column("0.0").label("score")
+            stmt = select(Requirement, score)
+        else:
+            score = matches.c.score
+            stmt = select(Requirement, score).join(
+                matches, matches.c.requirement_id == Requirement.id
+            )
+
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+        count_stmt = select(func.count()).select_from(stmt.subquery())
+
+        stmt = (
+            stmt.add_columns(func.count().over().label("total_count"))
+            .order_by(score.desc(), Requirement.id.desc())
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+        )
+
+        rows = (await self.db.execute(stmt)).all()
+        if rows:
+            return [(row[0], float(row[1] or 0)) for row in rows], rows[0].total_count
+
+        total = (await self.db.execute(count_stmt)).scalar() if page > 1 else 0
+        return [], total
+
+    async def update(
+        self,
+        requirement: Requirement,
+        **updates
+    ) -> Requirement:
+        """
+        Update requirement.
+
+        Args:
+            requirement: Requirement to update
+            **updates: Fields to update
+
+        Returns:
+            Updated requirement
+        """
+        for key, value in updates.items():
+            if hasattr(requirement, key):
+                setattr(requirement, key, value)
+
+        requirement.updated_at = datetime.utcnow()
+
+        await self.db.commit()
+        await self.db.refresh(requirement)
+
+        return requirement
+
+    async def delete(self, requirement: Requirement) -> None:
+        """
+        Delete requirement.
+
+        Args:
+            requirement: Requirement to delete
+        """
+        await self.db.delete(requirement)
+        await self.db.commit()
+
+    # ========================================================================
+    # Status Operations
+    # ========================================================================
+
+    async def update_status(
+        self,
+        requirement: Requirement,
+        new_status: str,
+        updated_by: Optional[int] = None,
+    ) -> Requirement:
+        """
+        Update requirement status (flush only, caller commits).
+
+        Args:
+            requirement: Requirement to update
+            new_status: New status
+            updated_by: User ID who updated the status
+
+        Returns:
+            Updated requirement
+        """
+        requirement.status = new_status
+        requirement.updated_by = updated_by
+        requirement.updated_at = datetime.utcnow()
+
+        await self.db.flush()
+        await self.db.refresh(requirement)
+
+        return requirement
+
+    # ========================================================================
+    # Statistics
+    # ========================================================================
+
+    async def get_stats_by_status(self) -> Dict[str, int]:
+        """
+        Get requirement count grouped by status.
+
+        Note: 'implementing' status includes requirements that are distributed
+        with target_type='charter' (i.e., requirements in development page).
+
+        Returns:
+            Dictionary with status counts
+        """
+        stmt = (
+            select(Requirement.status, func.count(Requirement.id))
+            .group_by(Requirement.status)
+        )
+
+        result = (await self.db.execute(stmt)).all()
+
+        stats = _empty_status_stats()
+        for status, count in result:
+            if status in stats:
+                stats[status] = count
+
+        distributed_charter_count = (
+            await self.db.execute(_distributed_charter_count_stmt)
+        ).scalar() or 0
+        stats["implementing"] = distributed_charter_count
+
+        return stats
+
+    async def get_stats_by_channel(self) -> Dict[str, int]:
+        """
+        Get requirement count grouped by source channel.
+
+        Returns:
+            Dictionary with channel counts
+        """
+        stmt = (
+            select(Requirement.source_channel, func.count(Requirement.id))
+            .group_by(Requirement.source_channel)
+        )
+
+        result = (await self.db.execute(stmt)).all()
+
+        stats = _empty_channel_stats()
+        for channel, count in result:
+            if channel in stats:
+                stats[channel] = count
+
+        return stats
+
+    async def get_total_count(self) -> int:
+        """
+        Get total requirement count.
+
+        Returns:
+            Total count
+        """
+        stmt = select(func.count(Requirement.id))
+        return (await self.db.execute(stmt)).scalar()
+
+    async def get_stats_summary(self, tenant_id: int) -> Optional[RequirementStats]:
+        """
+        Get the maintained statistics counters of a tenant (primary-key read).
+
+        Args:
+            tenant_id: Tenant ID
+
+        Returns:
+            RequirementStats row or None if the tenant has no counters yet
+        """
+        return await self.db.get(RequirementStats, tenant_id, populate_existing=True)
+
+    # ========================================================================
+    # Helper Methods
+    # ========================================================================
+
+    async def _generate_requirement_no(self) -> str:
+        """
+        Generate unique requirement number.
+
+        Format: REQ-YYYY-XXXX (4 digit sequential number), allocated from
+        the business sequence counter.
+
+        Returns:
+            Requirement number
+        """
+        # Imported here: app.services imports this module
+        from app.services.sequence import REQUIREMENT_NO, AsyncSequenceService
+
+        return await AsyncSequenceService(self.db).next_number(REQUIREMENT_NO)
+
+
+class AsyncRequirement10QRepository:
+    """Async repository for Requirement10QAnswer model."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(
+        self,
+        requirement_id: int,
+        answers: Dict[str, Any],
+        answered_by: Optional[int] = None,
+        tenant_id: Optional[int] = None,
+    ) -> Requirement10QAnswer:
+        """
+        Create 10 questions answer.
+
+        Args:
+            requirement_id: Requirement ID
+            answers: Answers dict
+            answered_by: User ID who answered
+            tenant_id: Tenant ID (required)
+
+        Returns:
+            Created answer record
+        """
+        answer = _build_10q_answer(requirement_id, answers, answered_by, tenant_id)
+
+        self.db.add(answer)
+        await self.db.commit()
+        await self.db.refresh(answer)
+
+        return answer
+
+    async def get_by_requirement_id(
+        self, requirement_id: int
+    ) -> Optional[Requirement10QAnswer]:
+        """
+        Get 10 questions answer by requirement ID.
+
+        Args:
+            requirement_id: Requirement ID
+
+        Returns:
+            Answer record or None
+        """
+        stmt = select(Requirement10QAnswer).where(
+            Requirement10QAnswer.requirement_id == requirement_id
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def update(
+        self,
+        answer: Requirement10QAnswer,
+        updates: Dict[str, Any],
+    ) -> Requirement10QAnswer:
+        """
+        Update 10 questions answer.
+
+        Args:
+            answer: Answer record to update
+            updates: Fields to update
+
+        Returns:
+            Updated answer record
+        """
+        for key, value in updates.items():
+            if hasattr(answer, key) and value is not None:
+                setattr(answer, key, value)
+
+        await self.db.commit()
+        await self.db.refresh(answer)
+
+        return answer
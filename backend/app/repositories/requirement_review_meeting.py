@@ -1,17 +1,91 @@
 """Requirement review meeting repository for data access."""
+import time
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from itertools import groupby
+from typing import Optional, List, Dict, Any, FrozenSet, Tuple
 
-from sqlalchemy.orm import Session
-from sqlalchemy import select, func, desc, and_, or_, Integer
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy import select, func, desc, and_, or_, case, exists, insert, literal, Integer
 from sqlalchemy.exc import IntegrityError
 
+from app.config import get_settings
+from app.db.dialects import dialect_insert, json_array_contains, json_array_length, supports_on_conflict
 from app.models.requirement_review_meeting import RequirementReviewMeeting
 from app.models.requirement_review_meeting_attendee import RequirementReviewMeetingAttendee
 from app.models.requirement_review_meeting_requirement import RequirementReviewMeetingRequirement
 from app.models.requirement_review_vote import RequirementReviewVote
 from app.models.vote_result import VoteResult
 from app.models.requirement import Requirement
+from app.models.user import User
+
+settings = get_settings()
+
+VOTE_OPTIONS = ("approve", "reject", "abstain")
+
+# meeting_id -> (cached at, attendee user IDs)
+_attendee_cache: Dict[int, Tuple[float, FrozenSet[int]]] = {}
+
+
+def invalidate_meeting_attendees(meeting_id: Optional[int] = None) -> None:
+    """Drop the cached attendee set of a meeting (or of all meetings)."""
+    if meeting_id is None:
+        _attendee_cache.clear()
+    else:
+        _attendee_cache.pop(meeting_id, None)
+
+
+def _cached_attendees(meeting_id: int) -> Optional[FrozenSet[int]]:
+    cached = _attendee_cache.get(meeting_id)
+    if cached is not None and time.monotonic() - cached[0] < settings.MEETING_ATTENDEE_CACHE_TTL:
+        return cached[1]
+    return None
+
+
+def _empty_vote_statistics(requirement_id: int, assigned_voter_ids: Optional[List[int]]) -> Dict[str, Any]:
+    """Vote statistics of a requirement before any vote is counted."""
+    stats = {"requirement_id": requirement_id, "total_votes": 0}
+    for option in VOTE_OPTIONS:
+        stats[f"{option}_count"] = 0
+        stats[f"{option}_percentage"] = 0.0
+    stats.update({
+        "votes": [],
+        # 投票完成状态字段
+        "total_assigned_voters": len(assigned_voter_ids) if assigned_voter_ids else 0,
+        "voted_count": 0,
+        "is_voting_complete": False
+    })
+    return stats
+
+
+def _finish_vote_statistics(stats: Dict[str, Any], assigned_voter_ids: Optional[List[int]]) -> Dict[str, Any]:
+    """Fill in percentages and completion status from the counts."""
+    if stats["total_votes"] > 0:
+        for option in VOTE_OPTIONS:
+            stats[f"{option}_percentage"] = round(stats[f"{option}_count"] * 100.0 / stats["total_votes"], 1)
+    if assigned_voter_ids:
+        stats["is_voting_complete"] = stats["voted_count"] >= len(assigned_voter_ids)
+    return stats
+
+
+def _vote_item(voter_id: int, voter_name: Optional[str], vote_option: str,
+               comment: Optional[str], voted_at: Any) -> Dict[str, Any]:
+    """One entry of the statistics' vote list."""
+    # Handle datetime serialization (SQLite returns strings, PostgreSQL returns datetime)
+    voted_at_str = None
+    if voted_at:
+        if isinstance(voted_at, str):
+            voted_at_str = voted_at
+        else:
+            voted_at_str = voted_at.isoformat()
+
+    return {
+        "voter_id": voter_id,
+        "voter_name": voter_name or f"User{voter_id}",
+        "vote_option": vote_option,
+        "comment": comment,
+        "voted_at": voted_at_str
+    }
 
 
 class RequirementReviewMeetingRepository:
@@ -128,6 +202,7 @@ class RequirementReviewMeetingRepository:
 
             # Step 3: Commit transaction
             self.db.commit()
+            invalidate_meeting_attendees(meeting.id)
 
             # Step 4: Log deletion summary
             total_deleted = sum(deletion_counts.values())
@@ -155,31 +230,6 @@ class RequirementReviewMeetingRepository:
             RequirementReviewMeeting.created_at < next_day
         ).count()
 
-    def get_max_meeting_no(self, tenant_id: int, prefix: str) -> Optional[int]:
-        """Get the maximum meeting number for a given date prefix.
-
-        Compatible with both SQLite and PostgreSQL.
-        """
-        # Query all meetings with the given prefix
-        meetings = self.db.query(RequirementReviewMeeting).filter(
-            RequirementReviewMeeting.tenant_id == tenant_id,
-            RequirementReviewMeeting.meeting_no.like(f"{prefix}-%")
-        ).all()
-
-        max_no = 0
-        for meeting in meetings:
-            if meeting.meeting_no:
-                # Parse meeting_no format: "RM-20260204-002"
-                parts = meeting.meeting_no.split('-')
-                if len(parts) >= 3:
-                    try:
-                        no = int(parts[2])
-                        max_no = max(max_no, no)
-                    except (ValueError, IndexError):
-                        continue
-
-        return max_no
-
     # ========================================================================
     # Attendee Operations
     # ========================================================================
@@ -200,6 +250,7 @@ class RequirementReviewMeetingRepository:
         )
         self.db.add(attendee)
         self.db.commit()
+        invalidate_meeting_attendees(meeting_id)
         self.db.refresh(attendee)
         return attendee
 
@@ -220,6 +271,7 @@ class RequirementReviewMeetingRepository:
             # 再删除参会人员
             self.db.delete(attendee)
             self.db.commit()
+            invalidate_meeting_attendees(meeting_id)
             return True
         return False
 
@@ -245,6 +297,72 @@ class RequirementReviewMeetingRepository:
             # 移除 attendance_status 过滤条件
         ).first()
 
+    def get_vote_eligibility(
+        self,
+        meeting_id: int,
+        tenant_id: int,
+        requirement_id: Optional[int],
+        user_id: int
+    ) -> Optional[Dict[str, Any]]:
+        """Everything the vote endpoint checks, in one query.
+
+        The meeting's attendee set is cached for MEETING_ATTENDEE_CACHE_TTL
+        seconds (cleared by add_attendee / remove_attendee). On a cache miss
+        the attendees are left-joined into the same query to fill the cache.
+
+        Returns:
+            {"status", "is_attendee", "is_assigned_voter", "has_voted"},
+            or None if the meeting does not exist in the tenant.
+            is_assigned_voter is true when the requirement is in the meeting
+            and has no assigned voters or lists the user.
+        """
+        Vote = RequirementReviewVote
+        dialect_name = self.db.get_bind().dialect.name
+        assigned = RequirementReviewMeetingRequirement.assigned_voter_ids
+
+        stmt = select(
+            RequirementReviewMeeting.status,
+            exists().where(
+                RequirementReviewMeetingRequirement.meeting_id == meeting_id,
+                RequirementReviewMeetingRequirement.requirement_id == requirement_id,
+                or_(
+                    json_array_length(dialect_name, assigned) == 0,
+                    json_array_contains(dialect_name, assigned, user_id)
+                )
+            ).label("is_assigned_voter"),
+            exists().where(
+                Vote.meeting_id == meeting_id,
+                Vote.requirement_id == requirement_id,
+                Vote.voter_id == user_id
+            ).label("has_voted")
+        ).where(
+            RequirementReviewMeeting.id == meeting_id,
+            RequirementReviewMeeting.tenant_id == tenant_id
+        )
+
+        attendees = _cached_attendees(meeting_id)
+        if attendees is None:
+            stmt = stmt.add_columns(RequirementReviewMeetingAttendee.attendee_id).outerjoin(
+                RequirementReviewMeetingAttendee,
+                RequirementReviewMeetingAttendee.meeting_id == RequirementReviewMeeting.id
+            )
+
+        rows = self.db.execute(stmt).all()
+        if not rows:
+            return None
+
+        if attendees is None:
+            attendees = frozenset(row.attendee_id for row in rows if row.attendee_id is not None)
+            _attendee_cache[meeting_id] = (time.monotonic(), attendees)
+
+        row = rows[0]
+        return {
+            "status": row.status,
+            "is_attendee": user_id in attendees,
+            "is_assigned_voter": bool(row.is_assigned_voter),
+            "has_voted": bool(row.has_voted)
+        }
+
     # ========================================================================
     # Meeting Requirement Operations
     # ========================================================================
@@ -305,29 +423,12 @@ class RequirementReviewMeetingRepository:
     def get_requirements(self, meeting_id: int) -> List[RequirementReviewMeetingRequirement]:
         """Get all requirements for a meeting (ordered by review_order)."""
         from sqlalchemy.orm import joinedload
-        from sqlalchemy.exc import SQLAlchemyError
 
-        try:
-            result = self.db.query(RequirementReviewMeetingRequirement).options(
-                joinedload(RequirementReviewMeetingRequirement.requirement)
-            ).filter(
-                RequirementReviewMeetingRequirement.meeting_id == meeting_id
-            ).order_by(RequirementReviewMeetingRequirement.review_order).all()
-
-            # 打印调试信息
-            for req in result:
-                print(f"MeetingRequirement: id={req.id}, requirement_id={req.requirement_id}, has_requirement={req.requirement is not None}")
-                if req.requirement:
-                    print(f"  -> requirement: {req.requirement.requirement_no}")
-
-            return result
-        except SQLAlchemyError as e:
-            print(f"SQLAlchemy Error in get_requirements: {e}")
-            # 重新抛出，让API层处理
-            raise
-        except Exception as e:
-            print(f"Unexpected Error in get_requirements: {e}")
-            raise
+        return self.db.query(RequirementReviewMeetingRequirement).options(
+            joinedload(RequirementReviewMeetingRequirement.requirement)
+        ).filter(
+            RequirementReviewMeetingRequirement.meeting_id == meeting_id
+        ).order_by(RequirementReviewMeetingRequirement.review_order).all()
 
     # ========================================================================
     # Vote Operations (with Upsert)
@@ -342,44 +443,44 @@ class RequirementReviewMeetingRepository:
         vote_option: str,
         comment: Optional[str] = None
     ) -> RequirementReviewVote:
-        """Cast or update a vote (upsert using database constraint)."""
+        """Cast or update a vote (upsert using database constraint).
 
-        # 使用 ORM 实现兼容 SQLite 和 PostgreSQL 的 upsert
-        from sqlalchemy import text
+        One INSERT ... ON CONFLICT (meeting_id, requirement_id, voter_id)
+        DO UPDATE ... RETURNING on PostgreSQL and SQLite, so concurrent first
+        votes of the same user cannot race on uq_meeting_requirement_voter.
 
-        # 先尝试查询现有投票
-        existing_vote = self.db.query(RequirementReviewVote).filter(
-            RequirementReviewVote.meeting_id == meeting_id,
-            RequirementReviewVote.requirement_id == requirement_id,
-            RequirementReviewVote.voter_id == voter_id
-        ).first()
+        Returns:
+            The stored vote as a detached instance with all columns loaded
+        """
+        dialect_name = self.db.get_bind().dialect.name
+        stmt = dialect_insert(dialect_name, RequirementReviewVote).values(
+            meeting_id=meeting_id,
+            requirement_id=requirement_id,
+            voter_id=voter_id,
+            tenant_id=tenant_id,
+            vote_option=vote_option,
+            comment=comment
+        )
+        if supports_on_conflict(dialect_name):
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["meeting_id", "requirement_id", "voter_id"],
+                set_={
+                    "vote_option": stmt.excluded.vote_option,
+                    "comment": stmt.excluded.comment,
+                    # ON CONFLICT DO UPDATE 不会触发 onupdate
+                    "updated_at": func.now()
+                }
+            )
 
-        now = datetime.utcnow()
+        row = self.db.execute(
+            stmt.returning(*RequirementReviewVote.__table__.columns)
+        ).mappings().one()
+        self.db.commit()
 
-        if existing_vote:
-            # 更新现有投票
-            existing_vote.vote_option = vote_option
-            existing_vote.comment = comment
-            existing_vote.updated_at = now
-            self.db.commit()
-            self.db.refresh(existing_vote)
-            return existing_vote
-        else:
-            # 创建新投票
-            vote = RequirementReviewVote(
-                meeting_id=meeting_id,
-                requirement_id=requirement_id,
-                voter_id=voter_id,
-                tenant_id=tenant_id,
-                vote_option=vote_option,
-                comment=comment,
-                created_at=now,
-                updated_at=now
-            )
-            self.db.add(vote)
-            self.db.commit()
-            self.db.refresh(vote)
-            return vote
+        # 由 RETURNING 的结果构造对象，避免 commit 过期后再 SELECT 刷新
+        vote = RequirementReviewVote(**row)
+        make_transient_to_detached(vote)
+        return vote
 
     def get_votes(self, meeting_id: int, requirement_id: int) -> List[RequirementReviewVote]:
         """Get all votes for a specific meeting requirement."""
@@ -396,8 +497,6 @@ class RequirementReviewMeetingRepository:
         """Get aggregated vote statistics with user information and completion status."""
 
         from sqlalchemy import text
-        from app.models.user import User
-        from app.models.requirement_review_meeting_requirement import RequirementReviewMeetingRequirement
 
         # 获取会议需求关联记录（用于计算投票完成度）
         meeting_req = self.db.query(RequirementReviewMeetingRequirement).filter(
@@ -427,69 +526,93 @@ class RequirementReviewMeetingRepository:
             "requirement_id": requirement_id
         })
 
-        # 初始化统计
-        stats = {
-            "requirement_id": requirement_id,
-            "total_votes": 0,
-            "approve_count": 0,
-            "approve_percentage": 0.0,
-            "reject_count": 0,
-            "reject_percentage": 0.0,
-            "abstain_count": 0,
-            "abstain_percentage": 0.0,
-            "votes": [],
-            # 投票完成状态字段
-            "total_assigned_voters": len(assigned_voter_ids) if assigned_voter_ids else 0,
-            "voted_count": 0,
-            "is_voting_complete": False
-        }
-
-        votes_list = []
+        stats = _empty_vote_statistics(requirement_id, assigned_voter_ids)
         voted_voter_ids = set()
 
-        for row in result:
-            vote_option = row[0]
-            voter_id = row[1]
-            voter_name = row[2]
-            comment = row[3]
-            voted_at = row[4]
-
+        for vote_option, voter_id, voter_name, comment, voted_at in result:
             stats["total_votes"] += 1
             stats[f"{vote_option}_count"] += 1
 
             # 记录已投票的用户ID
             voted_voter_ids.add(voter_id)
+            stats["votes"].append(_vote_item(voter_id, voter_name, vote_option, comment, voted_at))
 
-            # Handle datetime serialization (SQLite returns strings, PostgreSQL returns datetime)
-            voted_at_str = None
-            if voted_at:
-                if isinstance(voted_at, str):
-                    voted_at_str = voted_at
-                else:
-                    voted_at_str = voted_at.isoformat()
-
-            votes_list.append({
-                "voter_id": voter_id,
-                "voter_name": voter_name or f"User{voter_id}",
-                "vote_option": vote_option,
-                "comment": comment,
-                "voted_at": voted_at_str
-            })
+        stats["voted_count"] = len(voted_voter_ids)
+        return _finish_vote_statistics(stats, assigned_voter_ids)
 
-        # 计算百分比
-        if stats["total_votes"] > 0:
-            stats["approve_percentage"] = round(stats["approve_count"] * 100.0 / stats["total_votes"], 1)
-            stats["reject_percentage"] = round(stats["reject_count"] * 100.0 / stats["total_votes"], 1)
-            stats["abstain_percentage"] = round(stats["abstain_count"] * 100.0 / stats["total_votes"], 1)
+    def get_meeting_vote_statistics(self, meeting_id: int, tenant_id: int) -> List[Dict[str, Any]]:
+        """Get vote statistics for every requirement of a meeting.
 
-        # 计算投票完成状态
-        stats["voted_count"] = len(voted_voter_ids)
-        if assigned_voter_ids:
-            stats["is_voting_complete"] = stats["voted_count"] >= len(assigned_voter_ids)
+        Tallies come from one query (meeting requirements LEFT JOIN votes
+        grouped by requirement), the vote lists from one votes-with-users
+        query, so the cost does not grow with the number of requirements.
+
+        Returns:
+            One get_vote_statistics() dict per meeting requirement, in review order
+        """
+        Vote = RequirementReviewVote
+        tallies = select(
+            Vote.requirement_id,
+            func.count(Vote.id).label("total_votes"),
+            func.count(func.distinct(Vote.voter_id)).label("voted_count"),
+            *(
+                func.sum(case((Vote.vote_option == option, 1), else_=0)).label(f"{option}_count")
+                for option in VOTE_OPTIONS
+            ),
+        ).where(
+            Vote.meeting_id == meeting_id,
+            Vote.tenant_id == tenant_id
+        ).group_by(Vote.requirement_id).subquery()
+
+        rows = self.db.execute(
+            select(
+                RequirementReviewMeetingRequirement.requirement_id,
+                RequirementReviewMeetingRequirement.assigned_voter_ids,
+                tallies.c.total_votes,
+                tallies.c.voted_count,
+                *(tallies.c[f"{option}_count"] for option in VOTE_OPTIONS),
+            ).outerjoin(
+                tallies, tallies.c.requirement_id == RequirementReviewMeetingRequirement.requirement_id
+            ).where(
+                RequirementReviewMeetingRequirement.meeting_id == meeting_id,
+                RequirementReviewMeetingRequirement.tenant_id == tenant_id
+            ).order_by(
+                RequirementReviewMeetingRequirement.review_order,
+                RequirementReviewMeetingRequirement.id
+            )
+        ).all()
 
-        stats["votes"] = votes_list
+        if not rows:
+            return []
+
+        statistics = {}
+        for row in rows:
+            stats = _empty_vote_statistics(row.requirement_id, row.assigned_voter_ids)
+            for key in ("total_votes", "voted_count", *(f"{option}_count" for option in VOTE_OPTIONS)):
+                stats[key] = getattr(row, key) or 0
+            statistics[row.requirement_id] = _finish_vote_statistics(stats, row.assigned_voter_ids)
+
+        votes = self.db.execute(
+            select(
+                Vote.requirement_id,
+                Vote.voter_id,
+                User.username,
+                Vote.vote_option,
+                Vote.comment,
+                Vote.created_at
+            ).outerjoin(
+                User, Vote.voter_id == User.id
+            ).where(
+                Vote.meeting_id == meeting_id,
+                Vote.tenant_id == tenant_id
+            ).order_by(Vote.created_at.desc(), Vote.id.desc())
+        )
+        for requirement_id, voter_id, voter_name, vote_option, comment, voted_at in votes:
+            stats = statistics.get(requirement_id)
+            if stats is not None:
+                stats["votes"].append(_vote_item(voter_id, voter_name, vote_option, comment, voted_at))
 
-        return stats
+        return list(statistics.values())
 
     def get_user_vote(
         self,
@@ -631,24 +754,37 @@ class RequirementReviewMeetingRepository:
         self.db.add(vote_result)
         self.db.commit()
 
-    def archive_meeting_results(self, meeting_id: int, tenant_id: int) -> None:
-        """Archive all vote results for a meeting."""
-        # 获取会议的所有需求
-        requirements = self.get_requirements(meeting_id)
-
-        for req in requirements:
-            if req.requirement:  # 确保需求存在
-                # 获取投票统计
-                stats = self.get_vote_statistics(meeting_id, req.requirement_id)
-
-                # 存档投票结果
-                self.archive_vote_result(
-                    meeting_id=meeting_id,
-                    requirement_id=req.requirement_id,
-                    requirement_title=req.requirement.title,
-                    vote_statistics=stats,
-                    tenant_id=tenant_id
-                )
+    def archive_meeting_results(self, meeting_id: int, tenant_id: int, commit: bool = True) -> None:
+        """Archive all vote results for a meeting.
+
+        Args:
+            meeting_id: 会议ID
+            tenant_id: 租户ID
+            commit: False 时由调用方提交（与结束会议在同一事务中）
+        """
+        statistics = self.get_meeting_vote_statistics(meeting_id, tenant_id)
+        if not statistics:
+            return
+
+        titles = dict(self.db.execute(
+            select(Requirement.id, Requirement.title).where(
+                Requirement.id.in_([stats["requirement_id"] for stats in statistics])
+            )
+        ).all())
+
+        # executemany 插入，不逐行 RETURNING
+        self.db.execute(insert(VoteResult), [
+            {
+                "meeting_id": meeting_id,
+                "requirement_id": stats["requirement_id"],
+                "requirement_title": titles.get(stats["requirement_id"]),
+                "vote_statistics": stats,
+                "tenant_id": tenant_id
+            }
+            for stats in statistics
+        ])
+        if commit:
+            self.db.commit()
 
     def get_vote_results(
         self,
@@ -725,9 +861,28 @@ class RequirementReviewMeetingRepository:
     # Pending Voters Management (Auto Abstain)
     # ========================================================================
 
+    def _effective_voters_join(self):
+        """Join condition of meeting requirements to their effective voters.
+
+        指定了投票人的需求只由其中的参会者投票，否则所有参会者都是投票人
+        （与 get_voter_status 一致，非参会者不计入）。
+        """
+        dialect_name = self.db.get_bind().dialect.name
+        assigned = RequirementReviewMeetingRequirement.assigned_voter_ids
+        return and_(
+            RequirementReviewMeetingAttendee.meeting_id == RequirementReviewMeetingRequirement.meeting_id,
+            or_(
+                json_array_length(dialect_name, assigned) == 0,
+                json_array_contains(dialect_name, assigned, RequirementReviewMeetingAttendee.attendee_id)
+            )
+        )
+
     def get_all_pending_voters(self, meeting_id: int) -> Dict[str, Any]:
         """获取会议中所有需求的未投票人员统计.
 
+        One query: meeting requirements joined with their effective voters
+        and left-joined with the votes, grouped by requirement in Python.
+
         Returns:
             {
                 "total_requirements": 3,
@@ -748,96 +903,62 @@ class RequirementReviewMeetingRepository:
                 ]
             }
         """
-        requirements = self.get_requirements(meeting_id)
-
-        # 获取会议的所有参会者ID和信息
-        from app.models.requirement_review_meeting import RequirementReviewMeeting
-        from app.models.user import User
-        from app.models.requirement_review_vote import RequirementReviewVote
-
-        meeting = self.db.query(RequirementReviewMeeting).filter(
-            RequirementReviewMeeting.id == meeting_id
-        ).first()
-
-        if not meeting:
-            return {
-                "total_requirements": 0,
-                "requirements": []
-            }
-
-        # 获取所有参会者ID和用户信息
-        all_attendee_ids = [attendee.attendee_id for attendee in meeting.attendees]
-        attendee_users = {
-            attendee.attendee_id: attendee.attendee
-            for attendee in meeting.attendees
-        }
+        Vote = RequirementReviewVote
+        rows = self.db.execute(
+            select(
+                RequirementReviewMeetingRequirement.requirement_id,
+                Requirement.title,
+                User.id.label("voter_id"),
+                User.username,
+                User.full_name,
+                Vote.id.label("vote_id")
+            ).join(
+                Requirement, Requirement.id == RequirementReviewMeetingRequirement.requirement_id
+            ).outerjoin(
+                RequirementReviewMeetingAttendee, self._effective_voters_join()
+            ).outerjoin(
+                User, User.id == RequirementReviewMeetingAttendee.attendee_id
+            ).outerjoin(
+                Vote, and_(
+                    Vote.meeting_id == RequirementReviewMeetingRequirement.meeting_id,
+                    Vote.requirement_id == RequirementReviewMeetingRequirement.requirement_id,
+                    Vote.voter_id == User.id
+                )
+            ).where(
+                RequirementReviewMeetingRequirement.meeting_id == meeting_id
+            ).order_by(
+                RequirementReviewMeetingRequirement.review_order,
+                RequirementReviewMeetingRequirement.id,
+                RequirementReviewMeetingAttendee.id
+            )
+        ).all()
 
         result = {
             "total_requirements": 0,
             "requirements": []
         }
 
-        for req in requirements:
-            if not req.requirement:
-                continue
-
+        for (requirement_id, title), voters in groupby(rows, key=lambda row: (row.requirement_id, row.title)):
             result["total_requirements"] += 1
-
-            # 确定投票人员：如果未设置指定投票人，则所有参会者都是投票人
-            voter_ids = req.assigned_voter_ids if req.assigned_voter_ids else all_attendee_ids
-
-            # 如果没有投票人，跳过该需求
-            if not voter_ids:
+            # 外连接：没有投票人的需求只有一行 voter_id 为空的记录
+            voters = [row for row in voters if row.voter_id is not None]
+            if not voters:
                 continue
 
-            # 获取该需求的投票记录
-            votes = self.db.query(RequirementReviewVote).filter(
-                RequirementReviewVote.meeting_id == meeting_id,
-                RequirementReviewVote.requirement_id == req.requirement_id
-            ).all()
-
-            # 创建投票映射
-            vote_map = {vote.voter_id: vote for vote in votes}
-
-            # 构建投票人员状态列表（只包含voter_ids范围内的）
-            voters = []
-            for voter_id in voter_ids:
-                user = attendee_users.get(voter_id)
-                if not user:
-                    continue
-
-                vote = vote_map.get(voter_id)
-                has_voted = vote is not None
-
-                voters.append({
-                    "attendee_id": voter_id,
-                    "username": user.username,
-                    "full_name": user.full_name,
-                    "has_voted": has_voted,
-                    "vote_option": vote.vote_option if vote else None,
-                    "voted_at": vote.updated_at if vote else None
-                })
-
-            # 找出未投票人员
-            pending_voters = [
-                {
-                    "voter_id": v["attendee_id"],
-                    "voter_name": v["username"],
-                    "full_name": v.get("full_name")
-                }
-                for v in voters
-                if not v["has_voted"]
-            ]
-
-            # 计算投票统计
-            voted_count = sum(1 for v in voters if v["has_voted"])
-
             result["requirements"].append({
-                "requirement_id": req.requirement_id,
-                "requirement_title": req.requirement.title,
+                "requirement_id": requirement_id,
+                "requirement_title": title,
                 "total_assigned": len(voters),
-                "voted_count": voted_count,
-                "pending_voters": pending_voters
+                "voted_count": sum(1 for row in voters if row.vote_id is not None),
+                "pending_voters": [
+                    {
+                        "voter_id": row.voter_id,
+                        "voter_name": row.username,
+                        "full_name": row.full_name
+                    }
+                    for row in voters
+                    if row.vote_id is None
+                ]
             })
 
         return result
@@ -845,10 +966,20 @@ class RequirementReviewMeetingRepository:
     def create_abstain_votes_for_pending_voters(
         self,
         meeting_id: int,
-        tenant_id: int
-    ) -> Dict[str, int]:
+        tenant_id: int,
+        commit: bool = True
+    ) -> Dict[str, Any]:
         """为所有未投票人员自动创建弃权票.
 
+        A single INSERT ... SELECT over the meeting requirements' effective
+        voters without a vote; ON CONFLICT (meeting_id, requirement_id,
+        voter_id) DO NOTHING skips votes cast concurrently.
+
+        Args:
+            meeting_id: 会议ID
+            tenant_id: 租户ID
+            commit: False 时由调用方提交（与结束会议在同一事务中）
+
         Returns:
             {
                 "total_votes_created": 10,
@@ -858,91 +989,39 @@ class RequirementReviewMeetingRepository:
                 }
             }
         """
-        requirements = self.get_requirements(meeting_id)
-
-        # 获取会议的所有参会者ID和信息
-        from app.models.requirement_review_meeting import RequirementReviewMeeting
-        from app.models.requirement_review_vote import RequirementReviewVote
+        Vote = RequirementReviewVote
+        dialect_name = self.db.get_bind().dialect.name
+
+        pending = select(
+            RequirementReviewMeetingRequirement.meeting_id,
+            RequirementReviewMeetingRequirement.requirement_id,
+            RequirementReviewMeetingAttendee.attendee_id,
+            literal(tenant_id),
+            literal("abstain"),
+            literal("会议结束时自动弃权")
+        ).join(
+            RequirementReviewMeetingAttendee, self._effective_voters_join()
+        ).where(
+            RequirementReviewMeetingRequirement.meeting_id == meeting_id,
+            ~exists().where(
+                Vote.meeting_id == RequirementReviewMeetingRequirement.meeting_id,
+                Vote.requirement_id == RequirementReviewMeetingRequirement.requirement_id,
+                Vote.voter_id == RequirementReviewMeetingAttendee.attendee_id
+            )
+        )
 
-        meeting = self.db.query(RequirementReviewMeeting).filter(
-            RequirementReviewMeeting.id == meeting_id
-        ).first()
+        stmt = dialect_insert(dialect_name, Vote).from_select(
+            ["meeting_id", "requirement_id", "voter_id", "tenant_id", "vote_option", "comment"],
+            pending
+        )
+        if supports_on_conflict(dialect_name):
+            stmt = stmt.on_conflict_do_nothing(index_elements=["meeting_id", "requirement_id", "voter_id"])
 
-        if not meeting:
-            return {"total_votes_created": 0, "by_requirement": {}}
+        by_requirement = Counter(self.db.execute(stmt.returning(Vote.requirement_id)).scalars())
+        if commit:
+            self.db.commit()
 
-        # 获取所有参会者ID和用户信息
-        all_attendee_ids = [attendee.attendee_id for attendee in meeting.attendees]
-        attendee_users = {
-            attendee.attendee_id: attendee.attendee
-            for attendee in meeting.attendees
+        return {
+            "total_votes_created": sum(by_requirement.values()),
+            "by_requirement": dict(by_requirement)
         }
-
-        stats = {"total_votes_created": 0, "by_requirement": {}}
-
-        for req in requirements:
-            if not req.requirement:
-                continue
-
-            # 确定投票人员：如果未设置指定投票人，则所有参会者都是投票人
-            voter_ids = req.assigned_voter_ids if req.assigned_voter_ids else all_attendee_ids
-
-            # 如果没有投票人，跳过该需求
-            if not voter_ids:
-                continue
-
-            # 获取该需求的投票记录
-            votes = self.db.query(RequirementReviewVote).filter(
-                RequirementReviewVote.meeting_id == meeting_id,
-                RequirementReviewVote.requirement_id == req.requirement_id
-            ).all()
-
-            # 创建投票映射
-            vote_map = {vote.voter_id: vote for vote in votes}
-
-            # 找出未投票人员（仅统计投票人范围内的）
-            pending_voters = []
-            for voter_id in voter_ids:
-                user = attendee_users.get(voter_id)
-                if not user:
-                    continue
-
-                # 如果该投票人没有投票记录，则是未投票人员
-                if voter_id not in vote_map:
-                    pending_voters.append({
-                        "attendee_id": voter_id,
-                        "username": user.username,
-                        "full_name": user.full_name
-                    })
-
-            if not pending_voters:
-                continue
-
-            # 为每个未投票人员创建弃权票
-            votes_created = 0
-            for voter in pending_voters:
-                try:
-                    self.cast_vote(
-                        meeting_id=meeting_id,
-                        requirement_id=req.requirement_id,
-                        voter_id=voter["attendee_id"],
-                        tenant_id=tenant_id,
-                        vote_option="abstain",
-                        comment="会议结束时自动弃权"
-                    )
-                    votes_created += 1
-                except Exception as e:
-                    # 记录错误但继续处理其他人员
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.error(
-                        f"创建弃权票失败 (meeting_id={meeting_id}, "
-                        f"requirement_id={req.requirement_id}, "
-                        f"voter_id={voter['attendee_id']}): {str(e)}"
-                    )
-
-            stats["by_requirement"][req.requirement_id] = votes_created
-            stats["total_votes_created"] += votes_created
-
-        return stats
-
@@ -1,4 +1,5 @@
 """Import/Export schemas for Pydantic validation."""
+from datetime import datetime
 from typing import Optional, List, Dict, Any
 
 from pydantic import BaseModel, Field, ConfigDict
@@ -32,7 +33,7 @@ class ImportJobResponse(BaseModel):
     success_count: Optional[int]
     failed_count: Optional[int]
     error_log: Optional[Dict[str, Any]]
-    created_at: str
+    created_at: datetime
     started_at: Optional[int]
     completed_at: Optional[int]
 
@@ -42,7 +43,12 @@ class ExportRequest(BaseModel):
     """Schema for export request."""
 
     export_type: str = Field(
-        ..., pattern="^(excel|pdf|csv)$", description="Export format"
+        ..., pattern="^(excel|pdf|csv|parquet|arrow)$", description="Export format"
+    )
+    dataset: Optional[str] = Field(
+        None,
+        pattern="^(requirements|vote_results|workflow_history)$",
+        description="Dataset of parquet/arrow exports (default: requirements)",
     )
     filters: Optional[Dict[str, Any]] = Field(None, description="Export filters")
     include_analysis: bool = Field(default=True, description="Include analysis data")
@@ -63,7 +69,11 @@ class ExportJobResponse(BaseModel):
     file_path: Optional[str]
     file_size: Optional[int]
     download_url: Optional[str]
-    created_at: str
+    total_records: Optional[int] = None
+    processed_records: Optional[int] = None
+    progress: Optional[float] = Field(None, description="Percentage of records written")
+    error_message: Optional[str] = None
+    created_at: datetime
 
 
 # Import result
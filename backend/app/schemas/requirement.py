@@ -60,11 +60,53 @@ class RequirementBase(BaseModel):
 class RequirementCreate(RequirementBase):
     """Schema for creating a requirement."""
 
-    moscow_priority: Optional[str] = Field(None, description="MoSCoW priority")
+    moscow_priority: Optional[str] = Field(None, max_length=20, description="MoSCoW priority")
     moscow_comment: Optional[str] = Field(None, description="MoSCoW priority justification")
     customer_need_10q: Optional[Requirement10QCreate] = Field(None, description="客户需求十问")
 
 
+# 单次批量创建的最大行数
+BULK_CREATE_MAX_ITEMS = 10000
+
+
+class RequirementBulkCreate(BaseModel):
+    """Schema for bulk creating requirements.
+
+    Items are validated one by one against RequirementCreate so that invalid
+    rows are reported per row instead of rejecting the whole batch.
+    """
+
+    items: List[Dict[str, Any]] = Field(
+        ..., min_length=1, max_length=BULK_CREATE_MAX_ITEMS, description="需求列表（字段同单条创建）"
+    )
+
+
+class RequirementBulkRowResult(BaseModel):
+    """Result of one row of a bulk create."""
+
+    index: int = Field(..., description="行号（从0开始）")
+    success: bool
+    id: Optional[int] = None
+    requirement_no: Optional[str] = None
+    error: Optional[str] = None
+
+
+class RequirementBulkCreateData(BaseModel):
+    """Bulk create summary."""
+
+    total: int
+    created: int
+    failed: int
+    results: List[RequirementBulkRowResult]
+
+
+class RequirementBulkCreateResponse(BaseModel):
+    """Schema for bulk create response."""
+
+    success: bool = True
+    data: RequirementBulkCreateData
+
+
 class RequirementUpdate(BaseModel):
     """Schema for updating a requirement."""
 
@@ -75,7 +117,7 @@ class RequirementUpdate(BaseModel):
     status: Optional[str] = None
     priority_score: Optional[int] = Field(None, ge=0, le=100)
     priority_rank: Optional[int] = Field(None, ge=1, le=1000)
-    moscow_priority: Optional[str] = Field(None, description="MoSCoW priority")
+    moscow_priority: Optional[str] = Field(None, max_length=20, description="MoSCoW priority")
     moscow_comment: Optional[str] = Field(None, description="MoSCoW priority justification")
     estimated_duration_months: Optional[float] = Field(None, ge=0, le=365)
     complexity_level: Optional[str] = None
@@ -132,6 +174,21 @@ class RequirementListItem(BaseModel):
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
+class RequirementSearchHit(BaseModel):
+    """Schema for a full-text search hit."""
+
+    id: int
+    requirement_no: str
+    title: str
+    status: str
+    source_channel: str
+    target_type: Optional[str] = None
+    created_at: datetime
+    score: float = Field(..., description="相关度（越大越相关）")
+    title_highlight: str = Field(..., description="高亮后的标题（HTML，<mark> 标记命中词）")
+    description_highlight: str = Field(..., description="高亮后的描述摘要（HTML）")
+
+
 class PaginatedResponse(BaseModel):
     """Paginated response schema."""
 
@@ -140,6 +197,7 @@ class PaginatedResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = None
 
 
 class RequirementListResponse(BaseModel):
@@ -317,6 +317,13 @@ class VoteStatisticsResponse(BaseModel):
     data: VoteStatisticsData
 
 
+class MeetingVoteStatisticsResponse(BaseModel):
+    """Schema for the vote statistics of all requirements in a meeting."""
+
+    success: bool
+    data: List[VoteStatisticsData]
+
+
 # ============================================================================
 # Vote Result Archive Schemas
 # ============================================================================
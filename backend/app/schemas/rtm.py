@@ -40,6 +40,12 @@ class TraceabilityLinkCreate(TraceabilityLinkBase):
     requirement_id: int = Field(..., description="需求ID")
 
 
+class TraceabilityLinkBulkCreate(BaseModel):
+    """批量创建追溯关联 Schema."""
+
+    items: List[TraceabilityLinkCreate] = Field(..., min_length=1, max_length=1000, description="追溯关联列表")
+
+
 class TraceabilityLinkUpdate(TraceabilityLinkBase):
     """更新追溯关联 Schema."""
 
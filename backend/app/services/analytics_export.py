@@ -0,0 +1,324 @@
+"""Columnar (Parquet / Arrow IPC) exports for analytics.
+
+Each dataset is a typed column list read straight from a streaming DB cursor
+(yield_per) and written ROW_GROUP_SIZE rows at a time, so files of any size
+are produced in bounded memory. JSON fields with a known shape (rice_score,
+invest_analysis, vote_statistics) are flattened into typed columns; free
+form JSON (changes_snapshot) is kept as a JSON text column.
+
+Used by export jobs (export_type "parquet" / "arrow", see
+app.services.requirement_export) and by scripts/dump_analytics.py for
+scheduled dumps. Requires pyarrow.
+"""
+import json
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Tuple, Union
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.requirement import Requirement
+from app.models.vote_result import VoteResult
+from app.models.workflow import WorkflowHistory
+from app.services.invest import InvestService
+
+COLUMNAR_FORMATS = ("parquet", "arrow")
+
+# Rows per Parquet row group / Arrow record batch
+ROW_GROUP_SIZE = 50_000
+
+
+@dataclass(frozen=True)
+class Column:
+    """One output column: name, Arrow type name and value getter."""
+
+    name: str
+    type: str
+    value: Callable[[Any], Any]
+
+
+def _attr(name: str) -> Callable[[Any], Any]:
+    return lambda row: getattr(row, name)
+
+
+def _json_key(field: str, key: str) -> Callable[[Any], Any]:
+    def value(row):
+        data = getattr(row, field)
+        return data.get(key) if isinstance(data, dict) else None
+    return value
+
+
+def _invest_key(key: str) -> Callable[[Any], Any]:
+    """INVEST score; legacy boolean analyses are converted like InvestService does."""
+    def value(row):
+        data = row.invest_analysis
+        if not isinstance(data, dict):
+            return None
+        if isinstance(data.get("independent"), bool):
+            data = InvestService._convert_bool_to_score(data)
+        return data.get(key)
+    return value
+
+
+def _json_text(field: str) -> Callable[[Any], Any]:
+    def value(row):
+        data = getattr(row, field)
+        return None if data is None else json.dumps(data, ensure_ascii=False, default=str)
+    return value
+
+
+def _columns(*specs: Tuple[str, str]) -> List[Column]:
+    """Columns read directly from the row attribute of the same name."""
+    return [Column(name, type_, _attr(name)) for name, type_ in specs]
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """A columnar export source."""
+
+    name: str
+    columns: List[Column]
+    # tenant_id -> SELECT of the source rows, ordered by id (read in id pages)
+    statement: Callable[[int], Any]
+    # tenant_id -> SELECT of (row count, change marker) for export caching
+    version_statement: Callable[[int], Any]
+
+
+REQUIREMENTS = Dataset(
+    name="requirements",
+    columns=_columns(
+        ("id", "int64"),
+        ("requirement_no", "string"),
+        ("title", "string"),
+        ("status", "string"),
+        ("source_channel", "string"),
+        ("target_type", "string"),
+        ("target_id", "int64"),
+        ("priority_score", "float64"),
+        ("priority_rank", "int64"),
+        ("kano_category", "string"),
+        ("moscow_priority", "string"),
+        ("complexity_level", "string"),
+        ("estimated_duration_months", "float64"),
+        ("created_by", "int64"),
+        ("created_at", "timestamp"),
+        ("updated_at", "timestamp"),
+    ) + [
+        Column("rice_reach", "int64", _json_key("rice_score", "reach")),
+        Column("rice_impact", "int64", _json_key("rice_score", "impact")),
+        Column("rice_confidence", "int64", _json_key("rice_score", "confidence")),
+        Column("rice_effort", "int64", _json_key("rice_score", "effort")),
+        Column("rice_score", "float64", _json_key("rice_score", "score")),
+    ] + [
+        Column(f"invest_{key}", type_, _invest_key(key))
+        for key, type_ in (
+            ("independent", "int64"),
+            ("negotiable", "int64"),
+            ("valuable", "int64"),
+            ("estimable", "int64"),
+            ("small", "int64"),
+            ("testable", "int64"),
+            ("total_score", "int64"),
+            ("average_score", "float64"),
+        )
+    ],
+    statement=lambda tenant_id: (
+        select(Requirement).where(Requirement.tenant_id == tenant_id).order_by(Requirement.id)
+    ),
+    version_statement=lambda tenant_id: (
+        select(func.count(Requirement.id), func.max(Requirement.updated_at))
+        .where(Requirement.tenant_id == tenant_id)
+    ),
+)
+
+VOTE_RESULTS = Dataset(
+    name="vote_results",
+    columns=_columns(
+        ("id", "int64"),
+        ("meeting_id", "int64"),
+        ("requirement_id", "int64"),
+        ("archived_at", "timestamp"),
+    ) + [
+        Column(key, type_, _json_key("vote_statistics", key))
+        for key, type_ in (
+            ("total_votes", "int64"),
+            ("approve_count", "int64"),
+            ("approve_percentage", "float64"),
+            ("reject_count", "int64"),
+            ("reject_percentage", "float64"),
+            ("abstain_count", "int64"),
+            ("abstain_percentage", "float64"),
+            ("total_assigned_voters", "int64"),
+            ("voted_count", "int64"),
+            ("is_voting_complete", "bool"),
+        )
+    ],
+    statement=lambda tenant_id: (
+        select(VoteResult).where(VoteResult.tenant_id == tenant_id).order_by(VoteResult.id)
+    ),
+    version_statement=lambda tenant_id: (
+        select(func.count(VoteResult.id), func.max(VoteResult.updated_at))
+        .where(VoteResult.tenant_id == tenant_id)
+    ),
+)
+
+
+def _tenant_requirement_ids(tenant_id: int):
+    # workflow_history has no tenant_id: requirement history is scoped through requirements
+    return select(Requirement.id).where(Requirement.tenant_id == tenant_id)
+
+
+WORKFLOW_HISTORY = Dataset(
+    name="workflow_history",
+    columns=_columns(
+        ("id", "int64"),
+        ("entity_type", "string"),
+        ("entity_id", "int64"),
+        ("action", "string"),
+        ("from_status", "string"),
+        ("to_status", "string"),
+        ("action_reason", "string"),
+        ("comments", "string"),
+        ("performed_by", "int64"),
+        ("performed_at", "timestamp"),
+    ) + [Column("changes_snapshot", "string", _json_text("changes_snapshot"))],
+    statement=lambda tenant_id: (
+        select(WorkflowHistory)
+        .where(
+            WorkflowHistory.entity_type == "requirement",
+            WorkflowHistory.entity_id.in_(_tenant_requirement_ids(tenant_id)),
+        )
+        .order_by(WorkflowHistory.id)
+    ),
+    # History rows are append-only: count and newest id identify the data
+    version_statement=lambda tenant_id: (
+        select(func.count(WorkflowHistory.id), func.max(WorkflowHistory.id))
+        .where(
+            WorkflowHistory.entity_type == "requirement",
+            WorkflowHistory.entity_id.in_(_tenant_requirement_ids(tenant_id)),
+        )
+    ),
+)
+
+DATASETS: Dict[str, Dataset] = {
+    dataset.name: dataset for dataset in (REQUIREMENTS, VOTE_RESULTS, WORKFLOW_HISTORY)
+}
+
+
+def get_dataset(name: str) -> Dataset:
+    """
+    Look up a dataset by name.
+
+    Raises:
+        ValueError: If the dataset does not exist
+    """
+    if name not in DATASETS:
+        raise ValueError(f"Unknown analytics dataset: {name}")
+    return DATASETS[name]
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        raise ValueError("Columnar exports require pyarrow (pip install pyarrow)") from e
+    return pyarrow
+
+
+def arrow_schema(dataset: Dataset):
+    """Arrow schema of a dataset."""
+    pa = _pyarrow()
+    types = {
+        "int64": pa.int64(),
+        "float64": pa.float64(),
+        "bool": pa.bool_(),
+        "string": pa.string(),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+    }
+    return pa.schema([pa.field(column.name, types[column.type]) for column in dataset.columns])
+
+
+def count_rows(db: Session, dataset: Dataset, tenant_id: int) -> int:
+    """Number of rows the dataset exports for a tenant."""
+    return db.execute(dataset.version_statement(tenant_id)).one()[0]
+
+
+def data_version(db: Session, dataset: Dataset, tenant_id: int) -> str:
+    """Fingerprint of the dataset's rows (changes whenever they change)."""
+    count, marker = db.execute(dataset.version_statement(tenant_id)).one()
+    return f"{dataset.name}:{count}:{marker.isoformat() if hasattr(marker, 'isoformat') else marker}"
+
+
+def iter_rows(db: Session, dataset: Dataset, tenant_id: int, chunk_size: int = ROW_GROUP_SIZE) -> Iterator[Any]:
+    """Stream the dataset's ORM rows in keyset pages of chunk_size (id > last id).
+
+    Each page is one fully fetched query, so no cursor stays open while
+    the caller commits between rows (see run_export_job progress). The
+    session only holds weak references to loaded rows, so written chunks
+    are released.
+    """
+    stmt = dataset.statement(tenant_id).limit(chunk_size)
+    model = stmt.column_descriptions[0]["entity"]
+    page = db.execute(stmt).scalars().all()
+    while page:
+        yield from page
+        if len(page) < chunk_size:
+            return
+        page = db.execute(stmt.where(model.id > page[-1].id)).scalars().all()
+
+
+def write_columnar(
+    rows: Iterator[Any],
+    output: Union[str, BinaryIO],
+    dataset: Dataset,
+    file_format: str = "parquet",
+    row_group_size: int = ROW_GROUP_SIZE,
+) -> int:
+    """
+    Write rows to a Parquet or Arrow IPC file, one row group at a time.
+
+    Args:
+        rows: Source rows (attributes as read by the dataset's columns)
+        output: File path or binary file object
+        dataset: Dataset definition
+        file_format: "parquet" or "arrow"
+        row_group_size: Rows per row group / record batch
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        ValueError: If the format is unknown or pyarrow is missing
+    """
+    if file_format not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unknown columnar format: {file_format}")
+    pa = _pyarrow()
+    schema = arrow_schema(dataset)
+
+    if file_format == "parquet":
+        writer = pa.parquet.ParquetWriter(output, schema, compression="zstd")
+    else:
+        writer = pa.ipc.new_file(output, schema)
+
+    count = 0
+    try:
+        while True:
+            chunk = list(islice(rows, row_group_size))
+            if not chunk:
+                break
+            arrays = [
+                pa.array([column.value(row) for row in chunk], type=field.type)
+                for column, field in zip(dataset.columns, schema)
+            ]
+            batch = pa.RecordBatch.from_arrays(arrays, schema=schema)
+            if file_format == "parquet":
+                writer.write_table(pa.Table.from_batches([batch]), row_group_size=row_group_size)
+            else:
+                writer.write_batch(batch)
+            count += len(chunk)
+    finally:
+        writer.close()
+    return count
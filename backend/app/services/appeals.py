@@ -1,8 +1,10 @@
 """APPEALS analysis service for business logic."""
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, Tuple
 
 from sqlalchemy.orm import Session
 
+from app.config import get_settings
 from app.models.appeals import AppealsAnalysis
 from app.repositories.appeals import AppealsRepository
 from app.schemas.appeals import (
@@ -12,6 +14,19 @@ from app.schemas.appeals import (
 )
 from app.repositories.requirement import RequirementRepository
 
+settings = get_settings()
+
+# tenant_id -> (cached at, summary)
+_summary_cache: Dict[int, Tuple[float, APPEALSSummary]] = {}
+
+
+def invalidate_appeals_summary(tenant_id: Optional[int] = None) -> None:
+    """Drop the cached APPEALS summary of a tenant (or of all tenants)."""
+    if tenant_id is None:
+        _summary_cache.clear()
+    else:
+        _summary_cache.pop(tenant_id, None)
+
 
 class AppealsService:
     """Service for APPEALS analysis business logic."""
@@ -129,6 +144,7 @@ class AppealsService:
                 analyzed_by=user_id,
             )
 
+        invalidate_appeals_summary(requirement.tenant_id)
         return self._to_response(analysis)
 
     def get_appeals_analysis(
@@ -151,7 +167,10 @@ class AppealsService:
 
     def get_appeals_summary(self, tenant_id: int) -> APPEALSSummary:
         """
-        Get APPEALS summary across all requirements.
+        Get APPEALS summary across all requirements of a tenant.
+
+        Computed with one aggregate query plus a top-10 query and cached
+        until the tenant's next APPEALS save (or APPEALS_SUMMARY_CACHE_TTL).
 
         Args:
             tenant_id: Tenant ID
@@ -159,67 +178,16 @@ class AppealsService:
         Returns:
             Summary statistics
         """
-        # Get all requirements
-        requirements, total = self.req_repo.list(
-            page=1, page_size=1000
-        )
-
-        analyzed_count = 0
-        total_scores = {
-            "price": 0.0,
-            "availability": 0.0,
-            "packaging": 0.0,
-            "performance": 0.0,
-            "ease_of_use": 0.0,
-            "assurance": 0.0,
-            "lifecycle_cost": 0.0,
-            "social_acceptance": 0.0,
-        }
-
-        top_requirements = []
-
-        for req in requirements:
-            analysis = self.repo.get_by_requirement_id(req.id)
-            if analysis and analysis.total_weighted_score:
-                analyzed_count += 1
-                total_scores["price"] += analysis.price_score or 0
-                total_scores["availability"] += analysis.availability_score or 0
-                total_scores["packaging"] += analysis.packaging_score or 0
-                total_scores["performance"] += analysis.performance_score or 0
-                total_scores["ease_of_use"] += analysis.ease_of_use_score or 0
-                total_scores["assurance"] += analysis.assurance_score or 0
-                total_scores["lifecycle_cost"] += analysis.lifecycle_cost_score or 0
-                total_scores["social_acceptance"] += analysis.social_acceptance_score or 0
-
-                top_requirements.append({
-                    "requirement_id": req.id,
-                    "requirement_no": req.requirement_no,
-                    "title": req.title,
-                    "total_score": analysis.total_weighted_score,
-                })
-
-        # Calculate averages
-        average_scores = {}
-        if analyzed_count > 0:
-            for key in total_scores:
-                average_scores[key] = round(
-                    total_scores[key] / analyzed_count, 2
-                )
-        else:
-            average_scores = {k: 0.0 for k in total_scores}
-
-        # Sort top requirements
-        top_requirements.sort(
-            key=lambda x: x["total_score"], reverse=True
-        )
-        top_requirements = top_requirements[:10]  # Top 10
+        cached = _summary_cache.get(tenant_id)
+        if cached is not None and time.monotonic() - cached[0] < settings.APPEALS_SUMMARY_CACHE_TTL:
+            return cached[1]
 
-        return APPEALSSummary(
-            total_requirements=total,
-            analyzed_requirements=analyzed_count,
-            average_scores=average_scores,
-            top_requirements=top_requirements,
+        summary = APPEALSSummary(
+            **self.repo.get_summary_stats(tenant_id),
+            top_requirements=self.repo.get_top_requirements(tenant_id, limit=10),
         )
+        _summary_cache[tenant_id] = (time.monotonic(), summary)
+        return summary
 
     def _to_response(
         self, analysis: AppealsAnalysis
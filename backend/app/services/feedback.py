@@ -1,13 +1,13 @@
 """Feedback service."""
 from typing import Optional, List, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, and_
 
 from app.models.feedback import Feedback
 from app.models.requirement import Requirement
 from app.repositories.feedback import FeedbackRepository
 from app.repositories.requirement import RequirementRepository
 from app.repositories.workflow_history import WorkflowHistoryRepository
+from app.services.sequence import FEEDBACK_NO, SequenceService
 from app.core.tenant import get_current_tenant
 
 
@@ -311,23 +311,5 @@ class FeedbackService:
     # ========================================================================
 
     def _generate_feedback_no(self) -> str:
-        """Generate feedback number: FB-YYYY-XXXX."""
-        from datetime import datetime
-
-        year = datetime.now().year
-        tenant_id = get_current_tenant()
-
-        # Count existing feedbacks for this year
-        stmt = (
-            select(func.count(Feedback.id))
-            .where(
-                and_(
-                    Feedback.tenant_id == tenant_id,
-                    Feedback.feedback_no.like(f'FB-{year}-%'),
-                )
-            )
-        )
-        count = self.db.execute(stmt).scalar() or 0
-
-        # Format: FB-2026-0001
-        return f'FB-{year}-{str(count + 1).zfill(4)}'
+        """Generate feedback number: FB-YYYY-XXXX (per tenant)."""
+        return SequenceService(self.db).next_number(FEEDBACK_NO, tenant_id=get_current_tenant())
@@ -20,7 +20,8 @@ class InvestService:
         self.session = session
         self.req_repo = BaseRepository(Requirement, session)
 
-    def _convert_bool_to_score(self, old_data: dict) -> dict:
+    @staticmethod
+    def _convert_bool_to_score(old_data: dict) -> dict:
         """将布尔格式转换为评分格式
 
         Args:
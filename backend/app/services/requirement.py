@@ -1,38 +1,66 @@
 """Requirement service for business logic."""
-from typing import Optional, List, Dict, Any, Tuple
+from typing import BinaryIO, Optional, List, Dict, Any, Tuple
 
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import ValidationError
 
-from app.models.requirement import Requirement, Requirement10QAnswer
+from app.models.requirement import Requirement, Requirement10QAnswer, SourceChannel, ComplexityLevel
 from app.repositories.requirement import (
     RequirementRepository,
-    Requirement10QRepository,
+    AsyncRequirementRepository,
+    AsyncRequirement10QRepository,
+    encode_requirement_cursor,
 )
-from app.repositories.workflow_history import WorkflowHistoryRepository
+from app.repositories.workflow_history import AsyncWorkflowHistoryRepository
 from app.schemas.requirement import (
     RequirementCreate,
     RequirementUpdate,
     Requirement10QCreate,
     RequirementResponse,
     RequirementStatsData,
+    RequirementStatsByStatus,
+    RequirementStatsByChannel,
+    RequirementSearchHit,
+    RequirementBulkCreateData,
+    RequirementBulkRowResult,
 )
+from app.utils.excel import ExcelStreamWriter
+from app.utils.search import highlight
 from app.core.tenant import get_current_tenant
 
 
+def _check_column_values(data: RequirementCreate) -> None:
+    """Reject values the database would refuse (aborting the whole batch)."""
+    if data.source_channel not in SourceChannel.enums:
+        raise ValueError(f"source_channel: invalid value '{data.source_channel}'")
+    if data.complexity_level is not None and data.complexity_level not in ComplexityLevel.enums:
+        raise ValueError(f"complexity_level: invalid value '{data.complexity_level}'")
+
+
+def _validation_message(error: ValueError) -> str:
+    """Readable message for a row validation error."""
+    if isinstance(error, ValidationError):
+        return "; ".join(
+            f"{' -> '.join(str(loc) for loc in e['loc'])}: {e['msg']}" for e in error.errors()
+        )
+    return str(error)
+
+
 class RequirementService:
-    """Service for Requirement business logic."""
+    """Service for Requirement business logic (async, AsyncSession based)."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
-        self.repo = RequirementRepository(db)
-        self.repo_10q = Requirement10QRepository(db)
-        self.repo_history = WorkflowHistoryRepository(db)
+        self.repo = AsyncRequirementRepository(db)
+        self.repo_10q = AsyncRequirement10QRepository(db)
+        self.repo_history = AsyncWorkflowHistoryRepository(db)
 
     # ========================================================================
     # CRUD Operations
     # ========================================================================
 
-    def create_requirement(
+    async def create_requirement(
         self,
         data: RequirementCreate,
         created_by: Optional[int] = None,
@@ -56,7 +84,7 @@ class RequirementService:
             ten_q_data = data.customer_need_10q.model_dump()
 
         # Create requirement
-        requirement = self.repo.create(
+        requirement = await self.repo.create(
             title=data.title,
             description=data.description,
             source_channel=data.source_channel,
@@ -72,7 +100,7 @@ class RequirementService:
 
         # Create detailed 10 questions answer if provided
         if data.customer_need_10q:
-            self.repo_10q.create(
+            await self.repo_10q.create(
                 requirement_id=requirement.id,
                 answers=data.customer_need_10q.model_dump(),
                 answered_by=created_by,
@@ -81,7 +109,67 @@ class RequirementService:
 
         return requirement
 
-    def get_requirement(self, requirement_id: int) -> Optional[Requirement]:
+    async def bulk_create_requirements(
+        self,
+        items: List[Dict[str, Any]],
+        created_by: Optional[int] = None,
+    ) -> RequirementBulkCreateData:
+        """
+        Create many requirements in one transaction.
+
+        Each item is validated as RequirementCreate; invalid items are
+        reported and skipped, valid ones are inserted in batches.
+
+        Args:
+            items: Raw requirement dicts
+            created_by: User ID who created the requirements
+
+        Returns:
+            Per-row results and totals
+
+        Raises:
+            ValueError: If there is no tenant context
+        """
+        tenant_id = get_current_tenant()
+        if tenant_id is None:
+            raise ValueError("Tenant context required for bulk create")
+
+        results: List[Optional[RequirementBulkRowResult]] = [None] * len(items)
+        rows: List[Dict[str, Any]] = []
+        row_indexes: List[int] = []
+        for index, item in enumerate(items):
+            try:
+                data = RequirementCreate.model_validate(item)
+                _check_column_values(data)
+            except ValueError as e:
+                results[index] = RequirementBulkRowResult(
+                    index=index, success=False, error=_validation_message(e)
+                )
+                continue
+
+            row = data.model_dump(exclude={"customer_need_10q"})
+            row["customer_need_10q"] = (
+                data.customer_need_10q.model_dump() if data.customer_need_10q else None
+            )
+            rows.append(row)
+            row_indexes.append(index)
+
+        created = await self.repo.bulk_create(rows, created_by=created_by, tenant_id=tenant_id)
+        await self.db.commit()
+
+        for index, (requirement_id, requirement_no) in zip(row_indexes, created):
+            results[index] = RequirementBulkRowResult(
+                index=index, success=True, id=requirement_id, requirement_no=requirement_no
+            )
+
+        return RequirementBulkCreateData(
+            total=len(items),
+            created=len(created),
+            failed=len(items) - len(created),
+            results=results,
+        )
+
+    async def get_requirement(self, requirement_id: int) -> Optional[Requirement]:
         """
         Get requirement by ID.
 
@@ -91,9 +179,9 @@ class RequirementService:
         Returns:
             Requirement or None
         """
-        return self.repo.get_by_id(requirement_id)
+        return await self.repo.get_by_id(requirement_id)
 
-    def list_requirements(
+    async def list_requirements(
         self,
         page: int = 1,
         page_size: int = 20,
@@ -104,6 +192,8 @@ class RequirementService:
         sort_by: str = "created_at",
         sort_order: str = "desc",
         exclude_reviewed: bool = False,
+        after: Optional[str] = None,
+        count_mode: str = "exact",
     ) -> Tuple[List[Requirement], int]:
         """
         List requirements with filters and pagination.
@@ -114,15 +204,17 @@ class RequirementService:
             status: Filter by status
             source_channel: Filter by source channel
             target_type: Filter by target type (sp/bp/charter/pcr)
-            search: Search in title and requirement_no
+            search: Full-text search in title, requirement_no and description
             sort_by: Sort field
             sort_order: Sort order (asc or desc)
             exclude_reviewed: 排除已在评审会议或有投票结果的需求
+            after: Keyset cursor from the previous page (overrides page)
+            count_mode: How the total is computed (exact/window/estimate)
 
         Returns:
             Tuple of (list of requirements, total count)
         """
-        return self.repo.list(
+        return await self.repo.list(
             page=page,
             page_size=page_size,
             status=status,
@@ -132,9 +224,85 @@ class RequirementService:
             sort_by=sort_by,
             sort_order=sort_order,
             exclude_reviewed=exclude_reviewed,
+            after=after,
+            count_mode=count_mode,
+        )
+
+    async def search_requirements(
+        self,
+        query: str,
+        page: int = 1,
+        page_size: int = 20,
+        status: Optional[str] = None,
+        source_channel: Optional[str] = None,
+        target_type: Optional[str] = None,
+        snippet_length: int = 120,
+    ) -> Tuple[List[RequirementSearchHit], int]:
+        """
+        Full-text search with relevance ranking and highlighting.
+
+        Args:
+            query: Search text
+            page: Page number (1-indexed)
+            page_size: Number of items per page
+            status: Filter by status
+            source_channel: Filter by source channel
+            target_type: Filter by target type (sp/bp/charter/pcr)
+            snippet_length: Length of the highlighted description snippet
+
+        Returns:
+            Tuple of (list of search hits, total count)
+        """
+        results, total = await self.repo.search(
+            query,
+            page=page,
+            page_size=page_size,
+            status=status,
+            source_channel=source_channel,
+            target_type=target_type,
         )
 
-    def update_requirement(
+        hits = [
+            RequirementSearchHit(
+                id=req.id,
+                requirement_no=req.requirement_no,
+                title=req.title,
+                status=req.status,
+                source_channel=req.source_channel,
+                target_type=req.target_type,
+                created_at=req.created_at,
+                score=score,
+                title_highlight=highlight(req.title, query),
+                description_highlight=highlight(req.description, query, max_length=snippet_length),
+            )
+            for req, score in results
+        ]
+        return hits, total
+
+    @staticmethod
+    def next_cursor(
+        requirements: List[Requirement],
+        page_size: int,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+    ) -> Optional[str]:
+        """
+        Get the cursor for the page following the given one.
+
+        Args:
+            requirements: Requirements of the current page
+            page_size: Requested page size
+            sort_by: Sort field used for the page
+            sort_order: Sort order used for the page
+
+        Returns:
+            Cursor token, or None if this is the last page
+        """
+        if len(requirements) < page_size:
+            return None
+        return encode_requirement_cursor(requirements[-1], sort_by, sort_order)
+
+    async def update_requirement(
         self,
         requirement_id: int,
         data: RequirementUpdate,
@@ -151,7 +319,7 @@ class RequirementService:
         Returns:
             Updated requirement or None
         """
-        requirement = self.repo.get_by_id(requirement_id)
+        requirement = await self.repo.get_by_id(requirement_id)
         if not requirement:
             return None
 
@@ -164,12 +332,12 @@ class RequirementService:
             updates["customer_need_10q"] = ten_q_data
 
             # Update or create detailed 10 questions answer
-            existing_10q = self.repo_10q.get_by_requirement_id(requirement_id)
+            existing_10q = await self.repo_10q.get_by_requirement_id(requirement_id)
             if existing_10q:
-                self.repo_10q.update(existing_10q, ten_q_data)
+                await self.repo_10q.update(existing_10q, ten_q_data)
             else:
                 # Use requirement's tenant_id for creating 10q
-                self.repo_10q.create(
+                await self.repo_10q.create(
                     requirement_id=requirement_id,
                     answers=ten_q_data,
                     answered_by=updated_by,
@@ -179,9 +347,9 @@ class RequirementService:
         # Add updater info
         updates["updated_by"] = updated_by
 
-        return self.repo.update(requirement, **updates)
+        return await self.repo.update(requirement, **updates)
 
-    def delete_requirement(self, requirement_id: int) -> bool:
+    async def delete_requirement(self, requirement_id: int) -> bool:
         """
         Delete requirement.
 
@@ -191,18 +359,18 @@ class RequirementService:
         Returns:
             True if deleted, False if not found
         """
-        requirement = self.repo.get_by_id(requirement_id)
+        requirement = await self.repo.get_by_id(requirement_id)
         if not requirement:
             return False
 
-        self.repo.delete(requirement)
+        await self.repo.delete(requirement)
         return True
 
     # ========================================================================
     # Status Operations
     # ========================================================================
 
-    def update_status(
+    async def update_status(
         self,
         requirement_id: int,
         new_status: str,
@@ -219,7 +387,7 @@ class RequirementService:
         Returns:
             Updated requirement or None
         """
-        requirement = self.repo.get_by_id(requirement_id)
+        requirement = await self.repo.get_by_id(requirement_id)
         if not requirement:
             return None
 
@@ -227,10 +395,10 @@ class RequirementService:
         old_status = requirement.status
 
         # Update status
-        requirement = self.repo.update_status(requirement, new_status, updated_by)
+        requirement = await self.repo.update_status(requirement, new_status, updated_by)
 
         # Automatically record history
-        self.repo_history.create(
+        await self.repo_history.create(
             entity_type='requirement',
             entity_id=requirement_id,
             action='status_changed',
@@ -239,34 +407,56 @@ class RequirementService:
             performed_by=updated_by,
         )
 
+        # Status change and history are committed together
+        await self.db.commit()
+
         return requirement
 
     # ========================================================================
     # Statistics
     # ========================================================================
 
-    def get_statistics(self) -> RequirementStatsData:
+    async def get_statistics(self, tenant_id: Optional[int] = None) -> RequirementStatsData:
         """
         Get requirement statistics.
 
+        Reads the counters maintained in requirement_stats for the tenant;
+        without a tenant (argument or context) the requirements table is counted.
+
+        Args:
+            tenant_id: Tenant ID (defaults to the current tenant context)
+
         Returns:
             Statistics data
         """
-        total = self.repo.get_total_count()
-        by_status = self.repo.get_stats_by_status()
-        by_channel = self.repo.get_stats_by_channel()
+        if tenant_id is None:
+            tenant_id = get_current_tenant()
+        if tenant_id is None:
+            return RequirementStatsData(
+                total=await self.repo.get_total_count(),
+                by_status=await self.repo.get_stats_by_status(),
+                by_channel=await self.repo.get_stats_by_channel(),
+            )
+
+        stats = await self.repo.get_stats_summary(tenant_id)
+        if stats is None:
+            return RequirementStatsData(
+                total=0,
+                by_status=RequirementStatsByStatus(),
+                by_channel=RequirementStatsByChannel(),
+            )
 
         return RequirementStatsData(
-            total=total,
-            by_status=by_status,
-            by_channel=by_channel,
+            total=stats.total,
+            by_status=stats.status_counts(),
+            by_channel=stats.channel_counts(),
         )
 
     # ========================================================================
     # 10 Questions
     # ========================================================================
 
-    def get_10_questions(
+    async def get_10_questions(
         self, requirement_id: int
     ) -> Optional[Requirement10QAnswer]:
         """
@@ -278,13 +468,13 @@ class RequirementService:
         Returns:
             10 questions answer or None
         """
-        return self.repo_10q.get_by_requirement_id(requirement_id)
+        return await self.repo_10q.get_by_requirement_id(requirement_id)
 
     # ========================================================================
     # History Tracking
     # ========================================================================
 
-    def add_history_note(
+    async def add_history_note(
         self,
         requirement_id: int,
         comments: str,
@@ -303,11 +493,11 @@ class RequirementService:
         Returns:
             Created WorkflowHistory record
         """
-        requirement = self.repo.get_by_id(requirement_id)
+        requirement = await self.repo.get_by_id(requirement_id)
         if not requirement:
             raise ValueError("Requirement not found")
 
-        return self.repo_history.create(
+        history = await self.repo_history.create(
             entity_type='requirement',
             entity_id=requirement_id,
             action='note_added',
@@ -316,8 +506,11 @@ class RequirementService:
             action_reason=action_reason,
             performed_by=performed_by,
         )
+        await self.db.commit()
+
+        return history
 
-    def get_history(
+    async def get_history(
         self, requirement_id: int, limit: int = 50
     ) -> List:
         """
@@ -330,7 +523,7 @@ class RequirementService:
         Returns:
             List of WorkflowHistory records
         """
-        return self.repo_history.get_by_entity('requirement', requirement_id, limit)
+        return await self.repo_history.get_by_entity('requirement', requirement_id, limit)
 
     # ========================================================================
     # Export
@@ -340,72 +533,31 @@ class RequirementService:
     def export_to_excel(
         db: Session,
         tenant_id: int,
+        output: BinaryIO,
         status: str = "distributed",
         target_type: str = "charter",
         search: Optional[str] = None
-    ) -> bytes:
+    ) -> int:
         """
         导出需求开发列表为 Excel.
 
+        需求按批次从数据库读取（yield_per），写入只写模式工作簿，
+        内存占用与行数无关。
+
         Args:
             db: 数据库会话
             tenant_id: 租户ID
+            output: 写入 .xlsx 的二进制文件对象
             status: 需求状态（默认 distributed）
             target_type: 目标类型（默认 charter）
             search: 搜索关键词（可选）
 
         Returns:
-            Excel 文件的字节流
+            导出的记录数
         """
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
         from datetime import datetime
-        import io
-
-        # 获取需求数据
-        repo = RequirementRepository(db)
-        requirements, total = repo.list(
-            page=1,
-            page_size=10000,  # 大数量以支持导出所有数据
-            status=status,
-            target_type=target_type,
-            search=search
-        )
 
-        # 创建工作簿
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "需求开发列表"
-
-        # 定义样式
-        header_font = Font(name='微软雅黑', size=11, bold=True, color='FFFFFF')
-        header_fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
-        header_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-        cell_alignment = Alignment(horizontal='left', vertical='center', wrap_text=True)
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-
-        # 定义列宽
-        column_widths = {
-            'A': 18,  # 需求编号
-            'B': 35,  # 需求标题
-            'C': 12,  # 来源渠道
-            'D': 10,  # 优先级
-            'E': 12,  # MoSCoW
-            'F': 15,  # Charter ID
-            'G': 12,  # 预估工期
-            'H': 18,  # 分发时间
-            'I': 80,  # 需求描述（加宽以显示完整内容）
-        }
-
-        for col, width in column_widths.items():
-            ws.column_dimensions[col].width = width
-
-        # 定义表头
+        # 定义表头和列宽
         headers = [
             '需求编号',
             '需求标题',
@@ -417,15 +569,18 @@ class RequirementService:
             '分发时间',
             '需求描述'
         ]
-
-        # 写入表头
-        ws.append(headers)
-        for col_num, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_num)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-            cell.border = border
+        column_widths = [
+            18,  # 需求编号
+            35,  # 需求标题
+            12,  # 来源渠道
+            10,  # 优先级
+            12,  # MoSCoW
+            15,  # Charter ID
+            12,  # 预估工期
+            18,  # 分发时间
+            80,  # 需求描述（加宽以显示完整内容）
+        ]
+        writer = ExcelStreamWriter("需求开发列表", headers, column_widths, font_name='微软雅黑')
 
         # 来源渠道映射
         source_map = {
@@ -453,55 +608,24 @@ class RequirementService:
         }
 
         # 写入数据
-        for row_num, req in enumerate(requirements, 2):
-            # 来源渠道
-            source_text = source_map.get(req.source_channel, req.source_channel or '')
-
-            # 优先级
-            priority_text = priority_map.get(req.priority_score, '-') if req.priority_score else '-'
-
-            # MoSCoW
-            moscow_text = moscow_map.get(req.moscow_priority, '-') if req.moscow_priority else '-'
-
-            # Charter ID
-            charter_id = f"CHARTER-{str(req.target_id).zfill(3)}" if req.target_id else '-'
-
-            # 预估工期
-            duration_text = f"{req.estimated_duration_months}月" if req.estimated_duration_months else '-'
-
-            # 分发时间
-            updated_text = req.updated_at.strftime('%Y-%m-%d %H:%M') if req.updated_at else '-'
-
-            # 需求描述（导出完整内容）
-            desc_text = req.description or '-'
-
-            ws.append([
+        repo = RequirementRepository(db)
+        for req in repo.iter_for_export(tenant_id, status=status, target_type=target_type, search=search):
+            writer.append([
                 req.requirement_no or '',
                 req.title or '',
-                source_text,
-                priority_text,
-                moscow_text,
-                charter_id,
-                duration_text,
-                updated_text,
-                desc_text
+                source_map.get(req.source_channel, req.source_channel or ''),
+                priority_map.get(req.priority_score, '-') if req.priority_score else '-',
+                moscow_map.get(req.moscow_priority, '-') if req.moscow_priority else '-',
+                f"CHARTER-{str(req.target_id).zfill(3)}" if req.target_id else '-',
+                f"{req.estimated_duration_months}月" if req.estimated_duration_months else '-',
+                req.updated_at.strftime('%Y-%m-%d %H:%M') if req.updated_at else '-',
+                req.description or '-',
             ])
 
-            # 应用单元格样式
-            for col_num in range(1, 10):
-                cell = ws.cell(row=row_num, column=col_num)
-                cell.alignment = cell_alignment
-                cell.border = border
-
         # 添加汇总信息
-        summary_row = len(requirements) + 3
-        ws.cell(row=summary_row, column=1, value=f'导出时间: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
-        ws.cell(row=summary_row, column=1).font = Font(name='微软雅黑', size=10)
-        ws.cell(row=summary_row + 1, column=1, value=f'总计: {total} 条记录')
-        ws.cell(row=summary_row + 1, column=1).font = Font(name='微软雅黑', size=10, bold=True)
-
-        # 保存到字节流
-        output = io.BytesIO()
-        wb.save(output)
-        output.seek(0)
-        return output.read()
+        writer.append_note()
+        writer.append_note(f'导出时间: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
+        writer.append_note(f'总计: {writer.rows_written} 条记录', bold=True)
+
+        writer.save(output)
+        return writer.rows_written
@@ -0,0 +1,364 @@
+"""Background requirement export jobs.
+
+POST /import-export/export only records an ExportJob and hands its ID to a
+small thread pool (EXPORT_WORKERS); run_export_job() generates the file
+there, streaming requirements from the database into an Excel, CSV or
+plain-text summary file under UPLOAD_DIR/exports and updating processed_records as it goes.
+Parquet / Arrow jobs write one of the analytics datasets instead (see
+app.services.analytics_export).
+
+Every finished job stores a cache key hashed from the tenant, export type,
+filters and the tenant's requirement data version. A later export with the
+same key reuses the finished artifact instead of generating it again; any
+requirement write changes the data version and therefore the key.
+
+The pool lives in the API process, so jobs still processing when it stops
+are lost; fail_interrupted_export_jobs() marks them failed at startup.
+"""
+import csv
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.db.base import SessionLocal
+from app.models.export_job import ExportJob
+from app.repositories.requirement import RequirementRepository
+from app.services.analytics_export import (
+    COLUMNAR_FORMATS,
+    REQUIREMENTS,
+    count_rows,
+    data_version,
+    get_dataset,
+    iter_rows,
+    write_columnar,
+)
+from app.utils.excel import ExcelStreamWriter
+from app.utils.pdf import PDFGenerator
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Filters an export accepts: the analytics dataset and the
+# RequirementRepository.iter_for_export arguments
+EXPORT_FILTER_KEYS = ("dataset", "status", "source_channel", "target_type", "search")
+
+# PDFGenerator has no PDF backend yet and writes a plain-text summary, so
+# "pdf" jobs are served as text until a real renderer lands
+EXPORT_EXTENSIONS = {"excel": "xlsx", "csv": "csv", "pdf": "txt", "parquet": "parquet", "arrow": "arrow"}
+EXPORT_MEDIA_TYPES = {
+    "excel": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "csv": "text/csv; charset=utf-8",
+    "pdf": "text/plain; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.file",
+}
+
+# processed_records is written every this many rows
+PROGRESS_INTERVAL = 1000
+
+EXPORT_HEADERS = [
+    "需求编号",
+    "需求标题",
+    "状态",
+    "来源渠道",
+    "MoSCoW优先级",
+    "目标类型",
+    "目标ID",
+    "创建时间",
+    "需求描述",
+]
+EXPORT_COLUMN_WIDTHS = [18, 35, 12, 12, 14, 10, 10, 18, 80]
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def normalize_filters(filters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Validate export filters and drop empty values.
+
+    Args:
+        filters: Filters from the export request
+
+    Returns:
+        Filters with non-empty values, sorted by key
+
+    Raises:
+        ValueError: If a filter is not supported
+    """
+    filters = filters or {}
+    unknown = sorted(set(filters) - set(EXPORT_FILTER_KEYS))
+    if unknown:
+        raise ValueError(f"Unsupported export filters: {', '.join(unknown)}")
+    return {key: filters[key] for key in sorted(filters) if filters[key] not in (None, "")}
+
+
+def export_cache_key(tenant_id: int, export_type: str, filters: Dict[str, Any], data_version: str) -> str:
+    """Cache key of an export artifact."""
+    payload = json.dumps(
+        {"tenant_id": tenant_id, "type": export_type, "filters": filters, "version": data_version},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def download_url(job_id: int) -> str:
+    return f"{settings.API_V1_PREFIX}/import-export/export/jobs/{job_id}/download"
+
+
+def get_export_executor() -> ThreadPoolExecutor:
+    """Thread pool running export jobs (created on first use)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.EXPORT_WORKERS, thread_name_prefix="export"
+            )
+        return _executor
+
+
+def shutdown_export_executor() -> None:
+    """Wait for running export jobs and stop the worker pool."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True, cancel_futures=True)
+            _executor = None
+
+
+def submit_export_job(job_id: int) -> None:
+    """Queue an export job on the worker pool."""
+    get_export_executor().submit(run_export_job, job_id)
+
+
+def fail_interrupted_export_jobs(session_factory: Callable[[], Session] = SessionLocal) -> int:
+    """
+    Mark jobs left processing by a previous process as failed.
+
+    Call at startup, before any job is submitted: the worker pool is
+    in-process, so a processing job from an earlier run will never finish.
+
+    Args:
+        session_factory: Sync session factory
+
+    Returns:
+        Number of jobs marked failed
+    """
+    with session_factory() as db:
+        result = db.execute(
+            update(ExportJob)
+            .where(ExportJob.status == "processing")
+            .values(status="failed", error_message="Interrupted by a server restart")
+        )
+        db.commit()
+    if result.rowcount:
+        logger.warning("Marked %s interrupted export jobs as failed", result.rowcount)
+    return result.rowcount
+
+
+# ============================================================================
+# Writers
+# ============================================================================
+
+def _export_values(row: Any) -> list:
+    return [
+        row.requirement_no or "",
+        row.title or "",
+        row.status or "",
+        row.source_channel or "",
+        row.moscow_priority or "",
+        row.target_type or "",
+        row.target_id if row.target_id is not None else "",
+        row.created_at.strftime("%Y-%m-%d %H:%M") if row.created_at else "",
+        row.description or "",
+    ]
+
+
+def _write_excel(rows: Iterator[Any], file_path: str, total: int) -> int:
+    writer = ExcelStreamWriter("需求列表", EXPORT_HEADERS, EXPORT_COLUMN_WIDTHS)
+    for row in rows:
+        writer.append(_export_values(row))
+    writer.save(file_path)
+    return writer.rows_written
+
+
+def _write_csv(rows: Iterator[Any], file_path: str, total: int) -> int:
+    count = 0
+    # utf-8-sig: Excel detects the encoding of Chinese text
+    with open(file_path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(EXPORT_HEADERS)
+        for count, row in enumerate(rows, 1):
+            writer.writerow(_export_values(row))
+    return count
+
+
+def _write_pdf(rows: Iterator[Any], file_path: str, total: int) -> int:
+    with open(file_path, "wb") as f:
+        return PDFGenerator.write_requirements_summary_pdf(
+            (row._asdict() for row in rows), f, total
+        )
+
+
+# export_type -> writer(rows, file_path, total) returning the rows written
+EXPORT_WRITERS: Dict[str, Callable[[Iterator[Any], str, int], int]] = {
+    "excel": _write_excel,
+    "csv": _write_csv,
+    "pdf": _write_pdf,
+}
+
+
+# ============================================================================
+# Job execution
+# ============================================================================
+
+@dataclass
+class _ExportPlan:
+    """What an export job reads and how it writes it."""
+
+    data_version: str
+    count: Callable[[], int]
+    rows: Callable[[], Iterator[Any]]
+    write: Callable[[Iterator[Any], str, int], int]
+
+
+def _export_plan(db: Session, export_type: str, tenant_id: int, filters: Dict[str, Any]) -> _ExportPlan:
+    filters = dict(filters)
+    dataset_name = filters.pop("dataset", REQUIREMENTS.name)
+
+    if export_type in COLUMNAR_FORMATS:
+        dataset = get_dataset(dataset_name)
+        if filters:
+            raise ValueError("Analytics exports do not support filters")
+        return _ExportPlan(
+            data_version=data_version(db, dataset, tenant_id),
+            count=lambda: count_rows(db, dataset, tenant_id),
+            rows=lambda: iter_rows(db, dataset, tenant_id),
+            write=lambda rows, path, total: write_columnar(rows, path, dataset, export_type),
+        )
+
+    if dataset_name != REQUIREMENTS.name:
+        raise ValueError(f"{export_type} exports only support the requirements dataset")
+    repo = RequirementRepository(db)
+    return _ExportPlan(
+        data_version=repo.get_data_version(tenant_id),
+        count=lambda: repo.count_for_export(tenant_id, **filters),
+        rows=lambda: repo.iter_for_export(tenant_id, **filters),
+        write=EXPORT_WRITERS[export_type],
+    )
+
+
+def _find_cached_artifact(db: Session, job: ExportJob, cache_key: str) -> Optional[ExportJob]:
+    stmt = (
+        select(ExportJob)
+        .where(
+            ExportJob.tenant_id == job.tenant_id,
+            ExportJob.cache_key == cache_key,
+            ExportJob.status == "completed",
+            ExportJob.id != job.id,
+        )
+        .order_by(ExportJob.id.desc())
+        .limit(1)
+    )
+    cached = db.execute(stmt).scalar_one_or_none()
+    if cached and cached.file_path and os.path.exists(cached.file_path):
+        return cached
+    return None
+
+
+def _tracked(
+    rows: Iterator[Any], job_id: int, session_factory: Callable[[], Session], interval: int
+) -> Iterator[Any]:
+    """Pass rows through, writing processed_records every `interval` rows.
+
+    The row sources read keyset pages with one fully fetched query each,
+    so no cursor is open when progress commits (a file-backed SQLite
+    database cannot commit under an open reader). Progress goes through its
+    own short session so the commit does not expire the ORM rows of the
+    current page in the job session.
+    """
+    for count, row in enumerate(rows, 1):
+        if count % interval == 0:
+            with session_factory() as progress_db:
+                progress_db.execute(
+                    update(ExportJob).where(ExportJob.id == job_id).values(processed_records=count)
+                )
+                progress_db.commit()
+        yield row
+
+
+def run_export_job(
+    job_id: int,
+    session_factory: Callable[[], Session] = SessionLocal,
+    export_dir: Optional[str] = None,
+    progress_interval: int = PROGRESS_INTERVAL,
+) -> None:
+    """
+    Generate the file of an ExportJob (runs on the worker pool).
+
+    Args:
+        job_id: ExportJob ID
+        session_factory: Sync session factory
+        export_dir: Directory for artifacts (default: UPLOAD_DIR/exports)
+        progress_interval: Rows between progress updates
+    """
+    with session_factory() as db:
+        job = db.get(ExportJob, job_id)
+        if job is None:
+            logger.warning("Export job %s not found", job_id)
+            return
+
+        try:
+            filters = normalize_filters(job.filters)
+            plan = _export_plan(db, job.export_type, job.tenant_id, filters)
+            cache_key = export_cache_key(job.tenant_id, job.export_type, filters, plan.data_version)
+            job.cache_key = cache_key
+
+            cached = _find_cached_artifact(db, job, cache_key)
+            if cached is not None:
+                job.file_path = cached.file_path
+                job.file_size = cached.file_size
+                job.total_records = job.processed_records = cached.total_records
+            else:
+                job.total_records = plan.count()
+                job.processed_records = 0
+                db.commit()
+
+                directory = os.path.join(export_dir or os.path.join(settings.UPLOAD_DIR, "exports"), str(job.tenant_id))
+                os.makedirs(directory, exist_ok=True)
+                file_path = os.path.join(directory, f"export_{job.id}.{EXPORT_EXTENSIONS[job.export_type]}")
+
+                # Write to a temporary name so a cached path never points at a partial file
+                partial_path = f"{file_path}.part"
+                rows = _tracked(plan.rows(), job.id, session_factory, progress_interval)
+                try:
+                    written = plan.write(rows, partial_path, job.total_records)
+                    os.replace(partial_path, file_path)
+                finally:
+                    if os.path.exists(partial_path):
+                        os.remove(partial_path)
+
+                job.file_path = file_path
+                job.file_size = os.path.getsize(file_path)
+                job.total_records = job.processed_records = written
+
+            job.download_url = download_url(job.id)
+            job.status = "completed"
+        except Exception as e:
+            logger.exception("Export job %s failed", job_id)
+            db.rollback()
+            job.status = "failed"
+            job.error_message = str(e)
+
+        db.commit()
@@ -0,0 +1,146 @@
+"""Background Excel import of requirements.
+
+The upload is streamed to disk in chunks and an ImportJob is created; the
+HTTP request returns immediately. run_import_job() then runs as a background
+task: it streams the sheet with a read-only workbook, validates rows in
+batches and inserts every batch in its own transaction (see
+RequirementService.bulk_create_requirements), updating the job's
+total_records / success_count / failed_count / error_log after each batch so
+clients can poll progress.
+"""
+import logging
+import os
+import shutil
+import time
+import uuid
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+
+from app.config import get_settings
+from app.core.tenant import tenant_context
+from app.db.base import AsyncSessionLocal
+from app.models.import_job import ImportJob
+from app.services.requirement import RequirementService
+from app.utils.excel import ExcelHandler
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Upload copy chunk size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+# Rows validated and inserted per transaction
+IMPORT_BATCH_SIZE = 500
+# Row errors kept in error_log (failed_count keeps counting)
+MAX_IMPORT_ERRORS = 1000
+
+
+def _copy_upload(source, file_path: str) -> None:
+    source.seek(0)
+    with open(file_path, "wb") as f:
+        shutil.copyfileobj(source, f, UPLOAD_CHUNK_SIZE)
+
+
+async def save_upload(file: UploadFile, upload_dir: str = None) -> str:
+    """
+    Stream an uploaded file to disk without blocking the event loop.
+
+    Args:
+        file: Uploaded file
+        upload_dir: Target directory (default: UPLOAD_DIR/imports)
+
+    Returns:
+        Path of the stored file
+    """
+    upload_dir = upload_dir or os.path.join(settings.UPLOAD_DIR, "imports")
+    os.makedirs(upload_dir, exist_ok=True)
+    # 保留原文件名，加前缀避免重名覆盖
+    file_name = os.path.basename(file.filename or "import.xlsx")
+    file_path = os.path.join(upload_dir, f"{uuid.uuid4().hex}_{file_name}")
+
+    await run_in_threadpool(_copy_upload, file.file, file_path)
+    return file_path
+
+
+def _next_batch(rows: Iterator[Tuple[int, Tuple[Any, ...]]], size: int) -> List[Tuple[int, Tuple[Any, ...]]]:
+    return list(islice(rows, size))
+
+
+async def run_import_job(
+    job_id: int,
+    tenant_id: int,
+    skip_header: bool = True,
+    session_factory: Callable = AsyncSessionLocal,
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> None:
+    """
+    Import the Excel file of an ImportJob.
+
+    Sheet parsing runs in the thread pool one batch at a time; rows of a
+    batch that fail validation are recorded in error_log and the valid rows
+    are committed. Any other error marks the job failed (batches already
+    committed stay imported).
+
+    Args:
+        job_id: ImportJob ID
+        tenant_id: Tenant the requirements are created in
+        skip_header: Whether to skip the header row
+        session_factory: Async session factory
+        batch_size: Rows per transaction
+    """
+    token = tenant_context.set(tenant_id)
+    try:
+        async with session_factory() as db:
+            job = await db.get(ImportJob, job_id)
+            if job is None:
+                logger.warning("Import job %s not found", job_id)
+                return
+
+            job.status = "processing"
+            job.started_at = int(time.time())
+            job.total_records = job.success_count = job.failed_count = 0
+            job.error_log = {"errors": [], "truncated": False}
+            await db.commit()
+
+            service = RequirementService(db)
+            total = created = failed = 0
+            errors: List[Dict[str, Any]] = []
+            rows = ExcelHandler.iter_rows(job.file_path, skip_header)
+            try:
+                while True:
+                    batch = await run_in_threadpool(_next_batch, rows, batch_size)
+                    if not batch:
+                        break
+
+                    items = [ExcelHandler.template_row_to_requirement(values) for _, values in batch]
+                    result = await service.bulk_create_requirements(items, created_by=job.imported_by)
+
+                    total += result.total
+                    created += result.created
+                    failed += result.failed
+                    for row in result.results:
+                        if not row.success and len(errors) < MAX_IMPORT_ERRORS:
+                            errors.append({"row": batch[row.index][0], "error": row.error})
+
+                    job.total_records = total
+                    job.success_count = created
+                    job.failed_count = failed
+                    job.error_log = {"errors": list(errors), "truncated": failed > len(errors)}
+                    await db.commit()
+
+                job.status = "completed"
+            except Exception as e:
+                logger.exception("Import job %s failed", job_id)
+                await db.rollback()
+                await db.refresh(job)
+                job.status = "failed"
+                job.error_log = {**(job.error_log or {}), "fatal": str(e)}
+            finally:
+                rows.close()
+
+            job.completed_at = int(time.time())
+            await db.commit()
+    finally:
+        tenant_context.reset(token)
@@ -5,9 +5,8 @@ from typing import Optional, List, Dict, Any
 from sqlalchemy.orm import Session
 
 from app.models.requirement_review_meeting import RequirementReviewMeeting
-from app.models.requirement_review_meeting_attendee import RequirementReviewMeetingAttendee
-from app.models.user import User
 from app.repositories.requirement_review_meeting import RequirementReviewMeetingRepository
+from app.services.sequence import MEETING_NO, SequenceService
 from app.core.tenant import get_current_tenant
 
 
@@ -52,13 +51,8 @@ class RequirementReviewMeetingService:
 
     def generate_meeting_no(self, tenant_id: int) -> str:
         """Generate meeting number: RM-YYYYMMDD-001."""
-        today = datetime.now().strftime("%Y%m%d")
-        prefix = f"RM-{today}"
-
-        # 查询今天最大的编号
-        max_no = self.repo.get_max_meeting_no(tenant_id, prefix)
-        next_number = (max_no or 0) + 1
-        return f"{prefix}-{next_number:03d}"
+        # meeting_no 全局唯一，使用全局计数器
+        return SequenceService(self.db).next_number(MEETING_NO, tenant_id=tenant_id)
 
     def start_meeting(self, meeting: RequirementReviewMeeting) -> RequirementReviewMeeting:
         """Start a review meeting."""
@@ -87,55 +81,80 @@ class RequirementReviewMeetingService:
         if meeting.status != "in_progress":
             raise ValueError("只有进行中的会议可以结束")
 
-        # 如果启用自动弃权,先处理未投票人员
-        if auto_abstain:
-            self.repo.create_abstain_votes_for_pending_voters(
-                meeting.id,
-                meeting.tenant_id
-            )
-
-        # 更新会议状态
-        updated_meeting = self.repo.update(meeting, {
-            "status": "completed",
-            "ended_at": datetime.now()
-        })
+        # 弃权票、状态变更和结果存档在同一事务中提交
+        try:
+            # 如果启用自动弃权,先处理未投票人员
+            if auto_abstain:
+                self.repo.create_abstain_votes_for_pending_voters(
+                    meeting.id,
+                    meeting.tenant_id,
+                    commit=False
+                )
+
+            # 更新会议状态
+            meeting.status = "completed"
+            meeting.ended_at = datetime.now()
+
+            # 存档所有投票结果
+            self.repo.archive_meeting_results(meeting.id, meeting.tenant_id, commit=False)
 
-        # 存档所有投票结果
-        self.repo.archive_meeting_results(meeting.id, meeting.tenant_id)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
 
-        return updated_meeting
+        self.db.refresh(meeting)
+        return meeting
 
     # ========================================================================
     # Permission Validation
     # ========================================================================
 
-    def can_vote(self, meeting_id: int, user_id: int, requirement_id: Optional[int] = None) -> bool:
-        """Check if user can vote in the meeting.
+    def get_vote_eligibility(
+        self,
+        meeting_id: int,
+        user_id: int,
+        requirement_id: Optional[int] = None,
+        tenant_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Check whether a user can vote, with a single query.
 
         规则：
         1. 会议必须进行中
         2. 用户必须是参会人员
-        3. 所有参会人员都可以投票（不再限制 assigned_voter_ids）
+        3. 所有参会人员都可以投票（不再限制 assigned_voter_ids，仅返回供参考）
 
-        注意：已投票检查在API层处理，返回明确的错误消息
-        """
-        # 检查会议状态（所有用户都必须满足）
-        meeting = self.repo.get(meeting_id, get_current_tenant())
-        if not meeting or meeting.status != "in_progress":
-            return False
+        Args:
+            meeting_id: 会议ID
+            user_id: 用户ID
+            requirement_id: 需求ID
+            tenant_id: 租户ID（默认取当前上下文租户）
 
-        # 获取用户信息
-        user = self.db.query(User).filter(User.id == user_id).first()
-        if not user:
-            return False
+        Returns:
+            {"can_vote", "status", "is_attendee", "is_assigned_voter", "has_voted"}
+        """
+        if tenant_id is None:
+            tenant_id = get_current_tenant()
+
+        eligibility = self.repo.get_vote_eligibility(meeting_id, tenant_id, requirement_id, user_id)
+        if eligibility is None:
+            return {
+                "can_vote": False,
+                "status": None,
+                "is_attendee": False,
+                "is_assigned_voter": False,
+                "has_voted": False
+            }
+
+        eligibility["can_vote"] = eligibility["status"] == "in_progress" and eligibility["is_attendee"]
+        return eligibility
 
-        # 所有用户（包括 admin）都必须是参会人员
-        attendee = self.repo.is_attendee(meeting_id, user_id)
-        if not attendee:
-            return False
+    def can_vote(self, meeting_id: int, user_id: int, requirement_id: Optional[int] = None) -> bool:
+        """Check if user can vote in the meeting (see get_vote_eligibility).
 
-        # 不再检查 assigned_voter_ids，所有参会人员都可以投票
-        return True
+        注意：已投票检查在API层处理，返回明确的错误消息
+        """
+        return self.get_vote_eligibility(meeting_id, user_id, requirement_id)["can_vote"]
 
     def is_moderator(self, meeting: RequirementReviewMeeting, user_id: int) -> bool:
         """Check if user is the meeting moderator."""
@@ -148,3 +167,7 @@ class RequirementReviewMeetingService:
     def get_vote_statistics(self, meeting_id: int, requirement_id: int) -> Dict[str, Any]:
         """Get vote statistics with percentages (using SQL aggregation)."""
         return self.repo.get_vote_statistics(meeting_id, requirement_id)
+
+    def get_meeting_vote_statistics(self, meeting_id: int, tenant_id: int) -> List[Dict[str, Any]]:
+        """Get vote statistics for every requirement of a meeting (two queries in total)."""
+        return self.repo.get_meeting_vote_statistics(meeting_id, tenant_id)
@@ -1,14 +1,13 @@
 """Review service."""
 from typing import Optional, List, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import select, and_, func
-from datetime import datetime, timezone
 
 from app.models.review import Review
 from app.models.requirement import Requirement
 from app.repositories.review import ReviewRepository
 from app.repositories.requirement import RequirementRepository
 from app.repositories.workflow_history import WorkflowHistoryRepository
+from app.services.sequence import REVIEW_NO, SequenceService
 from app.core.tenant import get_current_tenant
 
 
@@ -231,20 +230,4 @@ class ReviewService:
 
     def _generate_review_no(self) -> str:
         """Generate review number: RV-YYYY-XXXX."""
-        year = datetime.now().year
-        tenant_id = get_current_tenant()
-
-        # Count existing reviews for this year
-        stmt = (
-            select(func.count(Review.id))
-            .where(
-                and_(
-                    Review.tenant_id == tenant_id,
-                    Review.review_no.like(f'RV-{year}-%'),
-                )
-            )
-        )
-        count = self.db.execute(stmt).scalar() or 0
-
-        # Format: RV-2026-0001
-        return f'RV-{year}-{str(count + 1).zfill(4)}'
+        return SequenceService(self.db).next_number(REVIEW_NO, tenant_id=get_current_tenant())
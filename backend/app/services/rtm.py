@@ -1,10 +1,17 @@
 """RTM service for business logic."""
-from typing import List, Optional, Dict, Any
+from collections import defaultdict
+from datetime import datetime
+from itertools import groupby
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
+from sqlalchemy import and_, case, exists, func, insert, not_, or_, select
 from sqlalchemy.orm import Session, joinedload
 
 from app.models.rtm import TraceabilityLink
 from app.models.requirement import Requirement
 from app.models.attachment import Attachment
+from app.services.rtm_graph import link_nodes, traceability_graph_index
+from app.utils.excel import ExcelStreamWriter
+from app.utils.pdf import PDFGenerator
 from app.schemas.rtm import (
     TraceabilityLinkCreate,
     TraceabilityLinkUpdate,
@@ -14,99 +21,235 @@ from app.schemas.rtm import (
 )
 
 
+# 覆盖度过滤: 设计/代码/测试全部有关联、部分有关联、全部缺失
+COVERAGE_FILTERS = ("complete", "partial", "missing")
+
+ATTACHMENT_LABELS = {"design": "设计文档", "code": "代码", "test": "测试用例"}
+
+# RTM 导出
+RTM_EXPORT_HEADERS = ['需求ID', '需求标题', '设计文档', '代码', '测试用例', '追溯状态']
+RTM_EXPORT_COLUMN_WIDTHS = [15, 40, 30, 30, 30, 12]
+RTM_EXPORT_CHUNK_SIZE = 1000
+
+
+def _has_item(doc_id, attachment_id):
+    # 文档ID（非空字符串）或附件ID任一存在即视为有该类追溯项
+    return or_(and_(doc_id.isnot(None), doc_id != ""), attachment_id.isnot(None))
+
+
+def _has_design():
+    return _has_item(TraceabilityLink.design_id, TraceabilityLink.design_attachment_id)
+
+
+def _has_code():
+    return _has_item(TraceabilityLink.code_id, TraceabilityLink.code_attachment_id)
+
+
+def _has_test():
+    return _has_item(TraceabilityLink.test_id, TraceabilityLink.test_attachment_id)
+
+
+def requirement_links_statement(requirement_id: int, tenant_id: int):
+    """Query of a requirement's links with their attachments (also EXPLAINed by app.db.index_check)."""
+    return (
+        select(TraceabilityLink)
+        .options(
+            joinedload(TraceabilityLink.design_attachment),
+            joinedload(TraceabilityLink.code_attachment),
+            joinedload(TraceabilityLink.test_attachment),
+        )
+        .where(
+            TraceabilityLink.requirement_id == requirement_id,
+            TraceabilityLink.tenant_id == tenant_id,
+        )
+        .order_by(TraceabilityLink.id)
+    )
+
+
+def _attachment_info(attachment: Optional[Attachment]) -> Optional[AttachmentInfo]:
+    return AttachmentInfo.model_validate(attachment) if attachment else None
+
+
+def _build_matrix_item(
+    req: Any,
+    links: List[TraceabilityLink],
+    description: Optional[str] = None,
+) -> TraceabilityMatrix:
+    """按关联类型把需求的追溯关联分到设计/代码/测试三列."""
+    design_items = []
+    code_items = []
+    test_items = []
+
+    for link in links:
+        if link.design_id or link.design_attachment_id:
+            design_items.append(
+                TraceabilityItem(
+                    id=link.id,
+                    design_id=link.design_id,
+                    design_attachment_id=link.design_attachment_id,
+                    design_attachment=_attachment_info(link.design_attachment),
+                )
+            )
+        if link.code_id or link.code_attachment_id:
+            code_items.append(
+                TraceabilityItem(
+                    id=link.id,
+                    code_id=link.code_id,
+                    code_attachment_id=link.code_attachment_id,
+                    code_attachment=_attachment_info(link.code_attachment),
+                )
+            )
+        if link.test_id or link.test_attachment_id:
+            test_items.append(
+                TraceabilityItem(
+                    id=link.id,
+                    test_id=link.test_id,
+                    test_attachment_id=link.test_attachment_id,
+                    test_attachment=_attachment_info(link.test_attachment),
+                )
+            )
+
+    return TraceabilityMatrix(
+        requirement_id=req.id,  # 数据库ID
+        requirement_no=req.requirement_no,  # 使用业务需求编号
+        requirement_title=req.title or f"需求 {req.requirement_no}",
+        requirement_description=description,
+        design_items=design_items,
+        code_items=code_items,
+        test_items=test_items,
+    )
+
+
 class RTMService:
     """需求追溯矩阵服务."""
 
+    @staticmethod
+    def _matrix_conditions(
+        tenant_id: int,
+        status: Optional[str] = None,
+        coverage: Optional[str] = None,
+    ) -> list:
+        """矩阵需求的过滤条件（覆盖度条件用 EXISTS 子查询在 SQL 中判断）."""
+        conditions = [Requirement.tenant_id == tenant_id]
+        if status:
+            conditions.append(Requirement.status == status)
+        if coverage:
+            if coverage not in COVERAGE_FILTERS:
+                raise ValueError(f"不支持的覆盖度过滤: {coverage}")
+            has_design, has_code, has_test = (
+                exists().where(
+                    TraceabilityLink.requirement_id == Requirement.id,
+                    TraceabilityLink.tenant_id == tenant_id,
+                    has_item,
+                )
+                for has_item in (_has_design(), _has_code(), _has_test())
+            )
+            if coverage == "complete":
+                conditions.append(and_(has_design, has_code, has_test))
+            elif coverage == "partial":
+                conditions.append(and_(
+                    or_(has_design, has_code, has_test),
+                    not_(and_(has_design, has_code, has_test)),
+                ))
+            else:
+                conditions.append(not_(or_(has_design, has_code, has_test)))
+        return conditions
+
+    @staticmethod
+    def count_traceability_matrix(
+        db: Session,
+        tenant_id: int,
+        status: Optional[str] = None,
+        coverage: Optional[str] = None,
+    ) -> int:
+        """
+        统计追溯矩阵的需求数（分页总数）.
+
+        Args:
+            db: 数据库会话
+            tenant_id: 租户ID
+            status: 需求状态过滤
+            coverage: 覆盖度过滤（complete / partial / missing）
+
+        Returns:
+            需求数
+        """
+        conditions = RTMService._matrix_conditions(tenant_id, status, coverage)
+        return db.execute(select(func.count(Requirement.id)).where(*conditions)).scalar_one()
+
     @staticmethod
     def get_traceability_matrix(
         db: Session,
         tenant_id: int,
-        filters: Optional[Dict[str, Any]] = None,
+        status: Optional[str] = None,
+        coverage: Optional[str] = None,
+        include_description: bool = False,
+        page: int = 1,
+        page_size: Optional[int] = None,
     ) -> List[TraceabilityMatrix]:
         """
         获取需求追溯矩阵.
 
+        最多两条查询：一页需求（只取矩阵需要的列），以及这些需求的全部
+        追溯关联（附件通过 JOIN 一并加载）。
+
         Args:
             db: 数据库会话
             tenant_id: 租户ID
-            filters: 过滤条件
+            status: 需求状态过滤
+            coverage: 覆盖度过滤（complete / partial / missing）
+            include_description: 是否返回需求描述
+            page: 页码（从 1 开始）
+            page_size: 每页数量，为空时返回全部
 
         Returns:
-            追溯矩阵列表
-        """
-        # 获取租户下的所有需求
-        requirements_query = db.query(Requirement).filter(
-            Requirement.tenant_id == tenant_id
-        )
-
-        requirements = requirements_query.all()
+            追溯矩阵列表（按需求ID排序）
 
-        # 构建追溯矩阵
-        matrix = []
-        for req in requirements:
-            # 获取该需求的所有追溯关联（预加载附件信息）
-            links = db.query(TraceabilityLink).options(
+        Raises:
+            ValueError: 覆盖度过滤不支持时
+        """
+        conditions = RTMService._matrix_conditions(tenant_id, status, coverage)
+        columns = [Requirement.id, Requirement.requirement_no, Requirement.title]
+        if include_description:
+            columns.append(Requirement.description)
+
+        stmt = select(*columns).where(*conditions).order_by(Requirement.id)
+        if page_size is not None:
+            stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+        requirements = db.execute(stmt).all()
+        if not requirements:
+            return []
+
+        if page_size is not None:
+            requirement_filter = TraceabilityLink.requirement_id.in_([req.id for req in requirements])
+        else:
+            # 不分页时用子查询，避免超长 IN 参数列表
+            requirement_filter = TraceabilityLink.requirement_id.in_(
+                select(Requirement.id).where(*conditions)
+            )
+        links = db.execute(
+            select(TraceabilityLink)
+            .options(
                 joinedload(TraceabilityLink.design_attachment),
                 joinedload(TraceabilityLink.code_attachment),
-                joinedload(TraceabilityLink.test_attachment)
-            ).filter(
-                TraceabilityLink.requirement_id == req.id,
-                TraceabilityLink.tenant_id == tenant_id,
-            ).all()
-
-            # 分类关联项
-            design_items = []
-            code_items = []
-            test_items = []
-
-            for link in links:
-                # 构建附件信息
-                design_att = AttachmentInfo.model_validate(link.design_attachment) if link.design_attachment else None
-                code_att = AttachmentInfo.model_validate(link.code_attachment) if link.code_attachment else None
-                test_att = AttachmentInfo.model_validate(link.test_attachment) if link.test_attachment else None
-
-                # 根据关联类型分类
-                if link.design_id or link.design_attachment_id:
-                    design_items.append(
-                        TraceabilityItem(
-                            id=link.id,
-                            design_id=link.design_id,
-                            design_attachment_id=link.design_attachment_id,
-                            design_attachment=design_att
-                        )
-                    )
-                if link.code_id or link.code_attachment_id:
-                    code_items.append(
-                        TraceabilityItem(
-                            id=link.id,
-                            code_id=link.code_id,
-                            code_attachment_id=link.code_attachment_id,
-                            code_attachment=code_att
-                        )
-                    )
-                if link.test_id or link.test_attachment_id:
-                    test_items.append(
-                        TraceabilityItem(
-                            id=link.id,
-                            test_id=link.test_id,
-                            test_attachment_id=link.test_attachment_id,
-                            test_attachment=test_att
-                        )
-                    )
-
-            matrix.append(
-                TraceabilityMatrix(
-                    requirement_id=req.id,  # 数据库ID
-                    requirement_no=req.requirement_no,  # 使用业务需求编号
-                    requirement_title=req.title or f"需求 {req.requirement_no}",
-                    requirement_description=req.description,  # 添加需求描述
-                    design_items=design_items,
-                    code_items=code_items,
-                    test_items=test_items,
-                )
+                joinedload(TraceabilityLink.test_attachment),
             )
+            .where(TraceabilityLink.tenant_id == tenant_id, requirement_filter)
+            .order_by(TraceabilityLink.id)
+        ).scalars().all()
+
+        links_by_requirement: Dict[int, List[TraceabilityLink]] = defaultdict(list)
+        for link in links:
+            links_by_requirement[link.requirement_id].append(link)
 
-        return matrix
+        return [
+            _build_matrix_item(
+                req,
+                links_by_requirement.get(req.id, []),
+                req.description if include_description else None,
+            )
+            for req in requirements
+        ]
 
     @staticmethod
     def get_requirement_traceability(
@@ -133,60 +276,102 @@ class RTMService:
         if not req:
             return None
 
-        links = db.query(TraceabilityLink).options(
-            joinedload(TraceabilityLink.design_attachment),
-            joinedload(TraceabilityLink.code_attachment),
-            joinedload(TraceabilityLink.test_attachment)
-        ).filter(
-            TraceabilityLink.requirement_id == requirement_id,
-            TraceabilityLink.tenant_id == tenant_id,
-        ).all()
+        links = db.execute(
+            requirement_links_statement(requirement_id, tenant_id)
+        ).scalars().all()
 
-        design_items = []
-        code_items = []
-        test_items = []
+        return _build_matrix_item(req, links)
 
+    @staticmethod
+    def _validate_attachments(db: Session, links: List[Any]) -> None:
+        """用一条 IN 查询校验所有引用的附件存在."""
+        referenced = [
+            (kind, getattr(link, f"{kind}_attachment_id"))
+            for link in links
+            for kind in ATTACHMENT_LABELS
+            if getattr(link, f"{kind}_attachment_id")
+        ]
+        if not referenced:
+            return
+
+        existing = set(db.execute(
+            select(Attachment.id).where(Attachment.id.in_({attachment_id for _, attachment_id in referenced}))
+        ).scalars())
+        for kind, attachment_id in referenced:
+            if attachment_id not in existing:
+                raise ValueError(f"{ATTACHMENT_LABELS[kind]}附件 {attachment_id} 不存在")
+
+    @staticmethod
+    def _validate_links(db: Session, links: List[TraceabilityLinkCreate], tenant_id: int) -> None:
+        """
+        校验待创建的追溯关联：需求和附件各一条 IN 查询.
+
+        Raises:
+            ValueError: 需求或附件不存在，或关联没有任何追溯项时
+        """
+        requirement_ids = {link.requirement_id for link in links}
+        existing = set(db.execute(
+            select(Requirement.id).where(
+                Requirement.tenant_id == tenant_id,
+                Requirement.id.in_(requirement_ids),
+            )
+        ).scalars())
         for link in links:
-            design_att = AttachmentInfo.model_validate(link.design_attachment) if link.design_attachment else None
-            code_att = AttachmentInfo.model_validate(link.code_attachment) if link.code_attachment else None
-            test_att = AttachmentInfo.model_validate(link.test_attachment) if link.test_attachment else None
-
-            if link.design_id or link.design_attachment_id:
-                design_items.append(
-                    TraceabilityItem(
-                        id=link.id,
-                        design_id=link.design_id,
-                        design_attachment_id=link.design_attachment_id,
-                        design_attachment=design_att
-                    )
-                )
-            if link.code_id or link.code_attachment_id:
-                code_items.append(
-                    TraceabilityItem(
-                        id=link.id,
-                        code_id=link.code_id,
-                        code_attachment_id=link.code_attachment_id,
-                        code_attachment=code_att
-                    )
-                )
-            if link.test_id or link.test_attachment_id:
-                test_items.append(
-                    TraceabilityItem(
-                        id=link.id,
-                        test_id=link.test_id,
-                        test_attachment_id=link.test_attachment_id,
-                        test_attachment=test_att
-                    )
-                )
+            if link.requirement_id not in existing:
+                raise ValueError(f"需求 {link.requirement_id} 不存在")
 
-        return TraceabilityMatrix(
-            requirement_id=req.id,  # 数据库ID
-            requirement_no=req.requirement_no,  # 使用业务需求编号
-            requirement_title=req.title or f"需求 {req.requirement_no}",
-            design_items=design_items,
-            code_items=code_items,
-            test_items=test_items,
-        )
+            # 至少需要一个追溯项（文档ID或附件ID）
+            if not link_nodes(link):
+                raise ValueError("至少需要提供一个追溯项（设计文档/代码/测试用例）")
+
+        RTMService._validate_attachments(db, links)
+
+    @staticmethod
+    def bulk_create_links(
+        db: Session,
+        links: List[TraceabilityLinkCreate],
+        tenant_id: int,
+    ) -> List[TraceabilityLink]:
+        """
+        批量创建追溯关联.
+
+        全部校验通过后一次性插入（要么全部创建，要么都不创建）。
+
+        Args:
+            db: 数据库会话
+            links: 关联数据
+            tenant_id: 租户ID
+
+        Returns:
+            创建的关联（按ID排序）
+
+        Raises:
+            ValueError: 任一关联校验失败时
+        """
+        if not links:
+            return []
+        RTMService._validate_links(db, links, tenant_id)
+
+        link_ids = list(db.scalars(
+            insert(TraceabilityLink).returning(TraceabilityLink.id),
+            [{**link.model_dump(), "tenant_id": tenant_id} for link in links],
+        ))
+        db.commit()
+
+        # 提交后重新加载（连同附件）一次，响应和图索引都不再逐条查询
+        created = db.scalars(
+            select(TraceabilityLink)
+            .options(
+                joinedload(TraceabilityLink.design_attachment),
+                joinedload(TraceabilityLink.code_attachment),
+                joinedload(TraceabilityLink.test_attachment),
+            )
+            .where(TraceabilityLink.id.in_(link_ids))
+            .order_by(TraceabilityLink.id)
+        ).unique().all()
+        for link in created:
+            traceability_graph_index.link_saved(link, created=True)
+        return created
 
     @staticmethod
     def create_link(
@@ -205,44 +390,7 @@ class RTMService:
         Returns:
             创建的关联
         """
-        # 验证需求存在
-        req = db.query(Requirement).filter(
-            Requirement.id == link_data.requirement_id,
-            Requirement.tenant_id == tenant_id,
-        ).first()
-
-        if not req:
-            raise ValueError(f"需求 {link_data.requirement_id} 不存在")
-
-        # 至少需要一个追溯项（文档ID或附件ID）
-        has_design = link_data.design_id or link_data.design_attachment_id
-        has_code = link_data.code_id or link_data.code_attachment_id
-        has_test = link_data.test_id or link_data.test_attachment_id
-
-        if not any([has_design, has_code, has_test]):
-            raise ValueError("至少需要提供一个追溯项（设计文档/代码/测试用例）")
-
-        # 如果提供了附件ID，验证附件存在
-        if link_data.design_attachment_id:
-            att = db.query(Attachment).filter(
-                Attachment.id == link_data.design_attachment_id
-            ).first()
-            if not att:
-                raise ValueError(f"设计文档附件 {link_data.design_attachment_id} 不存在")
-
-        if link_data.code_attachment_id:
-            att = db.query(Attachment).filter(
-                Attachment.id == link_data.code_attachment_id
-            ).first()
-            if not att:
-                raise ValueError(f"代码附件 {link_data.code_attachment_id} 不存在")
-
-        if link_data.test_attachment_id:
-            att = db.query(Attachment).filter(
-                Attachment.id == link_data.test_attachment_id
-            ).first()
-            if not att:
-                raise ValueError(f"测试用例附件 {link_data.test_attachment_id} 不存在")
+        RTMService._validate_links(db, [link_data], tenant_id)
 
         # 创建关联
         link = TraceabilityLink(
@@ -260,6 +408,7 @@ class RTMService:
         db.add(link)
         db.commit()
         db.refresh(link)
+        traceability_graph_index.link_saved(link, created=True)
 
         return link
 
@@ -298,34 +447,12 @@ class RTMService:
         if link_data.test_id is not None:
             link.test_id = link_data.test_id
 
-        # 更新附件ID字段
-        if link_data.design_attachment_id is not None:
-            # 验证附件存在
-            if link_data.design_attachment_id:
-                att = db.query(Attachment).filter(
-                    Attachment.id == link_data.design_attachment_id
-                ).first()
-                if not att:
-                    raise ValueError(f"设计文档附件 {link_data.design_attachment_id} 不存在")
-            link.design_attachment_id = link_data.design_attachment_id
-
-        if link_data.code_attachment_id is not None:
-            if link_data.code_attachment_id:
-                att = db.query(Attachment).filter(
-                    Attachment.id == link_data.code_attachment_id
-                ).first()
-                if not att:
-                    raise ValueError(f"代码附件 {link_data.code_attachment_id} 不存在")
-            link.code_attachment_id = link_data.code_attachment_id
-
-        if link_data.test_attachment_id is not None:
-            if link_data.test_attachment_id:
-                att = db.query(Attachment).filter(
-                    Attachment.id == link_data.test_attachment_id
-                ).first()
-                if not att:
-                    raise ValueError(f"测试用例附件 {link_data.test_attachment_id} 不存在")
-            link.test_attachment_id = link_data.test_attachment_id
+        # 更新附件ID字段（0 表示清除关联，不需要校验）
+        RTMService._validate_attachments(db, [link_data])
+        for kind in ("design", "code", "test"):
+            attachment_id = getattr(link_data, f"{kind}_attachment_id")
+            if attachment_id is not None:
+                setattr(link, f"{kind}_attachment_id", attachment_id or None)
 
         if link_data.notes is not None:
             link.notes = link_data.notes
@@ -334,6 +461,7 @@ class RTMService:
 
         db.commit()
         db.refresh(link)
+        traceability_graph_index.link_saved(link, created=False)
 
         return link
 
@@ -364,133 +492,150 @@ class RTMService:
 
         db.delete(link)
         db.commit()
+        traceability_graph_index.link_deleted(tenant_id, link_id)
 
         return True
 
+    @staticmethod
+    def iter_matrix_rows(
+        db: Session,
+        tenant_id: int,
+        chunk_size: int = RTM_EXPORT_CHUNK_SIZE,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        逐个需求流式读取追溯矩阵（导出用）.
+
+        需求 LEFT JOIN 追溯关联，按需求ID排序后用 yield_per 从游标分批读取，
+        相邻的同一需求的行合并为一条，内存占用与需求总数无关。
+
+        Args:
+            db: 数据库会话
+            tenant_id: 租户ID
+            chunk_size: 每批读取的行数
+
+        Returns:
+            需求追溯行（requirement_id, requirement_title, design/code/test 文档ID列表, status）
+        """
+        stmt = (
+            select(
+                Requirement.id,
+                Requirement.requirement_no,
+                Requirement.title,
+                TraceabilityLink.id.label("link_id"),
+                TraceabilityLink.design_id,
+                TraceabilityLink.code_id,
+                TraceabilityLink.test_id,
+                TraceabilityLink.design_attachment_id,
+                TraceabilityLink.code_attachment_id,
+                TraceabilityLink.test_attachment_id,
+            )
+            .select_from(Requirement)
+            .outerjoin(
+                TraceabilityLink,
+                and_(
+                    TraceabilityLink.requirement_id == Requirement.id,
+                    TraceabilityLink.tenant_id == tenant_id,
+                ),
+            )
+            .where(Requirement.tenant_id == tenant_id)
+            .order_by(Requirement.id, TraceabilityLink.id)
+            .execution_options(yield_per=chunk_size)
+        )
+
+        for requirement_id, rows in groupby(db.execute(stmt), key=lambda row: row.id):
+            items: Dict[str, List[str]] = {"design": [], "code": [], "test": []}
+            for row in rows:
+                if row.link_id is None:
+                    continue
+                for kind, doc_ids in items.items():
+                    doc_id = getattr(row, f"{kind}_id")
+                    if doc_id or getattr(row, f"{kind}_attachment_id"):
+                        doc_ids.append(doc_id or '')
+
+            covered = sum(1 for doc_ids in items.values() if doc_ids)
+            yield {
+                'requirement_id': requirement_id,
+                'requirement_title': row.title or f"需求 {row.requirement_no}",
+                'design': items['design'],
+                'code': items['code'],
+                'test': items['test'],
+                'status': '完整' if covered == 3 else '部分' if covered else '缺失',
+            }
+
     @staticmethod
     def export_to_excel(
         db: Session,
         tenant_id: int,
-    ) -> bytes:
+        output: BinaryIO,
+    ) -> int:
         """
         导出需求追溯矩阵为 Excel.
 
+        行从数据库游标流式写入 write-only 工作簿，汇总行来自聚合查询。
+
         Args:
             db: 数据库会话
             tenant_id: 租户ID
+            output: 写入的二进制文件对象
 
         Returns:
-            Excel 文件的字节流
+            导出的需求数
         """
-        from openpyxl import Workbook
-        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-        from datetime import datetime
-        import io
-
-        # 获取追溯矩阵数据
-        matrix = rtm_service.get_traceability_matrix(db, tenant_id)
-
-        # 创建工作簿
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "需求追溯矩阵"
-
-        # 定义样式
-        header_font = Font(name='微软雅黑', size=11, bold=True, color='FFFFFF')
-        header_fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
-        header_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-        cell_alignment = Alignment(horizontal='left', vertical='center', wrap_text=True)
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
+        writer = ExcelStreamWriter(
+            "需求追溯矩阵", RTM_EXPORT_HEADERS, RTM_EXPORT_COLUMN_WIDTHS, font_name='微软雅黑'
         )
-
-        # 设置列宽
-        ws.column_dimensions['A'].width = 15  # 需求ID
-        ws.column_dimensions['B'].width = 40  # 需求标题
-        ws.column_dimensions['C'].width = 30  # 设计文档
-        ws.column_dimensions['D'].width = 30  # 代码
-        ws.column_dimensions['E'].width = 30  # 测试用例
-        ws.column_dimensions['F'].width = 12  # 状态
-
-        # 写入表头
-        headers = ['需求ID', '需求标题', '设计文档', '代码', '测试用例', '追溯状态']
-        ws.append(headers)
-
-        # 应用表头样式
-        for col_num, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_num)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-            cell.border = border
-
-        # 写入数据
-        for row_num, item in enumerate(matrix, 2):
-            # 获取追溯项
-            design_items = ', '.join([d.design_id or '' for d in item.design_items]) if item.design_items else '无'
-            code_items = ', '.join([c.code_id or '' for c in item.code_items]) if item.code_items else '无'
-            test_items = ', '.join([t.test_id or '' for t in item.test_items]) if item.test_items else '无'
-
-            # 计算状态
-            has_design = len(item.design_items) > 0
-            has_code = len(item.code_items) > 0
-            has_test = len(item.test_items) > 0
-
-            if has_design and has_code and has_test:
-                status = '完整'
-            elif has_design or has_code or has_test:
-                status = '部分'
-            else:
-                status = '缺失'
-
-            ws.append([
-                item.requirement_id,
-                item.requirement_title,
-                design_items,
-                code_items,
-                test_items,
-                status
+        for row in rtm_service.iter_matrix_rows(db, tenant_id):
+            writer.append([
+                row['requirement_id'],
+                row['requirement_title'],
+                ', '.join(row['design']) if row['design'] else '无',
+                ', '.join(row['code']) if row['code'] else '无',
+                ', '.join(row['test']) if row['test'] else '无',
+                row['status'],
             ])
 
-            # 应用单元格样式
-            for col_num in range(1, 7):
-                cell = ws.cell(row=row_num, column=col_num)
-                cell.alignment = cell_alignment
-                cell.border = border
-
         # 添加汇总信息
-        row_num = len(matrix) + 3
-        ws.cell(row=row_num, column=1, value='汇总统计')
-        ws.cell(row=row_num, column=1).font = Font(name='微软雅黑', size=12, bold=True)
-        row_num += 1
-
-        total = len(matrix)
-        complete = sum(1 for item in matrix
-                      if len(item.design_items) > 0 and len(item.code_items) > 0 and len(item.test_items) > 0)
-        partial = sum(1 for item in matrix
-                     if (len(item.design_items) > 0 or len(item.code_items) > 0 or len(item.test_items) > 0)
-                     and not (len(item.design_items) > 0 and len(item.code_items) > 0 and len(item.test_items) > 0))
-        missing = sum(1 for item in matrix if len(item.design_items) == 0 and len(item.code_items) == 0 and len(item.test_items) == 0)
-
-        ws.cell(row=row_num, column=1, value=f'总计需求: {total}')
-        row_num += 1
-        ws.cell(row=row_num, column=1, value=f'完整追溯: {complete}')
-        row_num += 1
-        ws.cell(row=row_num, column=1, value=f'部分追溯: {partial}')
-        row_num += 1
-        ws.cell(row=row_num, column=1, value=f'缺失追溯: {missing}')
-        row_num += 2
-        ws.cell(row=row_num, column=1, value=f'导出时间: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
-
-        # 保存到字节流
-        output = io.BytesIO()
-        wb.save(output)
-        output.seek(0)
-
-        return output.read()
+        stats = rtm_service.get_statistics(db, tenant_id)
+        writer.append_note()
+        writer.append_note('汇总统计', bold=True)
+        writer.append_note(f"总计需求: {stats['total']}")
+        writer.append_note(f"完整追溯: {stats['complete']}")
+        writer.append_note(f"部分追溯: {stats['partial']}")
+        writer.append_note(f"缺失追溯: {stats['missing']}")
+        writer.append_note()
+        writer.append_note(f'导出时间: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
+
+        writer.save(output)
+        return writer.rows_written
+
+    @staticmethod
+    def export_to_pdf(
+        db: Session,
+        tenant_id: int,
+        output: BinaryIO,
+    ) -> int:
+        """
+        导出需求追溯矩阵为 PDF（逐行写入）.
+
+        Args:
+            db: 数据库会话
+            tenant_id: 租户ID
+            output: 写入的二进制文件对象
+
+        Returns:
+            导出的需求数
+        """
+        entries = (
+            {
+                'requirement_id': row['requirement_id'],
+                'design_id': ', '.join(row['design']) if row['design'] else '-',
+                'code_id': ', '.join(row['code']) if row['code'] else '-',
+                'test_id': ', '.join(row['test']) if row['test'] else '-',
+                'status': row['status'],
+            }
+            for row in rtm_service.iter_matrix_rows(db, tenant_id)
+        )
+        return PDFGenerator.write_rtm_pdf(entries, output)
 
     @staticmethod
     def get_statistics(
@@ -500,6 +645,8 @@ class RTMService:
         """
         获取追溯矩阵统计数据.
 
+        在数据库中按需求分组汇总追溯关联，一条查询完成，不构建追溯矩阵。
+
         Args:
             db: 数据库会话
             tenant_id: 租户ID
@@ -507,20 +654,41 @@ class RTMService:
         Returns:
             统计数据字典
         """
-        matrix = rtm_service.get_traceability_matrix(db, tenant_id)
-
-        total = len(matrix)
-        complete = sum(1 for item in matrix
-                      if len(item.design_items) > 0 and len(item.code_items) > 0 and len(item.test_items) > 0)
-        partial = sum(1 for item in matrix
-                     if (len(item.design_items) > 0 or len(item.code_items) > 0 or len(item.test_items) > 0)
-                     and not (len(item.design_items) > 0 and len(item.code_items) > 0 and len(item.test_items) > 0))
-        missing = sum(1 for item in matrix if len(item.design_items) == 0 and len(item.code_items) == 0 and len(item.test_items) == 0)
-
-        # 统计设计、代码、测试的覆盖率
-        with_design = sum(1 for item in matrix if len(item.design_items) > 0)
-        with_code = sum(1 for item in matrix if len(item.code_items) > 0)
-        with_test = sum(1 for item in matrix if len(item.test_items) > 0)
+        # 每个需求一行覆盖标记（设计/代码/测试是否有关联），再整体汇总：一条查询
+        coverage = (
+            select(
+                TraceabilityLink.requirement_id.label("requirement_id"),
+                func.max(case((_has_design(), 1), else_=0)).label("has_design"),
+                func.max(case((_has_code(), 1), else_=0)).label("has_code"),
+                func.max(case((_has_test(), 1), else_=0)).label("has_test"),
+            )
+            .where(TraceabilityLink.tenant_id == tenant_id)
+            .group_by(TraceabilityLink.requirement_id)
+            .subquery()
+        )
+        has_design = func.coalesce(coverage.c.has_design, 0)
+        has_code = func.coalesce(coverage.c.has_code, 0)
+        has_test = func.coalesce(coverage.c.has_test, 0)
+        covered = has_design + has_code + has_test
+
+        row = db.execute(
+            select(
+                func.count(Requirement.id),
+                func.sum(case((covered == 3, 1), else_=0)),
+                func.sum(case((covered.between(1, 2), 1), else_=0)),
+                func.sum(case((covered == 0, 1), else_=0)),
+                func.sum(has_design),
+                func.sum(has_code),
+                func.sum(has_test),
+            )
+            .select_from(Requirement)
+            .outerjoin(coverage, coverage.c.requirement_id == Requirement.id)
+            .where(Requirement.tenant_id == tenant_id)
+        ).one()
+        # 没有需求时 SUM 为 NULL
+        total, complete, partial, missing, with_design, with_code, with_test = (
+            int(value or 0) for value in row
+        )
 
         return {
             'total': total,
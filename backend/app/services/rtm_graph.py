@@ -0,0 +1,298 @@
+"""In-memory traceability graph for impact analysis.
+
+Each tenant's traceability links are held as an undirected bipartite graph:
+requirement nodes ("requirement", id) are connected to the artifacts their
+links reference, i.e. design / code / test document IDs ("design", "DES-1")
+and attachments ("attachment", 12). Reverse lookups ("which requirements
+reference this test?") are a dict lookup, and transitive impact ("what does
+a change to this design reach?") is a breadth-first walk, neither touching
+the database.
+
+Graphs are built from one query on first use, kept in a process-wide LRU
+(RTM_GRAPH_MAX_TENANTS) and updated incrementally by RTMService when links
+are created, updated or deleted. Other worker processes (and cascading
+requirement deletes) change links behind this process's back, so a cached
+graph is checked against the tenant's link version at most every
+RTM_GRAPH_REVALIDATE_SECONDS and rebuilt when it differs.
+"""
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict, deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.rtm import TraceabilityLink
+
+settings = get_settings()
+
+NODE_KINDS = ("requirement", "design", "code", "test", "attachment")
+
+Node = Tuple[str, Any]
+# (link count, max link id, max updated_at) of a tenant's links
+LinkVersion = Tuple[int, Optional[int], Optional[datetime]]
+
+
+def make_node(kind: str, value: Any) -> Node:
+    """
+    Build a graph node from a kind and a raw value (e.g. a query parameter).
+
+    Raises:
+        ValueError: If the kind is unknown or the ID is not an integer
+    """
+    if kind not in NODE_KINDS:
+        raise ValueError(f"不支持的节点类型: {kind}")
+    if kind in ("requirement", "attachment"):
+        try:
+            return kind, int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{kind} 节点需要整数ID: {value}")
+    return kind, str(value)
+
+
+def link_nodes(link: Any) -> Tuple[Node, ...]:
+    """Artifact nodes referenced by a link (anything with TraceabilityLink's columns)."""
+    nodes = []
+    for kind in ("design", "code", "test"):
+        doc_id = getattr(link, f"{kind}_id")
+        if doc_id:
+            nodes.append((kind, doc_id))
+    for kind in ("design", "code", "test"):
+        attachment_id = getattr(link, f"{kind}_attachment_id")
+        if attachment_id:
+            nodes.append(("attachment", attachment_id))
+    return tuple(dict.fromkeys(nodes))
+
+
+class TraceabilityGraph:
+    """Traceability links of one tenant as a requirement/artifact graph."""
+
+    def __init__(self, version: LinkVersion = (0, None, None)):
+        # node -> neighbour -> number of links connecting them
+        self._edges: Dict[Node, Counter] = defaultdict(Counter)
+        # link id -> (requirement node, artifact nodes)
+        self._links: Dict[int, Tuple[Node, Tuple[Node, ...]]] = {}
+        self.version = version
+        self.checked_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._links)
+
+    def add_link(self, link: Any) -> None:
+        """Add a link, replacing an earlier version of the same link."""
+        self.remove_link(link.id)
+        requirement = ("requirement", link.requirement_id)
+        nodes = link_nodes(link)
+        for node in nodes:
+            self._edges[requirement][node] += 1
+            self._edges[node][requirement] += 1
+        self._links[link.id] = (requirement, nodes)
+
+    def remove_link(self, link_id: int) -> bool:
+        """Remove a link; returns whether it was in the graph."""
+        entry = self._links.pop(link_id, None)
+        if entry is None:
+            return False
+        requirement, nodes = entry
+        for node in nodes:
+            self._disconnect(requirement, node)
+            self._disconnect(node, requirement)
+        return True
+
+    def _disconnect(self, node: Node, neighbour: Node) -> None:
+        edges = self._edges[node]
+        edges[neighbour] -= 1
+        if edges[neighbour] <= 0:
+            del edges[neighbour]
+        if not edges:
+            del self._edges[node]
+
+    def neighbours(self, node: Node) -> List[Node]:
+        """Directly connected nodes (artifacts of a requirement or requirements of an artifact)."""
+        return sorted(self._edges.get(node, ()), key=_node_sort_key)
+
+    def impact(self, start: Node, max_depth: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Nodes reachable from start, breadth first.
+
+        A requirement's artifacts are at depth 1, other requirements sharing
+        those artifacts at depth 2, and so on.
+
+        Args:
+            start: Changed requirement or artifact
+            max_depth: Maximum number of hops (None: unlimited)
+
+        Returns:
+            Reached nodes as {"kind", "id", "depth"}, by depth then node
+        """
+        depths = {start: 0}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            depth = depths[node]
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for neighbour in self._edges.get(node, ()):
+                if neighbour not in depths:
+                    depths[neighbour] = depth + 1
+                    queue.append(neighbour)
+        del depths[start]
+        return [
+            {"kind": node[0], "id": node[1], "depth": depth}
+            for node, depth in sorted(depths.items(), key=lambda item: (item[1], _node_sort_key(item[0])))
+        ]
+
+
+def _node_sort_key(node: Node) -> Tuple[int, Any]:
+    # IDs of one kind share a type (int or str), so they compare with each other
+    return NODE_KINDS.index(node[0]), node[1]
+
+
+def _link_columns():
+    return (
+        TraceabilityLink.id,
+        TraceabilityLink.requirement_id,
+        TraceabilityLink.design_id,
+        TraceabilityLink.code_id,
+        TraceabilityLink.test_id,
+        TraceabilityLink.design_attachment_id,
+        TraceabilityLink.code_attachment_id,
+        TraceabilityLink.test_attachment_id,
+        TraceabilityLink.updated_at,
+    )
+
+
+def load_link_version(db: Session, tenant_id: int) -> LinkVersion:
+    """Version of a tenant's links: changes whenever a link is added, changed or removed."""
+    count, max_id, max_updated_at = db.execute(
+        select(
+            func.count(TraceabilityLink.id),
+            func.max(TraceabilityLink.id),
+            func.max(TraceabilityLink.updated_at),
+        ).where(TraceabilityLink.tenant_id == tenant_id)
+    ).one()
+    return count, max_id, max_updated_at
+
+
+def build_graph(db: Session, tenant_id: int) -> TraceabilityGraph:
+    """Build a tenant's graph from one query over its links."""
+    rows = db.execute(
+        select(*_link_columns()).where(TraceabilityLink.tenant_id == tenant_id)
+    ).all()
+    graph = TraceabilityGraph(
+        (
+            len(rows),
+            max((row.id for row in rows), default=None),
+            max((row.updated_at for row in rows), default=None),
+        )
+    )
+    for row in rows:
+        graph.add_link(row)
+    return graph
+
+
+class TraceabilityGraphIndex:
+    """LRU of tenant traceability graphs."""
+
+    def __init__(
+        self,
+        max_tenants: int = settings.RTM_GRAPH_MAX_TENANTS,
+        revalidate_seconds: float = settings.RTM_GRAPH_REVALIDATE_SECONDS,
+    ):
+        self.max_tenants = max_tenants
+        self.revalidate_seconds = revalidate_seconds
+        self._graphs: "OrderedDict[int, TraceabilityGraph]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __contains__(self, tenant_id: int) -> bool:
+        return tenant_id in self._graphs
+
+    def get(self, db: Session, tenant_id: int) -> TraceabilityGraph:
+        """
+        Graph of a tenant, building or revalidating it when needed.
+
+        Callers must not mutate the graph and should read it while holding
+        the index (see lookup / impact).
+        """
+        with self._lock:
+            graph = self._graphs.get(tenant_id)
+            if graph is not None:
+                self._graphs.move_to_end(tenant_id)
+                if time.monotonic() - graph.checked_at < self.revalidate_seconds:
+                    return graph
+
+        if graph is not None and load_link_version(db, tenant_id) == graph.version:
+            graph.checked_at = time.monotonic()
+            return graph
+
+        graph = build_graph(db, tenant_id)
+        with self._lock:
+            self._graphs[tenant_id] = graph
+            self._graphs.move_to_end(tenant_id)
+            while len(self._graphs) > self.max_tenants:
+                self._graphs.popitem(last=False)
+        return graph
+
+    def lookup(self, db: Session, tenant_id: int, node: Node) -> List[Dict[str, Any]]:
+        """Nodes directly connected to node."""
+        graph = self.get(db, tenant_id)
+        with self._lock:
+            return [{"kind": kind, "id": value} for kind, value in graph.neighbours(node)]
+
+    def impact(
+        self, db: Session, tenant_id: int, node: Node, max_depth: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Nodes transitively reachable from node (see TraceabilityGraph.impact)."""
+        graph = self.get(db, tenant_id)
+        with self._lock:
+            return graph.impact(node, max_depth)
+
+    def link_saved(self, link: TraceabilityLink, created: bool) -> None:
+        """Apply a committed link insert or update to a cached graph."""
+        with self._lock:
+            graph = self._graphs.get(link.tenant_id)
+            if graph is None:
+                return
+            count, max_id, max_updated_at = graph.version
+            graph.add_link(link)
+            graph.version = (
+                count + 1 if created else count,
+                max(filter(None, (max_id, link.id))),
+                max(filter(None, (max_updated_at, link.updated_at))),
+            )
+
+    def link_deleted(self, tenant_id: int, link_id: int) -> None:
+        """Apply a committed link delete to a cached graph."""
+        with self._lock:
+            graph = self._graphs.get(tenant_id)
+            if graph is None or not graph.remove_link(link_id):
+                return
+            count, max_id, max_updated_at = graph.version
+            if count <= 1:
+                graph.version = (0, None, None)
+            else:
+                # If the deleted link held the max id / updated_at, the next
+                # revalidation sees a different version and rebuilds
+                graph.version = (count - 1, max_id, max_updated_at)
+
+    def invalidate(self, tenant_id: Optional[int] = None) -> None:
+        """Drop one tenant's graph, or all graphs."""
+        with self._lock:
+            if tenant_id is None:
+                self._graphs.clear()
+            else:
+                self._graphs.pop(tenant_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "tenants": len(self._graphs),
+                "max_tenants": self.max_tenants,
+                "links": sum(len(graph) for graph in self._graphs.values()),
+            }
+
+
+traceability_graph_index = TraceabilityGraphIndex()
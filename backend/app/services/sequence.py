@@ -0,0 +1,351 @@
+"""Business number sequence service.
+
+All human readable entity numbers (REQ-2026-0001, RM-20260204-001,
+Ai-insight-00001, ...) are allocated from a counter row in business_sequences
+keyed by (tenant_id, prefix, period). A number is taken with a single
+
+    UPDATE business_sequences SET last_value = last_value + n ... RETURNING last_value
+
+so allocation is O(1) and concurrent creates never receive the same value:
+the row lock is held until the caller's transaction commits. The counter row
+for a new period is created on first use, seeded from the highest number
+already stored for that prefix so existing data keeps counting up.
+
+Distribution target IDs (SP-001, CHARTER-012, ...) use the same counters,
+one per tenant and target type; Requirement.target_id stores the numeric
+part only, so those counters are seeded from the column's maximum.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.dialects import insert_ignore
+from app.models.feedback import Feedback
+from app.models.insight import InsightAnalysis
+from app.models.requirement import Requirement
+from app.models.requirement_review_meeting import RequirementReviewMeeting
+from app.models.review import Review
+from app.models.sequence import BusinessSequence
+
+# tenant_id of counters shared by all tenants (numbers unique across tenants)
+GLOBAL_TENANT_ID = 0
+
+
+@dataclass(frozen=True)
+class SequenceSpec:
+    """Format of one kind of business number.
+
+    Attributes:
+        prefix: Leading part of the number ("REQ", "RM", ...)
+        period_format: strftime format of the period part ("" = never resets)
+        width: Zero padded width of the sequence part
+        column: Column storing the number (used to seed a new counter)
+        per_tenant: Count per tenant, or globally when the column is unique
+            across tenants
+        utc: Derive the period from UTC instead of local time
+        numeric: The column stores only the integer sequence value
+        seed_filter: Extra condition on rows seeding a new counter
+    """
+
+    prefix: str
+    period_format: str
+    width: int
+    column: Any
+    per_tenant: bool = False
+    utc: bool = False
+    numeric: bool = False
+    seed_filter: Any = field(default=None, compare=False)
+
+    def period(self, now: Optional[datetime] = None) -> str:
+        if not self.period_format:
+            return ""
+        if now is None:
+            now = datetime.utcnow() if self.utc else datetime.now()
+        return now.strftime(self.period_format)
+
+    def number_prefix(self, period: str) -> str:
+        """Everything before the sequence part, e.g. "REQ-2026-"."""
+        return f"{self.prefix}-{period}-" if period else f"{self.prefix}-"
+
+    def format(self, period: str, value: int) -> str:
+        return f"{self.number_prefix(period)}{value:0{self.width}d}"
+
+
+REQUIREMENT_NO = SequenceSpec("REQ", "%Y", 4, Requirement.requirement_no, utc=True)
+MEETING_NO = SequenceSpec("RM", "%Y%m%d", 3, RequirementReviewMeeting.meeting_no)
+INSIGHT_NUMBER = SequenceSpec("Ai-insight", "", 5, InsightAnalysis.insight_number)
+REVIEW_NO = SequenceSpec("RV", "%Y", 4, Review.review_no)
+FEEDBACK_NO = SequenceSpec("FB", "%Y", 4, Feedback.feedback_no, per_tenant=True)
+
+# Distribution target IDs per target type (requirements.target_type)
+TARGET_IDS: Dict[str, SequenceSpec] = {
+    target_type: SequenceSpec(
+        prefix, "", 3, Requirement.target_id,
+        per_tenant=True, numeric=True, seed_filter=Requirement.target_type == target_type,
+    )
+    for target_type, prefix in (("sp", "SP"), ("bp", "BP"), ("charter", "CHARTER"), ("pcr", "PCR"))
+}
+
+
+def target_id_spec(target_type: str) -> SequenceSpec:
+    """
+    Sequence of a distribution target type.
+
+    Raises:
+        ValueError: If the target type is unknown
+    """
+    if target_type not in TARGET_IDS:
+        raise ValueError(f"Unknown target type: {target_type}")
+    return TARGET_IDS[target_type]
+
+
+# ============================================================================
+# Statement builders shared by the sync and async services
+# ============================================================================
+
+def _sequence_key(
+    spec: SequenceSpec, tenant_id: Optional[int], now: Optional[datetime]
+) -> Tuple[int, str]:
+    """(counter tenant_id, period) for an allocation."""
+    if spec.per_tenant:
+        if tenant_id is None:
+            raise ValueError(f"tenant_id is required for {spec.prefix} numbers")
+        counter_tenant = tenant_id
+    else:
+        counter_tenant = GLOBAL_TENANT_ID
+    return counter_tenant, spec.period(now)
+
+
+def _increment_stmt(spec: SequenceSpec, counter_tenant: int, period: str, count: int):
+    table = BusinessSequence.__table__
+    return (
+        update(table)
+        .where(
+            table.c.tenant_id == counter_tenant,
+            table.c.prefix == spec.prefix,
+            table.c.period == period,
+        )
+        .values(last_value=table.c.last_value + count, updated_at=func.now())
+        .returning(table.c.last_value)
+    )
+
+
+def _current_value_stmt(spec: SequenceSpec, counter_tenant: int, period: str):
+    table = BusinessSequence.__table__
+    return select(table.c.last_value).where(
+        table.c.tenant_id == counter_tenant,
+        table.c.prefix == spec.prefix,
+        table.c.period == period,
+    )
+
+
+def _existing_max_stmt(spec: SequenceSpec, tenant_id: Optional[int], period: str):
+    """Highest stored number for the prefix (longest first, then lexical)."""
+    column = spec.column
+    if spec.numeric:
+        stmt = select(func.max(column))
+    else:
+        stmt = (
+            select(column)
+            .where(column.like(f"{spec.number_prefix(period)}%"))
+            .order_by(func.length(column).desc(), column.desc())
+            .limit(1)
+        )
+    if spec.seed_filter is not None:
+        stmt = stmt.where(spec.seed_filter)
+    if spec.per_tenant:
+        stmt = stmt.where(spec.column.class_.tenant_id == tenant_id)
+    return stmt
+
+
+def _parse_sequence(number: Optional[str]) -> int:
+    if not number:
+        return 0
+    try:
+        return int(number.rsplit("-", 1)[-1])
+    except ValueError:
+        return 0
+
+
+def _seed_value(spec: SequenceSpec, stored: Any) -> int:
+    return int(stored or 0) if spec.numeric else _parse_sequence(stored)
+
+
+def _create_counter_stmt(dialect_name: str, counter_tenant: int, prefix: str, period: str, seed: int):
+    return insert_ignore(dialect_name, BusinessSequence.__table__, {
+        "tenant_id": counter_tenant,
+        "prefix": prefix,
+        "period": period,
+        "last_value": seed,
+    })
+
+
+def _block(last_value: int, count: int) -> List[int]:
+    return list(range(last_value - count + 1, last_value + 1))
+
+
+# ============================================================================
+# Services
+# ============================================================================
+
+class SequenceService:
+    """Allocate business numbers on a sync Session."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def next_number(
+        self,
+        spec: SequenceSpec,
+        tenant_id: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> str:
+        """
+        Allocate the next number of a sequence.
+
+        Args:
+            spec: Sequence spec (REQUIREMENT_NO, MEETING_NO, ...)
+            tenant_id: Tenant ID (required for per-tenant sequences)
+            now: Time used for the period part (default: current time)
+
+        Returns:
+            Formatted business number
+        """
+        return self.reserve_numbers(spec, 1, tenant_id=tenant_id, now=now)[0]
+
+    def reserve_numbers(
+        self,
+        spec: SequenceSpec,
+        count: int,
+        tenant_id: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> List[str]:
+        """
+        Allocate a contiguous block of numbers with one UPDATE.
+
+        Args:
+            spec: Sequence spec
+            count: Number of values to reserve
+            tenant_id: Tenant ID (required for per-tenant sequences)
+            now: Time used for the period part (default: current time)
+
+        Returns:
+            Formatted business numbers in ascending order
+        """
+        period, values = self._reserve(spec, count, tenant_id, now)
+        return [spec.format(period, value) for value in values]
+
+    def reserve_values(
+        self,
+        spec: SequenceSpec,
+        count: int,
+        tenant_id: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> List[int]:
+        """Allocate a contiguous block of raw sequence values (see reserve_numbers)."""
+        return self._reserve(spec, count, tenant_id, now)[1]
+
+    def peek_value(
+        self,
+        spec: SequenceSpec,
+        tenant_id: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> int:
+        """
+        Raw value the next allocation would return, without reserving it.
+
+        Only a preview: a concurrent allocation may take the value first.
+        Neither the counter nor a missing counter row is written.
+        """
+        counter_tenant, period = _sequence_key(spec, tenant_id, now)
+        last_value = self.db.execute(
+            _current_value_stmt(spec, counter_tenant, period)
+        ).scalar_one_or_none()
+        if last_value is None:
+            last_value = _seed_value(
+                spec, self.db.execute(_existing_max_stmt(spec, tenant_id, period)).scalar_one_or_none()
+            )
+        return last_value + 1
+
+    def _reserve(
+        self, spec: SequenceSpec, count: int, tenant_id: Optional[int], now: Optional[datetime]
+    ) -> Tuple[str, List[int]]:
+        if count < 1:
+            return "", []
+        counter_tenant, period = _sequence_key(spec, tenant_id, now)
+
+        stmt = _increment_stmt(spec, counter_tenant, period, count)
+        last_value = self.db.execute(stmt).scalar_one_or_none()
+        if last_value is None:
+            seed = _seed_value(
+                spec, self.db.execute(_existing_max_stmt(spec, tenant_id, period)).scalar_one_or_none()
+            )
+            dialect_name = self.db.get_bind().dialect.name
+            self.db.execute(
+                _create_counter_stmt(dialect_name, counter_tenant, spec.prefix, period, seed)
+            )
+            last_value = self.db.execute(stmt).scalar_one()
+
+        return period, _block(last_value, count)
+
+
+class AsyncSequenceService:
+    """Allocate business numbers on an AsyncSession."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def next_number(
+        self,
+        spec: SequenceSpec,
+        tenant_id: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> str:
+        """Allocate the next number of a sequence (see SequenceService)."""
+        numbers = await self.reserve_numbers(spec, 1, tenant_id=tenant_id, now=now)
+        return numbers[0]
+
+    async def reserve_numbers(
+        self,
+        spec: SequenceSpec,
+        count: int,
+        tenant_id: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> List[str]:
+        """Allocate a contiguous block of numbers (see SequenceService)."""
+        period, values = await self._reserve(spec, count, tenant_id, now)
+        return [spec.format(period, value) for value in values]
+
+    async def reserve_values(
+        self,
+        spec: SequenceSpec,
+        count: int,
+        tenant_id: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> List[int]:
+        """Allocate a contiguous block of raw sequence values (see SequenceService)."""
+        return (await self._reserve(spec, count, tenant_id, now))[1]
+
+    async def _reserve(
+        self, spec: SequenceSpec, count: int, tenant_id: Optional[int], now: Optional[datetime]
+    ) -> Tuple[str, List[int]]:
+        if count < 1:
+            return "", []
+        counter_tenant, period = _sequence_key(spec, tenant_id, now)
+
+        stmt = _increment_stmt(spec, counter_tenant, period, count)
+        last_value = (await self.db.execute(stmt)).scalar_one_or_none()
+        if last_value is None:
+            result = await self.db.execute(_existing_max_stmt(spec, tenant_id, period))
+            seed = _seed_value(spec, result.scalar_one_or_none())
+            dialect_name = self.db.get_bind().dialect.name
+            await self.db.execute(
+                _create_counter_stmt(dialect_name, counter_tenant, spec.prefix, period, seed)
+            )
+            last_value = (await self.db.execute(stmt)).scalar_one()
+
+        return period, _block(last_value, count)
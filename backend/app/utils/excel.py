@@ -1,11 +1,132 @@
 """Excel import/export utility."""
-from typing import List, Dict, Any, Optional
+from typing import BinaryIO, List, Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple
 from datetime import datetime
 import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
 from openpyxl.utils import get_column_letter
 import io
 
+# StreamingResponse chunk size for generated files
+FILE_CHUNK_SIZE = 64 * 1024
+
+
+# 模板“来源”列：中文名称 -> source_channel
+SOURCE_CHANNEL_LABELS = {
+    "客户": "customer",
+    "市场": "market",
+    "竞争": "competition",
+    "销售": "sales",
+    "售后": "after_sales",
+    "技术": "rd",
+    "研发": "rd",
+}
+
+
+def _cell_text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def _thin_border() -> Border:
+    return Border(
+        left=Side(style="thin"),
+        right=Side(style="thin"),
+        top=Side(style="thin"),
+        bottom=Side(style="thin"),
+    )
+
+
+def header_style(font_name: Optional[str] = None) -> NamedStyle:
+    """Named style of header cells (white bold text on blue)."""
+    return NamedStyle(
+        name="export_header",
+        font=Font(name=font_name, bold=True, color="FFFFFF", size=11),
+        fill=PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid"),
+        alignment=Alignment(horizontal="center", vertical="center", wrap_text=True),
+        border=_thin_border(),
+    )
+
+
+def body_style(font_name: Optional[str] = None) -> NamedStyle:
+    """Named style of data cells (wrapped, bordered)."""
+    return NamedStyle(
+        name="export_body",
+        font=Font(name=font_name, size=11),
+        alignment=Alignment(horizontal="left", vertical="center", wrap_text=True),
+        border=_thin_border(),
+    )
+
+
+class ExcelStreamWriter:
+    """Write-only workbook for large exports.
+
+    Rows are appended to a write-only sheet (serialized to a temporary file
+    by openpyxl as they come in) and every cell references one of two shared
+    named styles instead of carrying its own style objects, so memory stays
+    flat however many rows are written. Column widths have to be known up
+    front: write-only sheets cannot be measured afterwards.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        headers: Sequence[str],
+        column_widths: Optional[Sequence[float]] = None,
+        font_name: Optional[str] = None,
+    ):
+        self.workbook = openpyxl.Workbook(write_only=True)
+        self.header_style = header_style(font_name)
+        self.body_style = body_style(font_name)
+        self.workbook.add_named_style(self.header_style)
+        self.workbook.add_named_style(self.body_style)
+        self.font_name = font_name
+
+        self.sheet = self.workbook.create_sheet(title)
+        for col_num, width in enumerate(column_widths or [], start=1):
+            self.sheet.column_dimensions[get_column_letter(col_num)].width = width
+
+        self.sheet.append([self._cell(header, self.header_style.name) for header in headers])
+        self.rows_written = 0
+
+    def _cell(self, value: Any, style: Optional[str] = None, font: Optional[Font] = None) -> WriteOnlyCell:
+        cell = WriteOnlyCell(self.sheet, value=value)
+        if style:
+            cell.style = style
+        if font:
+            cell.font = font
+        return cell
+
+    def append(self, values: Iterable[Any]) -> None:
+        """Append a data row (body style)."""
+        self.sheet.append([self._cell(value, self.body_style.name) for value in values])
+        self.rows_written += 1
+
+    def append_note(self, text: str = "", bold: bool = False) -> None:
+        """Append an unstyled note row (empty text = blank row)."""
+        if not text:
+            self.sheet.append([])
+            return
+        self.sheet.append([self._cell(text, font=Font(name=self.font_name, size=10, bold=bold))])
+
+    def save(self, output: BinaryIO) -> None:
+        """Write the finished .xlsx to a binary file object."""
+        self.workbook.save(output)
+
+
+def iter_file_chunks(file: BinaryIO, chunk_size: int = FILE_CHUNK_SIZE) -> Iterator[bytes]:
+    """Read a file from its current position in chunks, closing it at the end."""
+    try:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        file.close()
+
 
 class ExcelHandler:
     """Handler for Excel import/export operations."""
@@ -58,6 +179,7 @@ class ExcelHandler:
         ws.cell(row=4, column=2, value="2. Kano分类: excitement(兴奋型), performance(期望型), basic(必备型), indifferent(无差异型), reverse(反向型)")
         ws.cell(row=5, column=2, value="3. 优先级分数: 1-10的数字")
         ws.cell(row=6, column=2, value="4. 预计工作量: 小时数")
+        ws.cell(row=7, column=2, value="5. 来源: customer(客户), market(市场), competition(竞争), sales(销售), after_sales(售后), rd(技术)")
 
         # Adjust column widths
         column_widths = {
@@ -85,6 +207,53 @@ class ExcelHandler:
         output.seek(0)
         return output.read()
 
+    @staticmethod
+    def iter_rows(file_path: str, skip_header: bool = True) -> Iterator[Tuple[int, Tuple[Any, ...]]]:
+        """
+        Stream the non-empty rows of the active sheet.
+
+        The workbook is opened read-only, so memory stays bounded however
+        many rows the sheet has.
+
+        Args:
+            file_path: Path to Excel file
+            skip_header: Whether to skip header row
+
+        Yields:
+            (Excel row number, cell values)
+        """
+        wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            ws = wb.active
+            start_row = 2 if skip_header else 1
+            for row_num, values in enumerate(ws.iter_rows(min_row=start_row, values_only=True), start=start_row):
+                # Skip empty rows
+                if not any(value is not None and value != "" for value in values):
+                    continue
+                yield row_num, values
+        finally:
+            wb.close()
+
+    @staticmethod
+    def template_row_to_requirement(values: Tuple[Any, ...]) -> Dict[str, Any]:
+        """
+        Map a row of the import template to RequirementCreate fields.
+
+        Args:
+            values: Cell values in template column order
+
+        Returns:
+            Requirement field dict (validated by the caller)
+        """
+        values = tuple(values) + (None,) * (13 - len(values))
+        source = _cell_text(values[11])
+        return {
+            "title": _cell_text(values[0]),
+            "description": _cell_text(values[1]),
+            "moscow_priority": _cell_text(values[6]),
+            "source_channel": SOURCE_CHANNEL_LABELS.get(source, source),
+        }
+
     @staticmethod
     def import_from_excel(file_path: str, skip_header: bool = True) -> List[Dict[str, Any]]:
         """
@@ -97,19 +266,9 @@ class ExcelHandler:
         Returns:
             List of requirement dictionaries
         """
-        wb = openpyxl.load_workbook(file_path)
-        ws = wb.active
-
         requirements = []
-        start_row = 2 if skip_header else 1
-
-        for row_num in range(start_row, ws.max_row + 1):
-            # Get values from row
-            values = [ws.cell(row_num, col).value for col in range(1, ws.max_column + 1)]
-
-            # Skip empty rows
-            if not any(values):
-                continue
+        for _, values in ExcelHandler.iter_rows(file_path, skip_header):
+            values = tuple(values) + (None,) * (13 - len(values))
 
             # Build requirement dict
             req = {
@@ -146,60 +305,40 @@ class ExcelHandler:
         Returns:
             Excel file as bytes
         """
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = sheet_name
-
         if not data:
             return io.BytesIO().getvalue()
 
         # Get headers from first row
         headers = list(data[0].keys())
 
-        # Set header styles
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF", size=11)
-        center_alignment = Alignment(horizontal="center", vertical="center")
-
-        # Write headers
-        for col_num, header in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col_num, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = center_alignment
-
-        # Write data
-        for row_num, item in enumerate(data, start=2):
-            for col_num, key in enumerate(headers, start=1):
-                value = item.get(key, "")
-
-                # Format datetime values
-                if isinstance(value, datetime):
-                    value = value.strftime("%Y-%m-%d %H:%M:%S")
-                # Format dict values
-                elif isinstance(value, (dict, list)):
-                    value = str(value)
-
-                ws.cell(row=row_num, column=col_num, value=value)
-
-        # Auto-adjust column widths
-        for col_num in range(1, len(headers) + 1):
-            max_length = 0
-            column = get_column_letter(col_num)
-
-            for row in range(1, ws.max_row + 1):
-                cell_value = ws.cell(row=row, column=col_num).value
-                if cell_value:
-                    max_length = max(max_length, len(str(cell_value)))
-
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column].width = adjusted_width
+        def format_value(value: Any) -> Any:
+            # Format datetime values
+            if isinstance(value, datetime):
+                return value.strftime("%Y-%m-%d %H:%M:%S")
+            # Format dict values
+            if isinstance(value, (dict, list)):
+                return str(value)
+            return value
+
+        rows = [[format_value(item.get(key, "")) for key in headers] for item in data]
+
+        # Column widths from the longest value (one pass, before writing)
+        max_lengths = [len(str(header)) for header in headers]
+        for row in rows:
+            for col_index, value in enumerate(row):
+                if value:
+                    max_lengths[col_index] = max(max_lengths[col_index], len(str(value)))
+
+        writer = ExcelStreamWriter(
+            sheet_name, headers, [min(length + 2, 50) for length in max_lengths]
+        )
+        for row in rows:
+            writer.append(row)
 
         # Save to bytes
         output = io.BytesIO()
-        wb.save(output)
-        output.seek(0)
-        return output.read()
+        writer.save(output)
+        return output.getvalue()
 
     @staticmethod
     def export_verification_checklist(
@@ -0,0 +1,60 @@
+"""Keyset (cursor) pagination helpers."""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict
+
+
+def encode_cursor(payload: Dict[str, Any]) -> str:
+    """Encode a cursor payload into an opaque URL-safe token.
+
+    datetime values are stored as ISO strings and restored by decode_cursor.
+
+    Args:
+        payload: Cursor payload (sort field, last sort value, last id, ...)
+
+    Returns:
+        Opaque cursor token
+    """
+    data = {
+        key: {"$dt": value.isoformat()} if isinstance(value, datetime) else value
+        for key, value in payload.items()
+    }
+    raw = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Dict[str, Any]:
+    """Decode a token produced by encode_cursor.
+
+    Args:
+        token: Opaque cursor token
+
+    Returns:
+        Cursor payload
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
+
+    if not isinstance(data, dict):
+        raise ValueError("Invalid cursor: payload must be an object")
+
+    return {
+        key: _decode_datetime(value) if isinstance(value, dict) and "$dt" in value else value
+        for key, value in data.items()
+    }
+
+
+def _decode_datetime(value: Dict[str, Any]) -> datetime:
+    if not isinstance(value["$dt"], str):
+        raise ValueError("Invalid cursor: datetime must be an ISO string")
+    try:
+        return datetime.fromisoformat(value["$dt"])
+    except ValueError as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
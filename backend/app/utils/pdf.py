@@ -1,5 +1,5 @@
 """PDF generation utility."""
-from typing import List, Dict, Any, Optional
+from typing import BinaryIO, Iterable, List, Dict, Any, Optional
 from datetime import datetime
 from io import BytesIO
 
@@ -158,6 +158,54 @@ Created By: {requirement.get('created_by', 'N/A')}
         content = "\n".join(content_lines)
         return BytesIO(content.encode('utf-8')).getvalue()
 
+    @staticmethod
+    def write_requirements_summary_pdf(
+        requirements: Iterable[Dict[str, Any]],
+        output: BinaryIO,
+        total: int,
+        title: str = "Requirements Summary",
+    ) -> int:
+        """
+        Write a requirements summary to a file one requirement at a time.
+
+        Same layout as generate_requirements_summary_pdf, without holding
+        the document in memory.
+
+        Args:
+            requirements: Requirement dictionaries (may be a generator)
+            output: Binary file object
+            total: Number of requirements (for the header)
+            title: Document title
+
+        Returns:
+            Number of requirements written
+        """
+        # Note: In production, use reportlab or weasyprint
+        # For now, write the same placeholder text
+        header = [
+            f"{title.upper()}",
+            "=" * len(title),
+            "",
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Total Requirements: {total}",
+            "",
+            "-" * 80,
+            "",
+        ]
+        output.write(("\n".join(header) + "\n").encode('utf-8'))
+
+        count = 0
+        for count, req in enumerate(requirements, 1):
+            description = req.get('description') or 'N/A'
+            lines = [
+                f"{count}. {req.get('title', 'N/A')}",
+                f"   Priority: {req.get('moscow_priority', 'N/A')} | Score: {req.get('priority_score', 0)} | Status: {req.get('status', 'N/A')}",
+                f"   {description[:100]}{'...' if len(description) > 100 else ''}",
+                "",
+            ]
+            output.write(("\n".join(lines) + "\n").encode('utf-8'))
+        return count
+
     @staticmethod
     def generate_verification_report_pdf(
         requirement: Dict[str, Any],
@@ -277,3 +325,51 @@ Created By: {requirement.get('created_by', 'N/A')}
 
         content = "\n".join(content_lines)
         return BytesIO(content.encode('utf-8')).getvalue()
+
+    @staticmethod
+    def write_rtm_pdf(
+        traceability: Iterable[Dict[str, Any]],
+        output: BinaryIO,
+        project_name: str = "Requirements Traceability Matrix",
+    ) -> int:
+        """
+        Write a Requirements Traceability Matrix to a file one entry at a time.
+
+        Same layout as generate_rtm_pdf, without holding the document in memory.
+
+        Args:
+            traceability: Traceability entries (may be a generator)
+            output: Binary file object
+            project_name: Project or document name
+
+        Returns:
+            Number of entries written
+        """
+        # Note: In production, use reportlab or weasyprint
+        # For now, write the same placeholder text
+        header = [
+            "REQUIREMENTS TRACEABILITY MATRIX",
+            "=" * 35,
+            "",
+            f"Project: {project_name}",
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            "",
+            "-" * 100,
+            "",
+            "Requirement | Design | Code | Tests | Status",
+            "-" * 100,
+            "",
+        ]
+        output.write(("\n".join(header) + "\n").encode('utf-8'))
+
+        count = 0
+        for count, entry in enumerate(traceability, 1):
+            line = (
+                f"{entry.get('requirement_id', 'N/A'):12} | "
+                f"{entry.get('design_id', 'N/A'):6} | "
+                f"{entry.get('code_id', 'N/A'):4} | "
+                f"{entry.get('test_id', 'N/A'):5} | "
+                f"{entry.get('status', 'N/A')}"
+            )
+            output.write((line + "\n").encode('utf-8'))
+        return count
@@ -0,0 +1,154 @@
+"""Search text helpers (CJK-aware tokenization and highlighting).
+
+Chinese text has no word boundaries, so CJK runs are indexed as unigrams plus
+overlapping bigrams ("需求管理" -> 需 求 管 理 需求 求管 管理). Latin words and
+numbers are lower-cased and indexed as whole words. The resulting token string
+is stored in requirement_search_index and matched with PostgreSQL tsvector
+('simple' config) or SQLite FTS5.
+"""
+import html
+import re
+from typing import Iterable, List, Optional
+
+# CJK Unified Ideographs (+ Extension A), Hiragana/Katakana, Hangul syllables
+_CJK_RANGES = "\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\u3040-\u30ff\uac00-\ud7af"
+_TOKEN_RE = re.compile(rf"[{_CJK_RANGES}]+|[0-9a-z]+")
+_CJK_RE = re.compile(rf"^[{_CJK_RANGES}]+$")
+
+
+def _is_cjk(run: str) -> bool:
+    return bool(_CJK_RE.match(run))
+
+
+def _cjk_bigrams(run: str) -> List[str]:
+    return [run[i:i + 2] for i in range(len(run) - 1)]
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Tokenize text for indexing (CJK unigrams + bigrams, latin words).
+
+    Args:
+        text: Source text
+
+    Returns:
+        List of tokens (may contain duplicates)
+    """
+    if not text:
+        return []
+
+    tokens: List[str] = []
+    for run in _TOKEN_RE.findall(text.lower()):
+        if _is_cjk(run):
+            tokens.extend(run)
+            tokens.extend(_cjk_bigrams(run))
+        else:
+            tokens.append(run)
+    return tokens
+
+
+def tokenize_query(query: Optional[str]) -> List[str]:
+    """Tokenize a search query.
+
+    CJK runs longer than one character are matched by their bigrams only, so
+    "需求管理" requires all of 需求/求管/管理 to be present.
+
+    Args:
+        query: User search input
+
+    Returns:
+        De-duplicated list of query tokens, in input order
+    """
+    if not query:
+        return []
+
+    tokens: List[str] = []
+    for run in _TOKEN_RE.findall(query.lower()):
+        if _is_cjk(run) and len(run) > 1:
+            tokens.extend(_cjk_bigrams(run))
+        else:
+            tokens.append(run)
+    return list(dict.fromkeys(tokens))
+
+
+def build_search_document(*fields: Optional[str]) -> str:
+    """Build the space separated token document stored in the search index.
+
+    Args:
+        *fields: Text fields to index (title, requirement_no, description, ...)
+
+    Returns:
+        Token document
+    """
+    tokens: List[str] = []
+    for field in fields:
+        tokens.extend(tokenize(field))
+    return " ".join(tokens)
+
+
+def is_prefix_token(token: str) -> bool:
+    """Latin/number tokens are matched as prefixes ("log" matches "login")."""
+    return not _is_cjk(token)
+
+
+def highlight(
+    text: Optional[str],
+    query: Optional[str],
+    max_length: Optional[int] = None,
+    tag: str = "mark",
+) -> str:
+    """Highlight query terms in text.
+
+    The text is HTML-escaped and every occurrence of a query term is wrapped
+    in <tag>. When max_length is set, a snippet of that length centred on the
+    first match is returned.
+
+    Args:
+        text: Text to highlight
+        query: User search input
+        max_length: Optional snippet length
+        tag: HTML tag used for highlighting
+
+    Returns:
+        Highlighted (and possibly truncated) HTML string
+    """
+    if not text:
+        return ""
+
+    terms = _highlight_terms(query)
+    if max_length and len(text) > max_length:
+        text = _snippet(text, terms, max_length)
+
+    if not terms:
+        return html.escape(text)
+
+    pattern = re.compile("|".join(re.escape(t) for t in terms), re.IGNORECASE)
+    parts: List[str] = []
+    last = 0
+    for match in pattern.finditer(text):
+        parts.append(html.escape(text[last:match.start()]))
+        parts.append(f"<{tag}>{html.escape(match.group(0))}</{tag}>")
+        last = match.end()
+    parts.append(html.escape(text[last:]))
+    return "".join(parts)
+
+
+def _highlight_terms(query: Optional[str]) -> List[str]:
+    """Whole query runs, longest first so they win over their sub-terms."""
+    if not query:
+        return []
+    runs: Iterable[str] = _TOKEN_RE.findall(query.lower())
+    return sorted(set(runs), key=len, reverse=True)
+
+
+def _snippet(text: str, terms: List[str], max_length: int) -> str:
+    lowered = text.lower()
+    positions = [p for p in (lowered.find(t) for t in terms) if p >= 0]
+    start = max(0, min(positions) - max_length // 4) if positions else 0
+    end = min(len(text), start + max_length)
+    start = max(0, end - max_length)
+    snippet = text[start:end]
+    if start > 0:
+        snippet = "…" + snippet
+    if end < len(text):
+        snippet = snippet + "…"
+    return snippet
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Assert that hot repository queries use their composite indexes (PostgreSQL).
+
+Run after `alembic upgrade head`:
+
+    python scripts/check_query_indexes.py
+
+Exits with status 1 if any query is not served by an expected index.
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.base import sync_engine
+from app.db.index_check import check_query_indexes
+
+
+def main() -> int:
+    with sync_engine.connect() as connection:
+        results = check_query_indexes(connection)
+
+    for result in results:
+        mark = "✅" if result["ok"] else "❌"
+        print(f"{mark} {result['name']}: used {result['used'] or 'no index'}, expected one of {result['expected']}")
+
+    failed = [r for r in results if not r["ok"]]
+    if failed:
+        print(f"❌ {len(failed)} query(s) not using their index")
+        return 1
+    print("✅ All checked queries use their indexes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
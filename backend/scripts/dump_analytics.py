@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Dump analytics datasets to Parquet / Arrow files.
+
+Writes requirements, vote_results and workflow_history of a tenant as
+columnar files, streaming from the database. Meant for scheduled dumps,
+e.g. from cron:
+
+    python scripts/dump_analytics.py --tenant-id 1 --output-dir dumps [--format arrow] [--dataset requirements]
+"""
+import argparse
+import os
+import sys
+from datetime import datetime
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.base import SessionLocal
+from app.services.analytics_export import COLUMNAR_FORMATS, DATASETS, iter_rows, write_columnar
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tenant-id", type=int, required=True, help="Tenant to dump")
+    parser.add_argument("--output-dir", default="dumps", help="Directory for the files")
+    parser.add_argument("--format", choices=COLUMNAR_FORMATS, default="parquet")
+    parser.add_argument(
+        "--dataset", choices=sorted(DATASETS), action="append",
+        help="Dataset to dump (repeatable, default: all)",
+    )
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+
+    with SessionLocal() as db:
+        for name in args.dataset or sorted(DATASETS):
+            dataset = DATASETS[name]
+            path = os.path.join(args.output_dir, f"{name}_tenant{args.tenant_id}_{stamp}.{args.format}")
+            count = write_columnar(iter_rows(db, dataset, args.tenant_id), path, dataset, args.format)
+            print(f"✅ {name}: {count} rows -> {path}")
+
+
+if __name__ == "__main__":
+    main()
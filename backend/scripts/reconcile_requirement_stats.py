@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""Recount requirement_stats counters from the requirements table.
+
+Repairs drift caused by writes that bypass the ORM (bulk UPDATEs, raw SQL).
+Safe to run periodically, e.g. from cron:
+
+    python scripts/reconcile_requirement_stats.py [--tenant-id 1]
+"""
+import argparse
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.base import sync_engine
+from app.models.requirement_stats import reconcile_requirement_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tenant-id", type=int, default=None, help="Only reconcile this tenant")
+    args = parser.parse_args()
+
+    with sync_engine.begin() as connection:
+        count = reconcile_requirement_stats(connection, tenant_id=args.tenant_id)
+
+    print(f"✅ Reconciled requirement stats for {count} tenant(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""
+Integration test: hot queries use the composite indexes on PostgreSQL
+
+Requires a migrated PostgreSQL database in TEST_POSTGRES_URL
+(sync driver, e.g. postgresql+psycopg2://...); skipped otherwise.
+"""
+
+import os
+
+import pytest
+from sqlalchemy import create_engine
+
+from app.db.index_check import check_query_indexes
+
+TEST_POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not TEST_POSTGRES_URL, reason="TEST_POSTGRES_URL not set")
+def test_hot_queries_use_composite_indexes():
+    """Every checked repository query is served by one of its indexes."""
+    engine = create_engine(TEST_POSTGRES_URL)
+    try:
+        with engine.connect() as connection:
+            results = check_query_indexes(connection)
+    finally:
+        engine.dispose()
+
+    failed = [r for r in results if not r["ok"]]
+    assert not failed, failed
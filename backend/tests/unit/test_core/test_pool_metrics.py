@@ -0,0 +1,53 @@
+"""
+Unit tests for connection pool metrics
+
+Tests:
+- Engine options from Settings (queue pool sizing, echo)
+- Checkout latency / pool status reported by the timed pool
+- Pool timeouts counted
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.config import get_settings
+from app.db.pool_metrics import PoolMetrics, engine_options
+
+
+@pytest.mark.unit
+class TestPoolMetrics:
+    """Test timed pools and metrics."""
+
+    def test_engine_options_size_queue_pools_only(self):
+        """In-memory SQLite keeps its static pool; file databases get sizing."""
+        settings = get_settings().model_copy(update={"DB_POOL_SIZE": 3, "DB_ECHO": False})
+
+        memory = engine_options("sqlite+aiosqlite://", settings, PoolMetrics("m"))
+        file_db = engine_options("sqlite:///./pool.db", settings, PoolMetrics("f"))
+
+        assert "pool_size" not in memory and memory["echo"] is False
+        assert file_db["pool_size"] == 3
+        assert file_db["poolclass"].__name__ == "TimedQueuePool"
+
+    def test_checkouts_and_timeouts_are_recorded(self, tmp_path):
+        """Checkout latencies, live status and pool timeouts are reported."""
+        settings = get_settings().model_copy(update={
+            "DB_POOL_SIZE": 1, "DB_MAX_OVERFLOW": 0, "DB_POOL_TIMEOUT": 0.05,
+        })
+        url = f"sqlite:///{tmp_path / 'pool.db'}"
+        metrics = PoolMetrics("test")
+        engine = create_engine(url, **engine_options(url, settings, metrics))
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            busy = metrics.snapshot(engine.pool)
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+
+        data = metrics.snapshot(engine.pool)
+        assert busy["pool"]["checked_out"] == 1
+        assert data["checkouts"] == 1 and data["timeouts"] == 1
+        assert data["checkout_latency_ms"]["p50"] is not None
+        assert data["pool"]["checked_out"] == 0 and data["pool"]["size"] == 1
+        engine.dispose()
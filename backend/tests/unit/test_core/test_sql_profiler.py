@@ -0,0 +1,54 @@
+"""
+Unit tests for the per-request SQL profiler
+
+Tests:
+- Statement shape normalization across DBAPI parameter styles
+- Statement count / slowest statement recorded through engine hooks
+- N+1 detection and Server-Timing header value
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core.sql_profiler import instrument_engine, profile_request, statement_shape
+
+
+@pytest.mark.unit
+class TestStatementShape:
+    """Test statement_shape."""
+
+    def test_literals_and_params_are_normalized(self):
+        """Different values and parameter styles give the same shape."""
+        assert statement_shape("SELECT * FROM t WHERE id = 1 AND name = 'a'") == \
+            statement_shape("SELECT *  FROM t\nWHERE id = %(id_1)s AND name = $2")
+
+    def test_in_lists_collapse(self):
+        """Expanded IN lists of any length share one shape."""
+        assert statement_shape("SELECT * FROM t WHERE id IN (?, ?, ?)") == \
+            "SELECT * FROM t WHERE id IN (?)"
+
+
+@pytest.mark.unit
+class TestRequestProfile:
+    """Test profiling through engine hooks."""
+
+    def test_records_statements_and_flags_n_plus_one(self):
+        """Repeated statement shapes above the threshold are flagged."""
+        engine = create_engine("sqlite://")
+        instrument_engine(engine)
+        instrument_engine(engine)  # idempotent
+
+        with profile_request("GET", "/rtm/matrix") as profile:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                for i in range(12):
+                    conn.execute(text("SELECT :value"), {"value": i})
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 2"))  # outside a request: not recorded
+
+        assert profile.statement_count == 13
+        assert profile.slowest_statement is not None
+        assert profile.n_plus_one(threshold=10) == [{"statement": "SELECT ?", "count": 13}]
+        assert profile.n_plus_one(threshold=20) == []
+        assert profile.server_timing().startswith("db;dur=")
@@ -0,0 +1,229 @@
+"""
+Unit tests for AsyncRequirementRepository
+
+Tests the AsyncSession based requirement repository:
+- Creating requirements with sequential numbers
+- Listing with filters, sorting and pagination
+- Status statistics (distributed + charter counted as implementing)
+- Keyset (cursor) pagination
+- Window-function totals (single round trip)
+- Full-text search through the maintained search index
+- Incrementally maintained statistics counters and reconcile
+- Bulk creation with a reserved number block
+"""
+
+import pytest
+from sqlalchemy import select, update
+
+from app.models.requirement import Requirement10QAnswer
+from app.models.requirement_stats import RequirementStats, reconcile_requirement_stats
+from app.repositories.requirement import AsyncRequirementRepository, encode_requirement_cursor
+
+
+async def _create_requirements(repo, tenant_id, count, **kwargs):
+    requirements = []
+    for i in range(count):
+        requirements.append(
+            await repo.create(
+                title=f"Requirement {i}",
+                description="description",
+                source_channel=kwargs.get("source_channel", "customer"),
+                tenant_id=tenant_id,
+            )
+        )
+    return requirements
+
+
+@pytest.mark.unit
+class TestAsyncRequirementRepository:
+    """Test AsyncRequirementRepository."""
+
+    @pytest.mark.asyncio
+    async def test_create_generates_sequential_numbers(self, async_db_session, test_tenant):
+        """Requirement numbers increment within the year prefix."""
+        repo = AsyncRequirementRepository(async_db_session)
+
+        first, second = await _create_requirements(repo, test_tenant.id, 2)
+
+        assert first.requirement_no.startswith("REQ-")
+        assert int(second.requirement_no[-4:]) == int(first.requirement_no[-4:]) + 1
+
+    @pytest.mark.asyncio
+    async def test_list_filters_and_paginates(self, async_db_session, test_tenant):
+        """List applies filters, ordering and returns the filtered total."""
+        repo = AsyncRequirementRepository(async_db_session)
+        await _create_requirements(repo, test_tenant.id, 5)
+        await _create_requirements(repo, test_tenant.id, 2, source_channel="market")
+
+        items, total = await repo.list(
+            page=2, page_size=2, source_channel="customer", sort_by="id", sort_order="asc"
+        )
+
+        assert total == 5
+        assert [item.title for item in items] == ["Requirement 2", "Requirement 3"]
+
+    @pytest.mark.asyncio
+    async def test_stats_by_status_counts_distributed_charter_as_implementing(
+        self, async_db_session, test_tenant
+    ):
+        """Distributed charter requirements are reported as implementing."""
+        repo = AsyncRequirementRepository(async_db_session)
+        requirements = await _create_requirements(repo, test_tenant.id, 3)
+        await repo.update(requirements[0], status="distributed", target_type="charter")
+
+        stats = await repo.get_stats_by_status()
+
+        assert stats["collected"] == 2
+        assert stats["distributed"] == 1
+        assert stats["implementing"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cursor_pagination_walks_all_rows_without_overlap(
+        self, async_db_session, test_tenant
+    ):
+        """Keyset pages cover every row exactly once, in sort order."""
+        repo = AsyncRequirementRepository(async_db_session)
+        created = await _create_requirements(repo, test_tenant.id, 5)
+        await repo.update(created[1], priority_score=50)
+        await repo.update(created[3], priority_score=80)
+
+        seen, after = [], None
+        while True:
+            items, _ = await repo.list(
+                page_size=2, sort_by="priority_score", sort_order="desc", after=after
+            )
+            seen.extend(item.id for item in items)
+            if len(items) < 2:
+                break
+            after = encode_requirement_cursor(items[-1], "priority_score", "desc")
+
+        # NULL priorities come last, ordered by id descending
+        assert seen == [created[3].id, created[1].id, created[4].id, created[2].id, created[0].id]
+
+    @pytest.mark.asyncio
+    async def test_cursor_for_other_sort_is_rejected(self, async_db_session, test_tenant):
+        """A cursor issued for one sort cannot be reused with another."""
+        repo = AsyncRequirementRepository(async_db_session)
+        created = await _create_requirements(repo, test_tenant.id, 1)
+        after = encode_requirement_cursor(created[0], "title", "asc")
+
+        with pytest.raises(ValueError):
+            await repo.list(sort_by="id", sort_order="asc", after=after)
+
+    @pytest.mark.asyncio
+    async def test_window_count_matches_exact_count(self, async_db_session, test_tenant):
+        """COUNT(*) OVER() yields the same total as the separate count query."""
+        repo = AsyncRequirementRepository(async_db_session)
+        created = await _create_requirements(repo, test_tenant.id, 5)
+        await _create_requirements(repo, test_tenant.id, 2, source_channel="market")
+
+        exact_items, exact_total = await repo.list(
+            page=2, page_size=2, source_channel="customer", sort_by="id", count_mode="exact"
+        )
+        window_items, window_total = await repo.list(
+            page=2, page_size=2, source_channel="customer", sort_by="id", count_mode="window"
+        )
+        after = encode_requirement_cursor(created[2], "id", "desc")
+        _, cursor_total = await repo.list(
+            page_size=2, source_channel="customer", sort_by="id", after=after, count_mode="window"
+        )
+        empty_items, empty_total = await repo.list(page=10, page_size=2, count_mode="window")
+
+        assert window_total == exact_total == cursor_total == 5
+        assert [item.id for item in window_items] == [item.id for item in exact_items]
+        assert empty_items == [] and empty_total == 7
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_matches_from_index(self, async_db_session, test_tenant):
+        """Search uses the maintained index, including description and updates."""
+        repo = AsyncRequirementRepository(async_db_session)
+        first = await repo.create(
+            title="单点登录", description="需求管理平台支持 SSO", source_channel="customer",
+            tenant_id=test_tenant.id,
+        )
+        second = await repo.create(
+            title="报表导出", description="导出需求列表", source_channel="customer",
+            tenant_id=test_tenant.id,
+        )
+
+        results, total = await repo.search("需求管理")
+        assert total == 1 and results[0][0].id == first.id
+
+        await repo.update(second, title="需求管理报表")
+        results, total = await repo.search("需求管理")
+        assert {req.id for req, _ in results} == {first.id, second.id}
+
+        await repo.delete(first)
+        _, total = await repo.search("登录")
+        assert total == 0
+
+    @pytest.mark.asyncio
+    async def test_stats_summary_counters_follow_writes(self, async_db_session, test_tenant):
+        """Counters track create, status/target change and delete per tenant."""
+        repo = AsyncRequirementRepository(async_db_session)
+        first, second, _ = await _create_requirements(repo, test_tenant.id, 3)
+        await _create_requirements(repo, test_tenant.id + 1, 1, source_channel="market")
+
+        await repo.update(first, status="distributed", target_type="charter")
+        await repo.update(second, source_channel="rd")
+        await repo.delete(second)
+
+        stats = await repo.get_stats_summary(test_tenant.id)
+        assert stats.total == 2
+        assert stats.status_counts()["collected"] == 1
+        assert stats.status_counts()["implementing"] == 1
+        assert stats.channel_counts()["customer"] == 2
+        assert stats.channel_counts()["rd"] == 0
+
+    @pytest.mark.asyncio
+    async def test_reconcile_repairs_drifted_counters(self, async_db_session, test_tenant):
+        """reconcile_requirement_stats recounts from the requirements table."""
+        repo = AsyncRequirementRepository(async_db_session)
+        await _create_requirements(repo, test_tenant.id, 2)
+
+        await async_db_session.execute(
+            update(RequirementStats).where(RequirementStats.tenant_id == test_tenant.id)
+            .values(total=99, status_collected=0)
+        )
+        await async_db_session.run_sync(
+            lambda session: reconcile_requirement_stats(session.connection(), test_tenant.id)
+        )
+
+        stats = await repo.get_stats_summary(test_tenant.id)
+        assert stats.total == 2 and stats.status_collected == 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_inserts_rows_answers_index_and_counters(
+        self, async_db_session, test_tenant
+    ):
+        """bulk_create reserves contiguous numbers and writes dependent rows."""
+        repo = AsyncRequirementRepository(async_db_session)
+        await _create_requirements(repo, test_tenant.id, 1)
+        rows = [
+            {
+                "title": f"批量需求 {i}",
+                "description": "批量导入",
+                "source_channel": "market" if i % 2 else "customer",
+                "customer_need_10q": {"q1_who_cares": "客户"} if i == 0 else None,
+            }
+            for i in range(5)
+        ]
+
+        created = await repo.bulk_create(rows, created_by=None, tenant_id=test_tenant.id)
+
+        assert len(created) == 5
+        sequence = [int(no[-4:]) for _, no in created]
+        assert sequence == list(range(sequence[0], sequence[0] + 5))
+
+        answers = (await async_db_session.execute(
+            select(Requirement10QAnswer).where(Requirement10QAnswer.requirement_id == created[0][0])
+        )).scalars().all()
+        assert [(a.q1_who_cares, a.q2_why_care) for a in answers] == [("客户", None)]
+
+        _, total = await repo.search("批量导入")
+        assert total == 5
+
+        stats = await repo.get_stats_summary(test_tenant.id)
+        assert stats.total == 6
+        assert stats.channel_counts()["market"] == 2
+        assert stats.channel_counts()["customer"] == 4
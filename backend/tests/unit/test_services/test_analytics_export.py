@@ -0,0 +1,122 @@
+"""
+Unit tests for columnar analytics exports
+
+Tests:
+- Typed Parquet / Arrow output in row groups with flattened JSON fields
+- Tenant scoping of vote results and workflow history
+- Parquet export jobs
+"""
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.models.export_job import ExportJob
+from app.models.vote_result import VoteResult
+from app.models.workflow import WorkflowHistory
+from app.repositories.requirement import RequirementRepository
+from app.services.analytics_export import DATASETS, iter_rows, write_columnar
+from app.services.requirement_export import run_export_job
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.parquet as pq  # noqa: E402
+
+
+@pytest.fixture
+def analytics_data(db_session, test_tenant_sync):
+    repo = RequirementRepository(db_session)
+    requirements = [
+        repo.create(title=f"需求 {i}", description="描述", source_channel="customer",
+                    tenant_id=test_tenant_sync.id)
+        for i in range(5)
+    ]
+    other = repo.create(title="其他租户", description="描述", source_channel="rd",
+                        tenant_id=test_tenant_sync.id + 1)
+    requirements[0].rice_score = {"reach": 5, "impact": 4, "confidence": 8, "effort": 2, "score": 80.0}
+    # Shape written by InvestService.save_invest_analysis
+    requirements[0].invest_analysis = {
+        "independent": 80, "negotiable": 70, "valuable": 90, "estimable": 60, "small": 50,
+        "testable": 100, "total_score": 450, "average_score": 75.0, "notes": "",
+    }
+    # Legacy boolean shape
+    requirements[1].invest_analysis = {"independent": True, "testable": False}
+    db_session.add(VoteResult(
+        tenant_id=test_tenant_sync.id, meeting_id=1, requirement_id=requirements[0].id,
+        vote_statistics={"total_votes": 3, "approve_count": 2, "approve_percentage": 66.7,
+                         "is_voting_complete": True, "votes": []},
+    ))
+    for requirement in (requirements[0], other):
+        db_session.add(WorkflowHistory(
+            entity_type="requirement", entity_id=requirement.id, action="created",
+            to_status="collected", changes_snapshot={"title": requirement.title},
+        ))
+    db_session.commit()
+    return requirements
+
+
+@pytest.mark.unit
+class TestColumnarExport:
+    """Test write_columnar."""
+
+    def test_parquet_row_groups_and_flattened_json(
+        self, db_session, test_tenant_sync, analytics_data, tmp_path
+    ):
+        """Rows are written in row groups with typed, flattened columns (both INVEST shapes)."""
+        path = tmp_path / "requirements.parquet"
+        dataset = DATASETS["requirements"]
+
+        count = write_columnar(
+            iter_rows(db_session, dataset, test_tenant_sync.id, chunk_size=2),
+            str(path), dataset, row_group_size=2,
+        )
+
+        parquet = pq.ParquetFile(path)
+        assert count == 5 and parquet.metadata.num_row_groups == 3
+        table = parquet.read()
+        assert table.schema.field("rice_reach").type == pa.int64()
+        assert table.schema.field("created_at").type == pa.timestamp("us", tz="UTC")
+        assert table.schema.field("invest_independent").type == pa.int64()
+        first, second, third = table.to_pylist()[:3]
+        assert (first["rice_reach"], first["rice_score"]) == (5, 80.0)
+        assert (first["invest_independent"], first["invest_testable"], first["invest_small"]) == (80, 100, 50)
+        assert (first["invest_total_score"], first["invest_average_score"]) == (450, 75.0)
+        assert (second["invest_independent"], second["invest_testable"], second["invest_small"]) == (85, 40, 50)
+        assert third["invest_independent"] is None
+
+    def test_vote_results_and_history_are_tenant_scoped(
+        self, db_session, test_tenant_sync, analytics_data, tmp_path
+    ):
+        """Vote statistics are flattened; history only covers the tenant's requirements."""
+        votes_path = tmp_path / "votes.arrow"
+        write_columnar(
+            iter_rows(db_session, DATASETS["vote_results"], test_tenant_sync.id),
+            str(votes_path), DATASETS["vote_results"], "arrow",
+        )
+        votes = pa.ipc.open_file(str(votes_path)).read_all().to_pylist()
+        assert votes[0]["approve_count"] == 2 and votes[0]["is_voting_complete"] is True
+        assert votes[0]["reject_count"] is None
+
+        history_path = tmp_path / "history.parquet"
+        count = write_columnar(
+            iter_rows(db_session, DATASETS["workflow_history"], test_tenant_sync.id),
+            str(history_path), DATASETS["workflow_history"],
+        )
+        rows = pq.read_table(history_path).to_pylist()
+        assert count == 1 and rows[0]["entity_id"] == analytics_data[0].id
+        assert rows[0]["changes_snapshot"] == '{"title": "需求 0"}'
+
+    def test_parquet_export_job(self, db_engine, db_session, test_tenant_sync, analytics_data, tmp_path):
+        """Export jobs write analytics datasets; text filters are rejected."""
+        job = ExportJob(tenant_id=test_tenant_sync.id, exported_by=1, export_type="parquet",
+                        filters={"dataset": "vote_results"}, status="processing")
+        filtered = ExportJob(tenant_id=test_tenant_sync.id, exported_by=1, export_type="parquet",
+                             filters={"status": "collected"}, status="processing")
+        db_session.add_all([job, filtered])
+        db_session.commit()
+
+        for export_job in (job, filtered):
+            run_export_job(export_job.id, session_factory=sessionmaker(bind=db_engine), export_dir=str(tmp_path))
+            db_session.refresh(export_job)
+
+        assert job.status == "completed" and job.file_path.endswith(".parquet")
+        assert job.total_records == 1 and pq.read_table(job.file_path).num_rows == 1
+        assert filtered.status == "failed"
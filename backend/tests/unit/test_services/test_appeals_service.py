@@ -0,0 +1,91 @@
+"""
+Unit tests for AppealsService
+
+Tests the APPEALS summary:
+- Dimension averages, analyzed count and top list from two queries
+- Only the tenant's requirements are counted
+- Cached summary is dropped on the next APPEALS save
+"""
+
+import pytest
+
+from app.core.sql_profiler import instrument_engine, profile_request
+from app.models.tenant import Tenant
+from app.repositories.requirement import RequirementRepository
+from app.schemas.appeals import APPEALSAnalysisCreate
+from app.services.appeals import AppealsService, invalidate_appeals_summary
+
+
+def _analysis(score: int) -> APPEALSAnalysisCreate:
+    dimension = {"score": score, "weight": 0.125}
+    return APPEALSAnalysisCreate(**{
+        name: dimension
+        for name in ("price", "availability", "packaging", "performance",
+                     "ease_of_use", "assurance", "lifecycle_cost", "social_acceptance")
+    })
+
+
+@pytest.fixture(autouse=True)
+def clear_summary_cache():
+    invalidate_appeals_summary()
+    yield
+    invalidate_appeals_summary()
+
+
+@pytest.fixture
+def requirements(db_session, test_tenant_sync):
+    repo = RequirementRepository(db_session)
+    created = [
+        repo.create(title=f"APPEALS {i}", description="描述", tenant_id=test_tenant_sync.id,
+                    source_channel="customer")
+        for i in range(4)
+    ]
+    other = Tenant(name="Other", code="other")
+    db_session.add(other)
+    db_session.flush()
+    created.append(repo.create(title="其他租户", description="描述", tenant_id=other.id,
+                               source_channel="customer"))
+    db_session.commit()
+    return created
+
+
+@pytest.mark.unit
+class TestAppealsSummary:
+    """Test AppealsService.get_appeals_summary."""
+
+    def test_summary_from_aggregate_queries(self, db_engine, db_session, test_tenant_sync, requirements):
+        """Averages, counts and the top list come from two queries over the tenant."""
+        service = AppealsService(db_session)
+        for requirement, score in zip(requirements, (4, 8, 6)):
+            service.save_appeals_analysis(requirement.id, _analysis(score))
+        service.save_appeals_analysis(requirements[4].id, _analysis(10))  # other tenant
+        instrument_engine(db_engine)
+        tenant_id = test_tenant_sync.id
+
+        with profile_request("GET", "/appeals/summary") as profile:
+            summary = service.get_appeals_summary(tenant_id)
+
+        assert profile.statement_count == 2
+        assert summary.total_requirements == 4
+        assert summary.analyzed_requirements == 3
+        assert summary.average_scores["price"] == 6.0
+        assert len(summary.average_scores) == 8
+        assert [item["requirement_id"] for item in summary.top_requirements] == [
+            requirements[1].id, requirements[2].id, requirements[0].id
+        ]
+        assert summary.top_requirements[0]["total_score"] == 80.0
+
+    def test_summary_cached_until_next_save(self, db_session, test_tenant_sync, requirements):
+        """A repeated call is served from the cache; saving an analysis refreshes it."""
+        service = AppealsService(db_session)
+        tenant_id = test_tenant_sync.id
+        first = service.get_appeals_summary(tenant_id)
+        assert first.analyzed_requirements == 0
+        assert service.get_appeals_summary(tenant_id) is first
+
+        service.save_appeals_analysis(requirements[0].id, _analysis(5))
+
+        refreshed = service.get_appeals_summary(tenant_id)
+        assert refreshed is not first
+        assert refreshed.analyzed_requirements == 1
+        assert refreshed.average_scores["social_acceptance"] == 5.0
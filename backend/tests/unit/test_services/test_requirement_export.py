@@ -0,0 +1,162 @@
+"""
+Unit tests for background export jobs
+
+Tests run_export_job:
+- Excel / CSV / text summary artifacts with recorded size and progress
+- Artifact reuse for identical exports of unchanged data
+- Unsupported filters fail the job
+- Progress commits during exports larger than the progress interval on a
+  file-backed SQLite database
+
+Tests fail_interrupted_export_jobs:
+- Jobs left processing by a previous process are marked failed
+"""
+
+import csv
+
+import openpyxl
+import pytest
+from sqlalchemy import JSON, create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.models.export_job import ExportJob
+from app.models.requirement import Requirement
+from app.repositories.requirement import RequirementRepository
+from app.services.requirement_export import (
+    PROGRESS_INTERVAL,
+    fail_interrupted_export_jobs,
+    normalize_filters,
+    run_export_job,
+)
+
+
+def _create_job(db_session, tenant_id, export_type="excel", filters=None):
+    job = ExportJob(
+        tenant_id=tenant_id, exported_by=1, export_type=export_type,
+        filters=filters or {}, status="processing",
+    )
+    db_session.add(job)
+    db_session.commit()
+    return job
+
+
+@pytest.fixture
+def export_env(db_engine, db_session, test_tenant_sync, tmp_path):
+    repo = RequirementRepository(db_session)
+    for i in range(5):
+        repo.create(
+            title=f"导出 {i}", description="描述", tenant_id=test_tenant_sync.id,
+            source_channel="market" if i % 2 else "customer",
+        )
+    db_session.commit()
+
+    def run(job, **kwargs):
+        run_export_job(
+            job.id, session_factory=sessionmaker(bind=db_engine),
+            export_dir=str(tmp_path), **kwargs,
+        )
+        db_session.refresh(job)
+        return job
+
+    return run
+
+
+@pytest.mark.unit
+class TestRunExportJob:
+    """Test run_export_job."""
+
+    def test_excel_export_writes_filtered_artifact(self, db_session, test_tenant_sync, export_env):
+        """The file holds the filtered rows; size and progress are recorded."""
+        job = export_env(
+            _create_job(db_session, test_tenant_sync.id, filters={"source_channel": "customer"}),
+            progress_interval=1,
+        )
+
+        assert job.status == "completed"
+        assert (job.total_records, job.processed_records, job.progress) == (3, 3, 100.0)
+        assert job.file_size > 0 and job.download_url.endswith(f"/export/jobs/{job.id}/download")
+        rows = list(openpyxl.load_workbook(job.file_path).active.iter_rows(values_only=True))
+        assert len(rows) == 4 and all(row[3] == "customer" for row in rows[1:])
+
+    def test_csv_and_pdf_exports(self, db_session, test_tenant_sync, export_env):
+        """CSV has a header plus one line per requirement; the "pdf" summary is plain text."""
+        csv_job = export_env(_create_job(db_session, test_tenant_sync.id, "csv"))
+        with open(csv_job.file_path, encoding="utf-8-sig") as f:
+            assert len(list(csv.reader(f))) == 6
+
+        pdf_job = export_env(_create_job(db_session, test_tenant_sync.id, "pdf"))
+        assert pdf_job.file_path.endswith(".txt")
+        with open(pdf_job.file_path, encoding="utf-8") as f:
+            assert "Total Requirements: 5" in f.read()
+
+    def test_identical_export_reuses_artifact_until_data_changes(
+        self, db_session, test_tenant_sync, export_env
+    ):
+        """Same filters and data version share the file; a write invalidates it."""
+        first = export_env(_create_job(db_session, test_tenant_sync.id, filters={"status": "collected"}))
+        second = export_env(_create_job(db_session, test_tenant_sync.id, filters={"status": "collected"}))
+        assert second.file_path == first.file_path and second.cache_key == first.cache_key
+
+        RequirementRepository(db_session).create(
+            title="新需求", description="描述", source_channel="rd", tenant_id=test_tenant_sync.id,
+        )
+        db_session.commit()
+
+        third = export_env(_create_job(db_session, test_tenant_sync.id, filters={"status": "collected"}))
+        assert third.file_path != first.file_path and third.total_records == 6
+
+    def test_unsupported_filter_fails_job(self, db_session, test_tenant_sync, export_env):
+        """A job with an unknown filter is marked failed with the reason."""
+        job = export_env(_create_job(db_session, test_tenant_sync.id, filters={"owner": 1}))
+
+        assert job.status == "failed" and "owner" in job.error_message
+        with pytest.raises(ValueError):
+            normalize_filters({"owner": 1})
+
+    @pytest.mark.parametrize("export_type", ["csv", "excel"])
+    def test_large_export_on_file_sqlite(self, tmp_path, export_type):
+        """Progress commits between pages; SQLite does not report "database is locked"."""
+        # Separate connections per session (unlike the in-memory StaticPool engine)
+        for table in Base.metadata.tables.values():
+            for column in table.columns:
+                if str(column.type) == "JSONB":
+                    column.type = JSON()
+        engine = create_engine(f"sqlite:///{tmp_path / 'export.db'}")
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine)
+        rows = PROGRESS_INTERVAL * 2 + 500
+
+        with session_factory() as db:
+            db.execute(insert(Requirement), [
+                {"requirement_no": f"REQ-{i}", "title": f"需求 {i}", "description": "描述",
+                 "source_channel": "customer", "tenant_id": 1}
+                for i in range(rows)
+            ])
+            job = _create_job(db, 1, export_type)
+            job_id = job.id
+
+        run_export_job(job_id, session_factory=session_factory, export_dir=str(tmp_path))
+
+        with session_factory() as db:
+            job = db.get(ExportJob, job_id)
+            assert job.status == "completed", job.error_message
+            assert job.processed_records == rows
+        engine.dispose()
+
+
+@pytest.mark.unit
+class TestFailInterruptedExportJobs:
+    """Test fail_interrupted_export_jobs."""
+
+    def test_processing_jobs_are_failed(self, db_engine, db_session, test_tenant_sync, export_env):
+        """Processing jobs become failed with a reason; finished jobs are untouched."""
+        done = export_env(_create_job(db_session, test_tenant_sync.id))
+        stuck = _create_job(db_session, test_tenant_sync.id)
+
+        assert fail_interrupted_export_jobs(sessionmaker(bind=db_engine)) == 1
+
+        db_session.refresh(done)
+        db_session.refresh(stuck)
+        assert done.status == "completed"
+        assert stuck.status == "failed" and "restart" in stuck.error_message
@@ -0,0 +1,92 @@
+"""
+Unit tests for the background Excel import
+
+Tests run_import_job:
+- Streams the sheet and imports valid rows in batches
+- Records per-row errors with Excel row numbers and progress counters
+"""
+
+from contextlib import asynccontextmanager
+
+import openpyxl
+import pytest
+from sqlalchemy import func, select
+
+from app.models.import_job import ImportJob
+from app.models.requirement import Requirement
+from app.services.requirement_import import run_import_job
+
+
+def _write_sheet(path, rows):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["需求标题", "需求描述", "用户角色", "用户行动", "用户收益", "优先级分数",
+               "MoSCoW优先级", "Kano分类", "业务价值", "技术复杂度", "预计工作量", "来源", "标签"])
+    for row in rows:
+        ws.append(row)
+    wb.save(path)
+
+
+@pytest.mark.unit
+class TestRunImportJob:
+    """Test run_import_job."""
+
+    @pytest.mark.asyncio
+    async def test_imports_rows_in_batches_and_records_errors(
+        self, async_db_session, test_tenant, tmp_path
+    ):
+        """Valid rows are created, invalid ones logged with their sheet row."""
+        path = tmp_path / "import.xlsx"
+        rows = [[f"需求 {i}", "描述"] + [None] * 4 + ["must_have"] + [None] * 4 + ["客户"] for i in range(5)]
+        rows.insert(2, ["缺少来源", "描述"])
+        rows.append([None] * 13)
+        _write_sheet(path, rows)
+
+        job = ImportJob(
+            tenant_id=test_tenant.id, imported_by=1, import_type="excel",
+            file_name="import.xlsx", file_path=str(path), status="pending",
+        )
+        async_db_session.add(job)
+        await async_db_session.commit()
+
+        @asynccontextmanager
+        async def session_factory():
+            yield async_db_session
+
+        await run_import_job(job.id, test_tenant.id, session_factory=session_factory, batch_size=2)
+
+        await async_db_session.refresh(job)
+        assert job.status == "completed"
+        assert (job.total_records, job.success_count, job.failed_count) == (6, 5, 1)
+        assert job.error_log["errors"][0]["row"] == 4
+        assert "source_channel" in job.error_log["errors"][0]["error"]
+        assert job.started_at and job.completed_at
+
+        count = await async_db_session.scalar(
+            select(func.count(Requirement.id)).where(Requirement.tenant_id == test_tenant.id)
+        )
+        assert count == 5
+        moscow = await async_db_session.scalar(select(Requirement.moscow_priority).limit(1))
+        assert moscow == "must_have"
+
+    @pytest.mark.asyncio
+    async def test_unreadable_file_marks_job_failed(self, async_db_session, test_tenant, tmp_path):
+        """A file that cannot be parsed fails the job with the reason."""
+        path = tmp_path / "broken.xlsx"
+        path.write_bytes(b"not a workbook")
+        job = ImportJob(
+            tenant_id=test_tenant.id, imported_by=1, import_type="excel",
+            file_name="broken.xlsx", file_path=str(path), status="pending",
+        )
+        async_db_session.add(job)
+        await async_db_session.commit()
+
+        @asynccontextmanager
+        async def session_factory():
+            yield async_db_session
+
+        await run_import_job(job.id, test_tenant.id, session_factory=session_factory)
+
+        await async_db_session.refresh(job)
+        assert job.status == "failed"
+        assert job.error_log["fatal"]
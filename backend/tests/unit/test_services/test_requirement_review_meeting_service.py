@@ -0,0 +1,296 @@
+"""
+Unit tests for RequirementReviewMeetingService
+
+Tests the review meeting voting workflow:
+- Vote statistics for a whole meeting from two queries
+- Pending voters for a whole meeting from one query
+- Ending a meeting with bulk auto-abstain in one transaction
+- cast_vote as a single upsert statement
+- Vote eligibility from one query with a cached attendee set
+"""
+
+import pytest
+
+from app.models.requirement_review_vote import RequirementReviewVote
+from app.models.vote_result import VoteResult
+from app.core.sql_profiler import instrument_engine, profile_request
+from app.repositories.requirement_review_meeting import (
+    RequirementReviewMeetingRepository,
+    invalidate_meeting_attendees,
+)
+from app.services.requirement_review_meeting import RequirementReviewMeetingService
+
+pytest_plugins = ["tests.conftest_review_meeting"]
+
+
+@pytest.fixture(autouse=True)
+def clear_attendee_cache():
+    # Every test database starts its meeting IDs at 1
+    invalidate_meeting_attendees()
+    yield
+    invalidate_meeting_attendees()
+
+
+@pytest.mark.unit
+class TestMeetingVoteStatistics:
+    """Test RequirementReviewMeetingService.get_meeting_vote_statistics."""
+
+    def test_statistics_for_all_requirements_in_two_queries(
+        self, db_engine, db_session, test_meeting, test_meeting_requirement_with_voters,
+        test_meeting_requirements, test_votes, test_voters
+    ):
+        """Every requirement is returned in review order; the query count ignores agenda length."""
+        service = RequirementReviewMeetingService(db_session)
+        meeting_id, tenant_id = test_meeting.id, test_meeting.tenant_id
+        requirement_ids = [req.requirement_id for req in test_meeting_requirements]
+        instrument_engine(db_engine)
+
+        with profile_request("GET", f"/requirement-review-meetings/{meeting_id}/vote-statistics") as profile:
+            statistics = service.get_meeting_vote_statistics(meeting_id, tenant_id)
+
+        assert profile.statement_count == 2
+        assert [stats["requirement_id"] for stats in statistics] == requirement_ids
+
+        first = statistics[0]
+        assert first["total_votes"] == 3
+        assert (first["approve_count"], first["reject_count"], first["abstain_count"]) == (1, 1, 1)
+        assert first["approve_percentage"] == 33.3
+        assert first["total_assigned_voters"] == first["voted_count"] == 3
+        assert first["is_voting_complete"] is True
+        assert {vote["voter_name"] for vote in first["votes"]} == {voter.username for voter in test_voters}
+
+        assert statistics[1]["total_votes"] == 0
+        assert statistics[1]["votes"] == []
+        assert statistics[1]["is_voting_complete"] is False
+
+    def test_matches_per_requirement_statistics(
+        self, db_session, test_meeting, test_meeting_requirement_with_voters,
+        test_meeting_requirements, test_votes
+    ):
+        """The batch result equals get_vote_statistics for each requirement."""
+        service = RequirementReviewMeetingService(db_session)
+
+        statistics = service.get_meeting_vote_statistics(test_meeting.id, test_meeting.tenant_id)
+
+        for stats in statistics:
+            single = service.get_vote_statistics(test_meeting.id, stats["requirement_id"])
+            for key in ("total_votes", "approve_count", "reject_count", "abstain_count",
+                        "approve_percentage", "voted_count", "total_assigned_voters", "is_voting_complete"):
+                assert stats[key] == single[key]
+            assert sorted(vote["voter_id"] for vote in stats["votes"]) == sorted(
+                vote["voter_id"] for vote in single["votes"]
+            )
+
+    def test_other_tenant_sees_nothing(self, db_session, test_meeting, test_meeting_requirements):
+        """Statistics are tenant-isolated."""
+        service = RequirementReviewMeetingService(db_session)
+
+        assert service.get_meeting_vote_statistics(test_meeting.id, test_meeting.tenant_id + 1) == []
+
+
+@pytest.mark.unit
+class TestPendingVoters:
+    """Test RequirementReviewMeetingRepository.get_all_pending_voters."""
+
+    def test_pending_voters_in_one_query(
+        self, db_engine, db_session, test_meeting, test_meeting_attendees,
+        test_meeting_requirements, test_votes_factory, test_voters
+    ):
+        """Assigned voters narrow a requirement's voter set; otherwise all attendees vote."""
+        requirement_ids = [req.requirement_id for req in test_meeting_requirements]
+        voter_ids = [voter.id for voter in test_voters]
+        test_meeting_requirements[1].assigned_voter_ids = voter_ids[:2]
+        db_session.commit()
+        test_votes_factory(test_meeting.id, requirement_ids[0], test_voters[:1], test_meeting.tenant_id)
+        test_votes_factory(test_meeting.id, requirement_ids[1], test_voters[1:], test_meeting.tenant_id)
+        repo = RequirementReviewMeetingRepository(db_session)
+        meeting_id = test_meeting.id
+        instrument_engine(db_engine)
+
+        with profile_request("GET", f"/requirement-review-meetings/{meeting_id}/pending-voters") as profile:
+            pending = repo.get_all_pending_voters(meeting_id)
+
+        assert profile.statement_count == 1
+        assert pending["total_requirements"] == 3
+        summary = {
+            item["requirement_id"]: (item["total_assigned"], item["voted_count"],
+                                     [voter["voter_id"] for voter in item["pending_voters"]])
+            for item in pending["requirements"]
+        }
+        assert summary == {
+            requirement_ids[0]: (3, 1, voter_ids[1:]),
+            requirement_ids[1]: (2, 1, voter_ids[:1]),
+            requirement_ids[2]: (3, 0, voter_ids),
+        }
+        first_pending = pending["requirements"][0]["pending_voters"][0]
+        assert first_pending["voter_name"] == test_voters[1].username
+        assert first_pending["full_name"] == test_voters[1].full_name
+
+    def test_requirements_without_voters(self, db_session, test_meeting, test_meeting_requirements):
+        """Requirements are counted but not listed when the meeting has no attendees."""
+        pending = RequirementReviewMeetingRepository(db_session).get_all_pending_voters(test_meeting.id)
+
+        assert pending == {"total_requirements": 3, "requirements": []}
+
+
+@pytest.mark.unit
+class TestEndMeeting:
+    """Test RequirementReviewMeetingService.end_meeting."""
+
+    def test_auto_abstain_inserts_pending_votes_in_one_statement(
+        self, db_engine, db_session, test_meeting_in_progress, test_meeting_attendees,
+        test_meeting_requirements, test_votes, test_voters
+    ):
+        """Missing votes are added by one INSERT ... SELECT; the meeting is completed and archived."""
+        meeting = test_meeting_in_progress
+        requirement_ids = [req.requirement_id for req in test_meeting_requirements]
+        service = RequirementReviewMeetingService(db_session)
+        stats = service.repo.create_abstain_votes_for_pending_voters(meeting.id, meeting.tenant_id, commit=False)
+        db_session.rollback()
+        assert stats == {
+            "total_votes_created": 6,
+            "by_requirement": {requirement_ids[1]: 3, requirement_ids[2]: 3},
+        }
+        instrument_engine(db_engine)
+
+        with profile_request("POST", f"/requirement-review-meetings/{meeting.id}/end") as profile:
+            ended = service.end_meeting(meeting, auto_abstain=True)
+
+        # abstain INSERT, tallies, votes, titles, status UPDATE, archive INSERT, refresh
+        assert profile.statement_count == 7
+        assert ended.status == "completed" and ended.ended_at is not None
+
+        abstains = db_session.query(RequirementReviewVote).filter(
+            RequirementReviewVote.vote_option == "abstain",
+            RequirementReviewVote.comment == "会议结束时自动弃权"
+        ).all()
+        assert len(abstains) == 6
+        assert {vote.requirement_id for vote in abstains} == set(requirement_ids[1:])
+
+        archived = {
+            result.requirement_id: result.vote_statistics
+            for result in db_session.query(VoteResult).filter(VoteResult.meeting_id == meeting.id)
+        }
+        assert archived[requirement_ids[0]]["total_votes"] == 3
+        assert archived[requirement_ids[1]]["abstain_count"] == 3
+        assert archived[requirement_ids[2]]["abstain_percentage"] == 100.0
+
+    def test_failed_archive_rolls_back_abstain_votes(
+        self, db_session, test_meeting_in_progress, test_meeting_attendees,
+        test_meeting_requirements, monkeypatch
+    ):
+        """Abstain votes and the status change are not committed when archiving fails."""
+        meeting = test_meeting_in_progress
+        service = RequirementReviewMeetingService(db_session)
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("archive failed")
+
+        monkeypatch.setattr(service.repo, "archive_meeting_results", fail)
+
+        with pytest.raises(RuntimeError):
+            service.end_meeting(meeting, auto_abstain=True)
+
+        assert db_session.query(RequirementReviewVote).count() == 0
+        db_session.refresh(meeting)
+        assert meeting.status == "in_progress"
+
+
+@pytest.mark.unit
+class TestCastVote:
+    """Test RequirementReviewMeetingRepository.cast_vote."""
+
+    def test_first_vote_and_revote_are_single_upserts(
+        self, db_engine, db_session, test_meeting_in_progress, test_meeting_requirements, test_voters
+    ):
+        """Insert and update both take one INSERT ... ON CONFLICT DO UPDATE ... RETURNING."""
+        meeting = test_meeting_in_progress
+        repo = RequirementReviewMeetingRepository(db_session)
+        args = dict(meeting_id=meeting.id, requirement_id=test_meeting_requirements[0].requirement_id,
+                    voter_id=test_voters[0].id, tenant_id=meeting.tenant_id)
+        instrument_engine(db_engine)
+
+        with profile_request("POST", "/vote") as first_profile:
+            first = repo.cast_vote(vote_option="approve", comment="同意", **args)
+        with profile_request("POST", "/vote") as second_profile:
+            second = repo.cast_vote(vote_option="reject", **args)
+
+        assert first_profile.statement_count == second_profile.statement_count == 1
+        assert (first.vote_option, first.comment) == ("approve", "同意")
+        assert second.id == first.id
+        assert (second.vote_option, second.comment) == ("reject", None)
+        assert second.created_at is not None and second.updated_at is not None
+        assert db_session.query(RequirementReviewVote).count() == 1
+
+
+@pytest.mark.unit
+class TestVoteEligibility:
+    """Test RequirementReviewMeetingService.get_vote_eligibility."""
+
+    def test_eligibility_in_one_query(
+        self, db_engine, db_session, test_meeting_in_progress, test_meeting_attendees,
+        test_meeting_requirement_with_voters, test_votes_factory, test_voters
+    ):
+        """Status, attendance, assignment and an existing vote come from one query, cached or not."""
+        meeting = test_meeting_in_progress
+        requirement_id = test_meeting_requirement_with_voters.requirement_id
+        test_votes_factory(meeting.id, requirement_id, test_voters[:1], meeting.tenant_id)
+        service = RequirementReviewMeetingService(db_session)
+        meeting_id, tenant_id = meeting.id, meeting.tenant_id
+        voter_ids = [voter.id for voter in test_voters]
+        instrument_engine(db_engine)
+
+        with profile_request("POST", "/vote") as miss:
+            voted = service.get_vote_eligibility(meeting_id, voter_ids[0], requirement_id, tenant_id=tenant_id)
+        with profile_request("POST", "/vote") as hit:
+            pending = service.get_vote_eligibility(meeting_id, voter_ids[1], requirement_id, tenant_id=tenant_id)
+
+        assert miss.statement_count == hit.statement_count == 1
+        assert voted == {"status": "in_progress", "is_attendee": True, "is_assigned_voter": True,
+                         "has_voted": True, "can_vote": True}
+        assert pending["has_voted"] is False and pending["can_vote"] is True
+
+    def test_assigned_voters_and_non_attendees(
+        self, db_session, test_meeting_in_progress, test_meeting_attendees,
+        test_meeting_requirements, test_moderator, test_voters
+    ):
+        """Assignment is reported; only attendees of an in-progress meeting can vote."""
+        meeting = test_meeting_in_progress
+        meeting_req = test_meeting_requirements[0]
+        meeting_req.assigned_voter_ids = [test_voters[0].id]
+        db_session.commit()
+        service = RequirementReviewMeetingService(db_session)
+
+        def check(user_id):
+            return service.get_vote_eligibility(meeting.id, user_id, meeting_req.requirement_id,
+                                                tenant_id=meeting.tenant_id)
+
+        assert check(test_voters[0].id)["is_assigned_voter"] is True
+        assert check(test_voters[1].id)["is_assigned_voter"] is False
+        assert check(test_voters[1].id)["can_vote"] is True
+        assert check(test_moderator.id)["can_vote"] is False
+        assert service.get_vote_eligibility(meeting.id, test_voters[0].id, meeting_req.requirement_id,
+                                            tenant_id=meeting.tenant_id + 1)["can_vote"] is False
+
+        meeting.status = "completed"
+        db_session.commit()
+        assert check(test_voters[0].id)["can_vote"] is False
+
+    def test_attendee_changes_invalidate_cache(
+        self, db_session, test_meeting_in_progress, test_meeting_requirements, test_moderator
+    ):
+        """add_attendee / remove_attendee take effect immediately despite the cached set."""
+        meeting = test_meeting_in_progress
+        requirement_id = test_meeting_requirements[0].requirement_id
+        service = RequirementReviewMeetingService(db_session)
+
+        def can_vote():
+            return service.get_vote_eligibility(meeting.id, test_moderator.id, requirement_id,
+                                                tenant_id=meeting.tenant_id)["can_vote"]
+
+        assert can_vote() is False
+        service.repo.add_attendee(meeting.id, test_moderator.id, meeting.tenant_id)
+        assert can_vote() is True
+        service.repo.remove_attendee(meeting.id, test_moderator.id)
+        assert can_vote() is False
+
@@ -0,0 +1,96 @@
+"""
+Unit tests for RequirementService bulk creation and statistics
+
+Tests POST /requirements/bulk business logic:
+- Valid rows are created, invalid rows reported per row
+- Schema length limits match the model columns
+- Tenant context is required
+- Statistics are scoped to an explicitly passed tenant
+"""
+
+import pytest
+
+from app.core.tenant import tenant_context
+from app.models.requirement import Requirement
+from app.schemas.requirement import RequirementCreate
+from app.services.requirement import RequirementService
+
+
+@pytest.fixture
+def tenant_scope(test_tenant):
+    token = tenant_context.set(test_tenant.id)
+    yield test_tenant.id
+    tenant_context.reset(token)
+
+
+@pytest.mark.unit
+class TestRequirementBulkCreate:
+    """Test RequirementService.bulk_create_requirements."""
+
+    @pytest.mark.asyncio
+    async def test_reports_invalid_rows_and_creates_valid_ones(self, async_db_session, tenant_scope):
+        """Invalid rows are skipped with an error; results keep input order."""
+        service = RequirementService(async_db_session)
+        items = [
+            {"title": "有效需求", "description": "描述", "source_channel": "customer"},
+            {"title": "缺少描述", "source_channel": "customer"},
+            {"title": "渠道错误", "description": "描述", "source_channel": "fax"},
+            {"title": "另一个需求", "description": "描述", "source_channel": "rd"},
+            {"title": "优先级过长", "description": "描述", "source_channel": "rd", "moscow_priority": "m" * 21},
+        ]
+
+        result = await service.bulk_create_requirements(items)
+
+        assert (result.total, result.created, result.failed) == (5, 2, 3)
+        assert [r.success for r in result.results] == [True, False, False, True, False]
+        assert "description" in result.results[1].error
+        assert "source_channel" in result.results[2].error
+        assert "moscow_priority" in result.results[4].error
+        assert result.results[0].requirement_no and result.results[3].requirement_no
+        created = await service.get_requirement(result.results[3].id)
+        assert created.title == "另一个需求" and created.tenant_id == tenant_scope
+
+    def test_schema_lengths_match_model_columns(self):
+        """String limits checked per row are the ones the database enforces."""
+        for name in ("title", "source_contact", "moscow_priority"):
+            field = RequirementCreate.model_fields[name]
+            max_length = next(m.max_length for m in field.metadata if hasattr(m, "max_length"))
+            assert max_length == Requirement.__table__.c[name].type.length, name
+
+    @pytest.mark.asyncio
+    async def test_requires_tenant_context(self, async_db_session):
+        """Bulk create outside a tenant context is rejected."""
+        service = RequirementService(async_db_session)
+
+        with pytest.raises(ValueError):
+            await service.bulk_create_requirements([{"title": "x"}])
+
+
+@pytest.mark.unit
+class TestRequirementStatistics:
+    """Test RequirementService.get_statistics."""
+
+    @pytest.mark.asyncio
+    async def test_explicit_tenant_without_context(self, async_db_session, test_tenant):
+        """A passed tenant ID scopes the counters even without X-Tenant-ID context."""
+        service = RequirementService(async_db_session)
+        token = tenant_context.set(test_tenant.id)
+        try:
+            await service.bulk_create_requirements([
+                {"title": "统计需求", "description": "描述", "source_channel": "customer"},
+            ])
+        finally:
+            tenant_context.reset(token)
+        token = tenant_context.set(test_tenant.id + 1)
+        try:
+            await service.bulk_create_requirements([
+                {"title": f"其他租户 {i}", "description": "描述", "source_channel": "rd"} for i in range(2)
+            ])
+        finally:
+            tenant_context.reset(token)
+
+        stats = await service.get_statistics(tenant_id=test_tenant.id)
+
+        assert stats.total == 1
+        assert stats.by_channel.customer == 1 and stats.by_channel.rd == 0
+
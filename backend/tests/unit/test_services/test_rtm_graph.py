@@ -0,0 +1,146 @@
+"""
+Unit tests for the in-memory traceability graph
+
+Tests:
+- Reverse lookups and transitive impact on a tenant graph
+- Incremental updates on link create / update / delete
+- Revalidation against the database and LRU eviction across tenants
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.models.rtm import TraceabilityLink
+from app.models.tenant import Tenant
+from app.repositories.requirement import RequirementRepository
+from app.schemas.rtm import TraceabilityLinkCreate, TraceabilityLinkUpdate
+from app.services.rtm import rtm_service
+from app.services.rtm_graph import TraceabilityGraph, TraceabilityGraphIndex, make_node
+
+
+def _link(link_id, requirement_id, **fields):
+    values = {f"{kind}_id": None for kind in ("design", "code", "test")}
+    values.update({f"{kind}_attachment_id": None for kind in ("design", "code", "test")})
+    values.update(fields)
+    return SimpleNamespace(id=link_id, requirement_id=requirement_id, **values)
+
+
+@pytest.mark.unit
+class TestTraceabilityGraph:
+    """Test TraceabilityGraph."""
+
+    @pytest.fixture
+    def graph(self):
+        graph = TraceabilityGraph()
+        graph.add_link(_link(1, 10, design_id="DES-1", test_attachment_id=7))
+        graph.add_link(_link(2, 11, design_id="DES-1", code_id="CODE-2"))
+        graph.add_link(_link(3, 12, code_id="CODE-2"))
+        graph.add_link(_link(4, 13, test_id="TEST-4"))
+        return graph
+
+    def test_reverse_lookup(self, graph):
+        """Artifacts map back to the requirements referencing them."""
+        assert graph.neighbours(("design", "DES-1")) == [("requirement", 10), ("requirement", 11)]
+        assert graph.neighbours(("attachment", 7)) == [("requirement", 10)]
+        assert graph.neighbours(("requirement", 10)) == [("design", "DES-1"), ("attachment", 7)]
+
+    def test_transitive_impact(self, graph):
+        """Impact follows shared artifacts from requirement to requirement."""
+        impact = graph.impact(("attachment", 7))
+
+        requirements = {item["id"]: item["depth"] for item in impact if item["kind"] == "requirement"}
+        assert requirements == {10: 1, 11: 3, 12: 5}
+        assert all(item["id"] != 13 for item in impact)
+        assert [item["id"] for item in graph.impact(("attachment", 7), max_depth=2)] == [10, "DES-1"]
+
+    def test_update_and_remove(self, graph):
+        """Re-adding a link replaces its edges; removing drops unused nodes."""
+        graph.add_link(_link(1, 10, design_id="DES-9"))
+        assert graph.neighbours(("attachment", 7)) == []
+        assert graph.neighbours(("design", "DES-1")) == [("requirement", 11)]
+
+        assert graph.remove_link(2) is True
+        assert graph.remove_link(2) is False
+        assert graph.neighbours(("code", "CODE-2")) == [("requirement", 12)]
+
+    def test_make_node_validates(self):
+        assert make_node("attachment", "7") == ("attachment", 7)
+        with pytest.raises(ValueError):
+            make_node("attachment", "abc")
+        with pytest.raises(ValueError):
+            make_node("unknown", "1")
+
+
+@pytest.fixture
+def requirements(db_session, test_tenant_sync):
+    repo = RequirementRepository(db_session)
+    created = [
+        repo.create(title=f"图 {i}", description="描述", tenant_id=test_tenant_sync.id, source_channel="customer")
+        for i in range(3)
+    ]
+    db_session.commit()
+    return created
+
+
+@pytest.mark.unit
+class TestTraceabilityGraphIndex:
+    """Test TraceabilityGraphIndex."""
+
+    def test_links_written_through_service_update_cached_graph(
+        self, db_session, test_tenant_sync, requirements, monkeypatch
+    ):
+        """create / update / delete apply to the cached graph without a rebuild."""
+        tenant_id = test_tenant_sync.id
+        index = TraceabilityGraphIndex(max_tenants=5, revalidate_seconds=0)
+        monkeypatch.setattr("app.services.rtm.traceability_graph_index", index)
+        assert index.lookup(db_session, tenant_id, ("test", "T-1")) == []
+        graph = index.get(db_session, tenant_id)
+
+        link = rtm_service.create_link(
+            db_session, TraceabilityLinkCreate(requirement_id=requirements[0].id, test_id="T-1"), tenant_id
+        )
+        assert index.lookup(db_session, tenant_id, ("test", "T-1")) == [
+            {"kind": "requirement", "id": requirements[0].id}
+        ]
+
+        rtm_service.update_link(db_session, link.id, TraceabilityLinkUpdate(test_id="T-2"), tenant_id)
+        assert index.lookup(db_session, tenant_id, ("test", "T-1")) == []
+        assert index.lookup(db_session, tenant_id, ("test", "T-2")) != []
+
+        rtm_service.delete_link(db_session, link.id, tenant_id)
+        assert index.lookup(db_session, tenant_id, ("test", "T-2")) == []
+        # Incremental versions matched the database: never rebuilt
+        assert index.get(db_session, tenant_id) is graph
+
+    def test_external_changes_are_picked_up_on_revalidation(
+        self, db_session, test_tenant_sync, requirements
+    ):
+        """Links written elsewhere (another process) trigger a rebuild."""
+        tenant_id = test_tenant_sync.id
+        index = TraceabilityGraphIndex(max_tenants=5, revalidate_seconds=0)
+        assert index.impact(db_session, tenant_id, ("design", "D-1")) == []
+
+        db_session.add(TraceabilityLink(requirement_id=requirements[1].id, design_id="D-1", tenant_id=tenant_id))
+        db_session.commit()
+
+        assert index.impact(db_session, tenant_id, ("design", "D-1")) == [
+            {"kind": "requirement", "id": requirements[1].id, "depth": 1}
+        ]
+
+    def test_lru_eviction(self, db_session, test_tenant_sync):
+        """The least recently used tenant graph is evicted."""
+        other = Tenant(name="Other", code="other")
+        third = Tenant(name="Third", code="third")
+        db_session.add_all([other, third])
+        db_session.commit()
+        index = TraceabilityGraphIndex(max_tenants=2)
+
+        index.get(db_session, test_tenant_sync.id)
+        index.get(db_session, other.id)
+        index.get(db_session, test_tenant_sync.id)
+        index.get(db_session, third.id)
+
+        assert test_tenant_sync.id in index and third.id in index
+        assert other.id not in index
+        assert index.stats()["tenants"] == 2
@@ -0,0 +1,215 @@
+"""
+Unit tests for RTMService
+
+Tests the traceability matrix:
+- Matrix built from two queries (requirement page + batched links)
+- Attachments loaded with the links
+- Pagination, status and coverage filters
+- Description only returned when requested
+- Coverage statistics aggregated in one query
+- Bulk link creation with batched validation
+- Streaming Excel / PDF export
+"""
+
+import io
+
+import openpyxl
+import pytest
+
+from app.core.sql_profiler import instrument_engine, profile_request
+from app.models.attachment import Attachment
+from app.models.rtm import TraceabilityLink
+from app.repositories.requirement import RequirementRepository
+from app.schemas.rtm import TraceabilityLinkCreate
+from app.services.rtm import rtm_service
+
+
+@pytest.fixture
+def rtm_data(db_session, test_tenant_sync):
+    """Four requirements: complete, partial (design only), partial (code + test) and missing."""
+    tenant_id = test_tenant_sync.id
+    repo = RequirementRepository(db_session)
+    requirements = [
+        repo.create(title=f"追溯 {i}", description=f"描述 {i}", tenant_id=tenant_id, source_channel="customer")
+        for i in range(4)
+    ]
+    requirements[3].status = "analyzing"
+
+    attachment = Attachment(entity_type="requirement", entity_id=requirements[0].id,
+                            file_name="design.pdf", file_path="/tmp/design.pdf")
+    db_session.add(attachment)
+    db_session.flush()
+
+    db_session.add_all([
+        TraceabilityLink(requirement_id=requirements[0].id, design_attachment_id=attachment.id,
+                         code_id="CODE-1", tenant_id=tenant_id),
+        TraceabilityLink(requirement_id=requirements[0].id, test_id="TEST-1", tenant_id=tenant_id),
+        TraceabilityLink(requirement_id=requirements[1].id, design_id="DES-2", tenant_id=tenant_id),
+        TraceabilityLink(requirement_id=requirements[2].id, code_id="CODE-3", test_id="TEST-3",
+                         tenant_id=tenant_id),
+    ])
+    db_session.commit()
+    return requirements
+
+
+@pytest.mark.unit
+class TestTraceabilityMatrix:
+    """Test RTMService.get_traceability_matrix."""
+
+    def test_matrix_uses_two_queries(self, db_engine, db_session, test_tenant_sync, rtm_data):
+        """The requirements and all their links (with attachments) take two statements."""
+        instrument_engine(db_engine)
+        tenant_id = test_tenant_sync.id
+        db_session.expire_all()
+
+        with profile_request("GET", "/rtm/matrix") as profile:
+            matrix = rtm_service.get_traceability_matrix(db_session, tenant_id)
+
+        assert profile.statement_count == 2
+        assert [item.requirement_id for item in matrix] == [req.id for req in rtm_data]
+
+        first = matrix[0]
+        assert first.design_items[0].design_attachment.file_name == "design.pdf"
+        assert [item.code_id for item in first.code_items] == ["CODE-1"]
+        assert [item.test_id for item in first.test_items] == ["TEST-1"]
+        assert matrix[3].design_items == matrix[3].code_items == matrix[3].test_items == []
+
+    def test_description_is_only_returned_on_request(self, db_session, test_tenant_sync, rtm_data):
+        """The description column is projected only with include_description."""
+        without = rtm_service.get_traceability_matrix(db_session, test_tenant_sync.id)
+        with_description = rtm_service.get_traceability_matrix(
+            db_session, test_tenant_sync.id, include_description=True
+        )
+
+        assert all(item.requirement_description is None for item in without)
+        assert with_description[0].requirement_description == "描述 0"
+
+    def test_pagination(self, db_session, test_tenant_sync, rtm_data):
+        """Pages are ordered by requirement ID; the count ignores pagination."""
+        page = rtm_service.get_traceability_matrix(db_session, test_tenant_sync.id, page=2, page_size=3)
+
+        assert [item.requirement_id for item in page] == [rtm_data[3].id]
+        assert rtm_service.count_traceability_matrix(db_session, test_tenant_sync.id) == 4
+
+    @pytest.mark.parametrize("coverage, expected", [
+        ("complete", [0]),
+        ("partial", [1, 2]),
+        ("missing", [3]),
+    ])
+    def test_coverage_filter(self, db_session, test_tenant_sync, rtm_data, coverage, expected):
+        """Coverage is evaluated in SQL from the requirement's links."""
+        matrix = rtm_service.get_traceability_matrix(db_session, test_tenant_sync.id, coverage=coverage)
+
+        assert [item.requirement_id for item in matrix] == [rtm_data[i].id for i in expected]
+        assert rtm_service.count_traceability_matrix(
+            db_session, test_tenant_sync.id, coverage=coverage
+        ) == len(expected)
+
+    def test_status_filter_and_invalid_coverage(self, db_session, test_tenant_sync, rtm_data):
+        """Status narrows the matrix; unknown coverage values are rejected."""
+        matrix = rtm_service.get_traceability_matrix(db_session, test_tenant_sync.id, status="analyzing")
+        assert [item.requirement_id for item in matrix] == [rtm_data[3].id]
+
+        with pytest.raises(ValueError):
+            rtm_service.get_traceability_matrix(db_session, test_tenant_sync.id, coverage="unknown")
+
+
+@pytest.mark.unit
+class TestRTMStatistics:
+    """Test RTMService.get_statistics."""
+
+    def test_statistics_in_one_query(self, db_engine, db_session, test_tenant_sync, rtm_data):
+        """Complete / partial / missing and per-type coverage come from one grouped query."""
+        instrument_engine(db_engine)
+        tenant_id = test_tenant_sync.id
+
+        with profile_request("GET", "/rtm/statistics") as profile:
+            stats = rtm_service.get_statistics(db_session, tenant_id)
+
+        assert profile.statement_count == 1
+        assert stats == {
+            "total": 4,
+            "complete": 1,
+            "partial": 2,
+            "missing": 1,
+            "coverage": {"design": 2, "code": 2, "test": 2},
+            "completion_rate": 25.0,
+        }
+
+    def test_statistics_without_requirements(self, db_session, test_tenant_sync):
+        """An empty tenant has zero counts instead of NULL sums."""
+        stats = rtm_service.get_statistics(db_session, test_tenant_sync.id)
+
+        assert stats["total"] == stats["complete"] == stats["missing"] == 0
+        assert stats["coverage"] == {"design": 0, "code": 0, "test": 0}
+        assert stats["completion_rate"] == 0
+
+
+@pytest.mark.unit
+class TestBulkCreateLinks:
+    """Test RTMService.bulk_create_links."""
+
+    def test_bulk_create_validates_in_batches(self, db_engine, db_session, test_tenant_sync, rtm_data):
+        """Requirements and attachments are checked with one query each; links are inserted together."""
+        instrument_engine(db_engine)
+        tenant_id = test_tenant_sync.id
+        requirement_ids = [req.id for req in rtm_data]
+        attachment_id = db_session.query(Attachment.id).scalar()
+        items = [
+            TraceabilityLinkCreate(requirement_id=requirement_ids[i], test_id=f"BULK-{i}",
+                                   code_attachment_id=attachment_id)
+            for i in range(4)
+        ]
+
+        with profile_request("POST", "/rtm/links/bulk") as profile:
+            links = rtm_service.bulk_create_links(db_session, items, tenant_id)
+
+        # requirement IN, attachment IN, INSERT ... RETURNING, reload with attachments
+        assert profile.statement_count == 4
+        assert [link.test_id for link in links] == [f"BULK-{i}" for i in range(4)]
+        assert all(link.code_attachment.file_name == "design.pdf" for link in links)
+        assert all(link.status == "active" and link.tenant_id == tenant_id for link in links)
+
+    @pytest.mark.parametrize("item, message", [
+        ({"requirement_id": 999999, "design_id": "D"}, "需求 999999 不存在"),
+        ({"design_attachment_id": 999999}, "设计文档附件 999999 不存在"),
+        ({}, "至少需要提供一个追溯项"),
+    ])
+    def test_invalid_item_rejects_whole_batch(self, db_session, test_tenant_sync, rtm_data, item, message):
+        """Nothing is inserted when any item fails validation."""
+        before = db_session.query(TraceabilityLink).count()
+        items = [
+            TraceabilityLinkCreate(requirement_id=rtm_data[0].id, design_id="OK"),
+            TraceabilityLinkCreate(**{"requirement_id": rtm_data[1].id, **item}),
+        ]
+
+        with pytest.raises(ValueError, match=message):
+            rtm_service.bulk_create_links(db_session, items, test_tenant_sync.id)
+        assert db_session.query(TraceabilityLink).count() == before
+
+
+@pytest.mark.unit
+class TestRTMExport:
+    """Test the streaming RTM exports."""
+
+    def test_excel_export(self, db_session, test_tenant_sync, rtm_data):
+        """One row per requirement with its joined link IDs, then the summary."""
+        output = io.BytesIO()
+        assert rtm_service.export_to_excel(db_session, test_tenant_sync.id, output) == 4
+
+        rows = list(openpyxl.load_workbook(output).active.iter_rows(values_only=True))
+        assert rows[0][0] == "需求ID"
+        assert rows[1][1:] == ("追溯 0", None, "CODE-1", "TEST-1", "完整")
+        assert rows[2][2:] == ("DES-2", "无", "无", "部分")
+        assert rows[4][2:] == ("无", "无", "无", "缺失")
+        notes = [row[0] for row in rows[5:] if row and row[0]]
+        assert notes[:5] == ["汇总统计", "总计需求: 4", "完整追溯: 1", "部分追溯: 2", "缺失追溯: 1"]
+
+    def test_pdf_export(self, db_session, test_tenant_sync, rtm_data):
+        """The PDF lists every requirement with its coverage status."""
+        output = io.BytesIO()
+        assert rtm_service.export_to_pdf(db_session, test_tenant_sync.id, output) == 4
+
+        content = output.getvalue().decode("utf-8")
+        assert "REQUIREMENTS TRACEABILITY MATRIX" in content
+        assert content.count("完整") == 1 and content.count("缺失") == 1
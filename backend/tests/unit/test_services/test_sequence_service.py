@@ -0,0 +1,97 @@
+"""
+Unit tests for SequenceService
+
+Tests business number allocation from business_sequences counters:
+- Sequential numbers and contiguous block reservation
+- Seeding a new counter from numbers already stored
+- Per-tenant counters and period reset
+- Distribution target IDs seeded from numeric target_id values
+- Previewing the next value without reserving it
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app.models.requirement import Requirement
+from app.services.sequence import (
+    FEEDBACK_NO,
+    MEETING_NO,
+    REQUIREMENT_NO,
+    SequenceService,
+    target_id_spec,
+)
+
+NOW = datetime(2026, 10, 16, 9, 30)
+
+
+@pytest.mark.unit
+class TestSequenceService:
+    """Test SequenceService."""
+
+    def test_next_number_and_reserve_block(self, db_session):
+        """Numbers increment by one; a block is reserved with one update."""
+        service = SequenceService(db_session)
+
+        assert service.next_number(MEETING_NO, tenant_id=1, now=NOW) == "RM-20261016-001"
+        assert service.reserve_numbers(MEETING_NO, 3, tenant_id=1, now=NOW) == [
+            "RM-20261016-002", "RM-20261016-003", "RM-20261016-004",
+        ]
+        assert service.next_number(MEETING_NO, tenant_id=2, now=NOW) == "RM-20261016-005"
+
+    def test_new_counter_is_seeded_from_existing_numbers(self, db_session, test_tenant_sync):
+        """Existing numbers (including wider ones) are not handed out again."""
+        for no in ("REQ-2026-0998", "REQ-2026-10001"):
+            db_session.add(Requirement(
+                requirement_no=no, title=no, description="legacy",
+                source_channel="customer", tenant_id=test_tenant_sync.id,
+            ))
+        db_session.commit()
+
+        assert SequenceService(db_session).next_number(REQUIREMENT_NO, now=NOW) == "REQ-2026-10002"
+
+    def test_per_tenant_counters_and_period_reset(self, db_session):
+        """Feedback numbers count per tenant and restart every year."""
+        service = SequenceService(db_session)
+
+        assert service.next_number(FEEDBACK_NO, tenant_id=1, now=NOW) == "FB-2026-0001"
+        assert service.next_number(FEEDBACK_NO, tenant_id=1, now=NOW) == "FB-2026-0002"
+        assert service.next_number(FEEDBACK_NO, tenant_id=2, now=NOW) == "FB-2026-0001"
+        assert service.next_number(FEEDBACK_NO, tenant_id=1, now=datetime(2027, 1, 1)) == "FB-2027-0001"
+
+        with pytest.raises(ValueError):
+            service.next_number(FEEDBACK_NO)
+
+    def test_target_ids_per_tenant_and_type(self, db_session, test_tenant_sync):
+        """Target IDs continue after the tenant's highest target_id of the same type."""
+        for no, target_type, target_id in (("REQ-1", "sp", 7), ("REQ-2", "bp", 40), ("REQ-3", "sp", 3)):
+            db_session.add(Requirement(
+                requirement_no=no, title=no, description="distributed", source_channel="customer",
+                tenant_id=test_tenant_sync.id, target_type=target_type, target_id=target_id,
+            ))
+        db_session.commit()
+        service = SequenceService(db_session)
+        sp = target_id_spec("sp")
+
+        assert service.reserve_values(sp, 3, tenant_id=test_tenant_sync.id) == [8, 9, 10]
+        assert service.next_number(sp, tenant_id=test_tenant_sync.id) == "SP-011"
+        assert service.next_number(target_id_spec("bp"), tenant_id=test_tenant_sync.id) == "BP-041"
+        assert service.reserve_values(sp, 1, tenant_id=test_tenant_sync.id + 1) == [1]
+
+        with pytest.raises(ValueError):
+            target_id_spec("unknown")
+
+    def test_peek_value_does_not_reserve(self, db_session, test_tenant_sync):
+        """Previews repeat the same value until it is reserved."""
+        db_session.add(Requirement(
+            requirement_no="REQ-1", title="REQ-1", description="distributed", source_channel="customer",
+            tenant_id=test_tenant_sync.id, target_type="sp", target_id=4,
+        ))
+        db_session.commit()
+        service = SequenceService(db_session)
+        sp = target_id_spec("sp")
+
+        assert service.peek_value(sp, tenant_id=test_tenant_sync.id) == 5
+        assert service.peek_value(sp, tenant_id=test_tenant_sync.id) == 5
+        assert service.reserve_values(sp, 1, tenant_id=test_tenant_sync.id) == [5]
+        assert service.peek_value(sp, tenant_id=test_tenant_sync.id) == 6
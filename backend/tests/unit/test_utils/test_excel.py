@@ -0,0 +1,106 @@
+"""
+Unit tests for Excel utilities
+
+Tests:
+- ExcelStreamWriter output (shared named styles, widths, notes)
+- Streaming reads of the import template
+- Requirement development export streamed from the database
+"""
+
+import io
+
+import openpyxl
+import pytest
+
+from app.repositories.requirement import RequirementRepository
+from app.services.requirement import RequirementService
+from app.utils.excel import ExcelHandler, ExcelStreamWriter, iter_file_chunks
+
+
+@pytest.mark.unit
+class TestExcelStreamWriter:
+    """Test ExcelStreamWriter."""
+
+    def test_rows_share_named_styles(self):
+        """Header and body cells reference the two registered named styles."""
+        writer = ExcelStreamWriter("Sheet", ["A", "B"], [10, 20])
+        for i in range(3):
+            writer.append([i, f"row {i}"])
+        writer.append_note("total: 3", bold=True)
+        output = io.BytesIO()
+        writer.save(output)
+
+        ws = openpyxl.load_workbook(io.BytesIO(output.getvalue())).active
+        assert [c.value for c in ws[1]] == ["A", "B"]
+        assert ws.cell(1, 1).style == "export_header"
+        assert ws.cell(4, 2).style == "export_body" and ws.cell(4, 2).value == "row 2"
+        assert ws.cell(5, 1).value == "total: 3"
+        assert ws.column_dimensions["B"].width == 20
+        assert writer.rows_written == 3
+
+    def test_iter_file_chunks_reads_and_closes(self):
+        """Chunks reassemble the file; the file is closed afterwards."""
+        file = io.BytesIO(b"x" * 10)
+        assert b"".join(iter_file_chunks(file, chunk_size=3)) == b"x" * 10
+        assert file.closed
+
+
+@pytest.mark.unit
+class TestExcelImportRows:
+    """Test streaming reads of the import template."""
+
+    def test_iter_rows_skips_header_and_empty_rows(self, tmp_path):
+        """Rows keep their sheet row number; template labels are mapped."""
+        path = tmp_path / "import.xlsx"
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(["需求标题", "需求描述"])
+        ws.append(["标题", "描述", None, None, None, None, "must_have", None, None, None, None, "市场"])
+        ws.append([None, None])
+        ws.append(["第二条", "描述"])
+        wb.save(path)
+
+        rows = list(ExcelHandler.iter_rows(str(path)))
+
+        assert [row_num for row_num, _ in rows] == [2, 4]
+        assert ExcelHandler.template_row_to_requirement(rows[0][1]) == {
+            "title": "标题", "description": "描述", "moscow_priority": "must_have",
+            "source_channel": "market",
+        }
+        assert ExcelHandler.template_row_to_requirement(rows[1][1])["source_channel"] is None
+
+
+@pytest.mark.unit
+class TestRequirementExcelExport:
+    """Test RequirementService.export_to_excel."""
+
+    def test_export_streams_filtered_tenant_rows(self, db_session, test_tenant_sync):
+        """Only the tenant's rows matching the filters are written, in chunks."""
+        repo = RequirementRepository(db_session)
+        for i in range(3):
+            repo.create(
+                title=f"导出需求 {i}", description="描述", source_channel="market",
+                tenant_id=test_tenant_sync.id,
+            )
+        repo.create(
+            title="其他租户", description="描述", source_channel="market",
+            tenant_id=test_tenant_sync.id + 1,
+        )
+        db_session.commit()
+
+        rows = list(repo.iter_for_export(test_tenant_sync.id, status="collected", chunk_size=2))
+        assert len(rows) == 3
+
+        output = io.BytesIO()
+        count = RequirementService.export_to_excel(
+            db=db_session, tenant_id=test_tenant_sync.id, output=output,
+            status="collected", target_type=None,
+        )
+
+        assert count == 3
+        ws = openpyxl.load_workbook(io.BytesIO(output.getvalue())).active
+        values = [row for row in ws.iter_rows(values_only=True)]
+        assert values[0][0] == "需求编号"
+        assert {row[1] for row in values[1:4]} == {"导出需求 0", "导出需求 1", "导出需求 2"}
+        assert values[1][2] == "市场"
+        assert values[-1][0] == "总计: 3 条记录"
@@ -0,0 +1,39 @@
+"""
+Unit tests for cursor pagination helpers
+
+Tests:
+- Cursor payloads (with datetimes) survive an encode / decode round trip
+- Tampered cursors raise ValueError instead of leaking other errors
+"""
+
+import base64
+import json
+from datetime import datetime
+
+import pytest
+
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+def _token(payload) -> str:
+    raw = json.dumps(payload).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+@pytest.mark.unit
+class TestCursor:
+    """Test encode_cursor / decode_cursor."""
+
+    def test_round_trip(self):
+        payload = {"sort": "created_at", "value": datetime(2026, 1, 2, 3, 4, 5), "id": 7}
+        assert decode_cursor(encode_cursor(payload)) == payload
+
+    @pytest.mark.parametrize("token", [
+        "not base64 !",
+        _token([1, 2]),
+        _token({"value": {"$dt": 1}}),
+        _token({"value": {"$dt": "x"}}),
+    ])
+    def test_tampered_cursor_raises_value_error(self, token):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(token)
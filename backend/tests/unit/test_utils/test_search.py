@@ -0,0 +1,51 @@
+"""
+Unit tests for search text helpers
+
+Tests CJK-aware tokenization and highlighting:
+- CJK unigrams + bigrams for indexing, bigrams for queries
+- Latin words lower-cased, punctuation dropped
+- HTML-safe highlighting and snippets
+"""
+
+import pytest
+
+from app.utils.search import tokenize, tokenize_query, build_search_document, highlight
+
+
+@pytest.mark.unit
+class TestTokenize:
+    """Test tokenization."""
+
+    def test_tokenize_cjk_produces_unigrams_and_bigrams(self):
+        assert tokenize("需求管理") == ["需", "求", "管", "理", "需求", "求管", "管理"]
+
+    def test_tokenize_mixed_text(self):
+        assert tokenize("REQ-2026-0001 登录 Login") == [
+            "req", "2026", "0001", "登", "录", "登录", "login",
+        ]
+
+    def test_tokenize_query_uses_bigrams_for_cjk(self):
+        assert tokenize_query("需求管理 需") == ["需求", "求管", "管理", "需"]
+
+    def test_tokenize_query_deduplicates(self):
+        assert tokenize_query("login LOGIN") == ["login"]
+
+    def test_build_search_document_joins_fields(self):
+        assert build_search_document("登录", None, "SSO") == "登 录 登录 sso"
+
+
+@pytest.mark.unit
+class TestHighlight:
+    """Test highlighting."""
+
+    def test_highlight_escapes_html_and_marks_terms(self):
+        assert highlight("<b>需求管理</b>", "需求") == "&lt;b&gt;<mark>需求</mark>管理&lt;/b&gt;"
+
+    def test_highlight_is_case_insensitive(self):
+        assert highlight("Login page", "login") == "<mark>Login</mark> page"
+
+    def test_highlight_snippet_centres_on_first_match(self):
+        text = "x" * 100 + "需求" + "y" * 100
+        result = highlight(text, "需求", max_length=40)
+        assert "<mark>需求</mark>" in result
+        assert result.startswith("…") and result.endswith("…")
@@ -99,7 +99,7 @@ export const ExportModal: React.FC<ExportModalProps> = ({
               >
                 <Select>
                   <Select.Option value="excel">Excel (.xlsx)</Select.Option>
-                  <Select.Option value="pdf">PDF (.pdf)</Select.Option>
+                  <Select.Option value="pdf">文本摘要 (.txt)</Select.Option>
                 </Select>
               </Form.Item>
             </Col>
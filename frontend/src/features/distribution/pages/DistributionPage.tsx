@@ -93,19 +93,29 @@ export function DistributionPage() {
 
     setDistributing(true)
     try {
+      // 下拉框只预览目标ID，分发时才真正预留
+      const reserveResponse = await api.post('/distribution/target-ids', {
+        target_type: targetType,
+        count: 1,
+      })
+      const reserved = reserveResponse?.data?.ids?.[0]
+      if (!reserved) {
+        throw new Error('Target ID reservation failed')
+      }
+
       await Promise.all(
         selectedRowKeys.map((key) => {
           const req = pendingReqs.find((r) => r.key === key)
           if (!req) return Promise.resolve()
           return api.put(`/requirements/${req.id}`, {
             target_type: targetType,
-            target_id: numericTargetId,
+            target_id: reserved.numeric_id,
             status: 'distributed',
           })
         })
       )
 
-      message.success(`成功分发 ${selectedRowKeys.length} 个需求到 ${targetId}`)
+      message.success(`成功分发 ${selectedRowKeys.length} 个需求到 ${reserved.formatted_id}`)
       setSelectedRowKeys([])
       form.resetFields()
       setTargetType('')
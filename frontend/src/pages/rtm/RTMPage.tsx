@@ -45,7 +45,7 @@ export const RTMPage: React.FC = () => {
   const fetchMatrix = async () => {
     setLoading(true)
     try {
-      const response = await rtmService.getTraceabilityMatrix()
+      const response = await rtmService.getTraceabilityMatrix({ include_description: true })
       console.log('RTM API Response:', response)
       console.log('Response type:', typeof response)
       console.log('Is array?', Array.isArray(response))
@@ -136,17 +136,17 @@ export const RTMPage: React.FC = () => {
       const url = window.URL.createObjectURL(new Blob([data], {
         type: format === 'excel'
           ? 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-          : 'application/pdf'
+          : 'text/plain;charset=utf-8'
       }))
       const link = document.createElement('a')
       link.href = url
       // 使用正确的文件扩展名
-      const fileExt = format === 'excel' ? 'xlsx' : 'pdf'
+      const fileExt = format === 'excel' ? 'xlsx' : 'txt'
       link.setAttribute('download', `需求追溯矩阵.${fileExt}`)
       document.body.appendChild(link)
       link.click()
       link.remove()
-      message.success(`已导出 ${format.toUpperCase()} 格式`)
+      message.success(`已导出 ${format === 'excel' ? 'Excel' : '文本'} 格式`)
     } catch (error) {
       console.error('导出错误:', error)
       message.error('导出失败')
@@ -382,7 +382,7 @@ export const RTMPage: React.FC = () => {
               导出 Excel
             </Button>
             <Button icon={<DownloadOutlined />} onClick={() => handleExport('pdf')}>
-              导出 PDF
+              导出文本
             </Button>
           </Space>
         </Space>
@@ -21,6 +21,10 @@ export interface RequirementListParams {
   target_type?: string
   search?: string
   exclude_reviewed?: boolean
+  sort_by?: string
+  sort_order?: 'asc' | 'desc'
+  /** Keyset cursor: pass the previous page's next_cursor instead of page */
+  after?: string
 }
 
 export const requirementService = {
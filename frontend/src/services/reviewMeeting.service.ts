@@ -18,6 +18,7 @@ import type {
   VoteCreateRequest,
   VoteResponse,
   VoteStatisticsResponse,
+  MeetingVoteStatisticsResponse,
   MessageResponse,
 } from '@/types/review-meeting'
 
@@ -254,6 +255,17 @@ const reviewMeetingService = {
     return response
   },
 
+  /**
+   * 获取会议所有需求的投票统计
+   */
+  getMeetingVoteStatistics: async (
+    meetingId: number
+  ): Promise<MeetingVoteStatisticsResponse> => {
+    const response = await api.get(`${BASE_PATH}/${meetingId}/vote-statistics`)
+    // API 拦截器已经返回了 response.data，所以这里直接返回 response
+    return response
+  },
+
   /**
    * 获取当前用户的投票
    */
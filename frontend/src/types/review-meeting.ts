@@ -221,6 +221,11 @@ export interface VoteStatisticsResponse {
   data: VoteStatistics;
 }
 
+export interface MeetingVoteStatisticsResponse {
+  success: boolean;
+  data: VoteStatistics[];
+}
+
 export interface VoterStatusResponse {
   success: boolean;
   data: {